@@ -0,0 +1,97 @@
+"""Benchmark: async output draining throughput of LocalSubprocessExecutor.
+
+Compares the previous sequential strategy (read stdout to EOF, then stderr)
+against the concurrent arrival-ordered merge used by ``execute_async`` on a
+stdout-heavy script, and checks that a stderr-heavy script no longer stalls.
+
+Run from the repository root:
+
+    python benchmarks/bench_async_streaming.py [--lines N] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain import ExecutionResult, ScriptConfig  # noqa: E402
+from src.infrastructure import LocalSubprocessExecutor  # noqa: E402
+
+STDOUT_HEAVY = """
+import sys
+line = "x" * 80 + "\\n"
+sys.stdout.write(line * {lines})
+"""
+
+STDERR_HEAVY = """
+import sys
+sys.stderr.write(("e" * 80 + "\\n") * {lines})
+print("done")
+"""
+
+
+async def sequential_drain(script: Path) -> int:
+    """Drain output the way execute_async did before concurrent merging."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(script),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    count = 0
+    assert process.stdout and process.stderr
+    async for line in process.stdout:
+        line.decode("utf-8").rstrip("\n\r")
+        count += 1
+    async for line in process.stderr:
+        line.decode("utf-8").rstrip("\n\r")
+        count += 1
+    await process.wait()
+    return count
+
+
+async def merged_drain(executor: LocalSubprocessExecutor, script: Path) -> int:
+    """Drain output through execute_async."""
+    count = 0
+    async for item in executor.execute_async(ScriptConfig(script_path=str(script))):
+        if not isinstance(item, ExecutionResult):
+            count += 1
+    return count
+
+
+async def main(lines: int, repeat: int) -> None:
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stdout_script = Path(tmp) / "stdout_heavy.py"
+        stdout_script.write_text(STDOUT_HEAVY.format(lines=lines))
+        stderr_script = Path(tmp) / "stderr_heavy.py"
+        stderr_script.write_text(STDERR_HEAVY.format(lines=lines))
+
+        for name, run in (
+            ("sequential", lambda: sequential_drain(stdout_script)),
+            ("merged", lambda: merged_drain(executor, stdout_script)),
+        ):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                count = await run()
+                best = min(best, time.perf_counter() - start)
+            print(f"{name:>10}: {count} lines in {best:.3f}s ({count / best:,.0f} lines/s)")
+
+        start = time.perf_counter()
+        count = await asyncio.wait_for(merged_drain(executor, stderr_script), timeout=60)
+        elapsed = time.perf_counter() - start
+        print(f"stderr-heavy merged: {count} lines in {elapsed:.3f}s (no stall)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.lines, args.repeat))
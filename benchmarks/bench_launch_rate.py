@@ -0,0 +1,84 @@
+"""Benchmark: launches per second through LocalSubprocessExecutor.
+
+Measures the executor's own launch overhead (pipes, spawn, output
+drain, reap) by default, using ``/bin/true`` as the "interpreter" so
+start-up of a real Python does not dominate. Compares PopenSpawner with
+PosixSpawnSpawner, with and without per-job environment overrides, and
+sequentially as well as through execute_many.
+
+Run from the repository root:
+
+    python benchmarks/bench_launch_rate.py [--jobs N] [--executable /bin/true] [--parallel 8]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain import BatchStats, ScriptConfig  # noqa: E402
+from src.infrastructure import (  # noqa: E402
+    LocalSubprocessExecutor,
+    PopenSpawner,
+    PosixSpawnSpawner,
+)
+
+
+def sequential_rate(executor: LocalSubprocessExecutor, config: ScriptConfig, jobs: int) -> float:
+    """Run ``jobs`` launches back to back and return launches per second."""
+    executor.execute(config)  # warm-up
+    start = time.perf_counter()
+    for _ in range(jobs):
+        result = executor.execute(config)
+        assert result.is_success, result.stderr
+    return jobs / (time.perf_counter() - start)
+
+
+def batch_rate(
+    executor: LocalSubprocessExecutor, config: ScriptConfig, jobs: int, parallel: int
+) -> float:
+    """Run ``jobs`` launches through execute_many and return launches per second."""
+
+    async def run() -> BatchStats:
+        stats = None
+        async for item in executor.execute_many((config for _ in range(jobs)), parallel):
+            if isinstance(item, BatchStats):
+                stats = item
+            else:
+                assert item.is_success, item.stderr
+        assert stats is not None
+        return stats
+
+    return asyncio.run(run()).jobs_per_second
+
+
+def main(jobs: int, executable: str, parallel: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "job.py"
+        script.write_text("pass\n")
+        plain = ScriptConfig(script_path=str(script))
+        overlay = ScriptConfig(script_path=str(script), environment_variables={"JOB_ID": "1"})
+
+        print(f"{jobs} launches of {executable}")
+        for name, spawner in (("popen", PopenSpawner()), ("posix_spawn", PosixSpawnSpawner())):
+            executor = LocalSubprocessExecutor(python_executable=executable, spawner=spawner)
+            for label, config in (("inherit env", plain), ("env overlay", overlay)):
+                rate = sequential_rate(executor, config, jobs)
+                print(f"{name:>12} {label:<12} sequential: {rate:8.1f} launches/s")
+            rate = batch_rate(executor, overlay, jobs, parallel)
+            print(
+                f"{name:>12} {'env overlay':<12} {f'parallel={parallel}':>10}: {rate:8.1f} launches/s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--executable", default="/bin/true")
+    parser.add_argument("--parallel", type=int, default=8)
+    args = parser.parse_args()
+    main(args.jobs, args.executable, args.parallel)
@@ -0,0 +1,77 @@
+"""Benchmark: spawn latency of cold Popen launches vs zygote forks vs pooled workers.
+
+Runs a trivial script that imports ``--modules`` through
+LocalSubprocessExecutor with the default PopenSpawner (fresh interpreter
+per job), a ZygoteSpawner and an InterpreterPoolSpawner that both preload
+the same modules, and reports per-job latency percentiles.
+
+Run from the repository root:
+
+    python benchmarks/bench_spawn_latency.py [--jobs N] [--modules json,decimal]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain import ScriptConfig  # noqa: E402
+from src.infrastructure import (  # noqa: E402
+    InterpreterPoolSpawner,
+    LocalSubprocessExecutor,
+    ZygoteSpawner,
+)
+
+
+def measure(executor: LocalSubprocessExecutor, config: ScriptConfig, jobs: int) -> list[float]:
+    """Run the script ``jobs`` times and return per-job latencies in milliseconds."""
+    executor.execute(config)  # warm-up (starts the zygote server if any)
+    latencies = []
+    for _ in range(jobs):
+        start = time.perf_counter()
+        result = executor.execute(config)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.is_success, result.stderr
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Print latency percentiles and throughput."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:>6}: median {statistics.median(ordered):7.2f} ms  p95 {p95:7.2f} ms  "
+        f"({1000 / statistics.mean(ordered):6.1f} jobs/s)"
+    )
+
+
+def main(jobs: int, modules: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "job.py"
+        script.write_text("".join(f"import {name}\n" for name in modules) + "print('ok')\n")
+        config = ScriptConfig(script_path=str(script))
+
+        cold = LocalSubprocessExecutor(python_executable=sys.executable)
+        report("popen", measure(cold, config, jobs))
+
+        for name, spawner in (
+            ("zygote", ZygoteSpawner(modules)),
+            ("pool", InterpreterPoolSpawner(size=1, preload_modules=modules)),
+        ):
+            executor = LocalSubprocessExecutor(python_executable=sys.executable, spawner=spawner)
+            try:
+                report(name, measure(executor, config, jobs))
+            finally:
+                executor.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--modules", default="json,decimal,email.parser,http.client")
+    args = parser.parse_args()
+    main(args.jobs, [name for name in args.modules.split(",") if name])
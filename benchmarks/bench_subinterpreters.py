@@ -0,0 +1,90 @@
+"""Benchmark: short CPU-bound scripts in subprocesses, threads, subinterpreters and workers.
+
+Runs ``--jobs`` copies of a small CPU-bound script through execute_many
+with ``--parallel`` jobs at a time on LocalSubprocessExecutor (a fresh
+interpreter per job), LambdaExecutor with a thread pool (one shared GIL),
+SubinterpreterExecutor (a GIL per subinterpreter, Python 3.12+) and
+PooledInProcessExecutor (warm in-process worker processes), and reports
+wall time and throughput.
+
+Run from the repository root:
+
+    python benchmarks/bench_subinterpreters.py [--jobs N] [--parallel N] [--loops N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain import BatchStats, ScriptConfig, ScriptExecutor  # noqa: E402
+from src.infrastructure import (  # noqa: E402
+    LambdaExecutor,
+    LocalSubprocessExecutor,
+    PooledInProcessExecutor,
+    SubinterpreterExecutor,
+)
+
+SCRIPT = """\
+total = 0
+for i in range({loops}):
+    total += i * i
+print(total)
+"""
+
+
+async def run_batch(
+    executor: ScriptExecutor, config: ScriptConfig, jobs: int, parallel: int
+) -> float:
+    """Run the batch and return its wall time in seconds."""
+    start = time.perf_counter()
+    async for item in executor.execute_many([config] * jobs, max_parallel=parallel):
+        if not isinstance(item, BatchStats):
+            assert item.is_success, item.stderr
+    return time.perf_counter() - start
+
+
+def report(name: str, jobs: int, seconds: float) -> None:
+    """Print wall time and throughput."""
+    print(f"{name:>14}: {seconds:7.3f} s  ({jobs / seconds:7.1f} jobs/s)")
+
+
+def main(jobs: int, parallel: int, loops: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "job.py"
+        script.write_text(SCRIPT.format(loops=loops))
+        config = ScriptConfig(script_path=str(script))
+
+        print(f"{jobs} jobs, {parallel} at a time, {os.cpu_count()} CPUs")
+        executors: list[tuple[str, ScriptExecutor]] = [
+            ("subprocess", LocalSubprocessExecutor(python_executable=sys.executable)),
+            ("threads", LambdaExecutor(max_workers=parallel)),
+        ]
+        try:
+            executors.append(("subinterpreters", SubinterpreterExecutor(max_workers=parallel)))
+        except RuntimeError as e:
+            print(f"subinterpreters: skipped ({e})")
+        executors.append(("worker pool", PooledInProcessExecutor(size=parallel)))
+
+        for name, executor in executors:
+            try:
+                asyncio.run(run_batch(executor, config, parallel, parallel))  # warm-up
+                report(name, jobs, asyncio.run(run_batch(executor, config, jobs, parallel)))
+            finally:
+                close = getattr(executor, "close", None)
+                if close:
+                    close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=64)
+    parser.add_argument("--parallel", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--loops", type=int, default=200_000)
+    args = parser.parse_args()
+    main(args.jobs, args.parallel, args.loops)
@@ -0,0 +1,96 @@
+"""Benchmark: warm LambdaExecutor invoke latency with and without state reset.
+
+Runs a script that imports ``--modules``, a helper module next to it,
+sets an environment variable and edits ``sys.path``, through a warm
+LambdaExecutor that either keeps everything the scripts leave behind or
+resets the interpreter after each run (preloading the same modules so
+they stay warm). Reports per-invoke latency percentiles and what leaked
+into the process afterwards.
+
+Run from the repository root:
+
+    python benchmarks/bench_warm_invoke.py [--jobs N] [--modules json,decimal]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain import ScriptConfig  # noqa: E402
+from src.infrastructure import LambdaExecutor  # noqa: E402
+
+SCRIPT = """\
+import os, sys
+sys.path.append({helper_dir!r})
+import bench_helper
+os.environ["BENCH_WARM_INVOKE"] = str(bench_helper.VALUE)
+print("ok")
+"""
+
+
+def measure(executor: LambdaExecutor, config: ScriptConfig, jobs: int) -> list[float]:
+    """Run the script ``jobs`` times and return per-invoke latencies in milliseconds."""
+    executor.execute(config)  # warm-up (compiles the script, imports shared modules)
+    latencies = []
+    for _ in range(jobs):
+        start = time.perf_counter()
+        result = executor.execute(config)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.is_success, result.stderr
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    """Print latency percentiles, throughput and leaked state."""
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    leaked = [
+        what
+        for what, present in (
+            ("env", "BENCH_WARM_INVOKE" in os.environ),
+            ("modules", "bench_helper" in sys.modules or "script" in sys.modules),
+            ("sys.path", any(entry.endswith("bench-helpers") for entry in sys.path)),
+        )
+        if present
+    ]
+    print(
+        f"{name:>6}: median {statistics.median(ordered):7.3f} ms  p95 {p95:7.3f} ms  "
+        f"({1000 / statistics.mean(ordered):7.1f} jobs/s)  leaked: {', '.join(leaked) or 'nothing'}"
+    )
+
+
+def main(jobs: int, modules: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        helper_dir = Path(tmp) / "bench-helpers"
+        helper_dir.mkdir()
+        (helper_dir / "bench_helper.py").write_text("VALUE = 42\n")
+        script = Path(tmp) / "job.py"
+        script.write_text(
+            "".join(f"import {name}\n" for name in modules)
+            + SCRIPT.format(helper_dir=str(helper_dir))
+        )
+        config = ScriptConfig(script_path=str(script))
+
+        # Reset first: the other executor leaves its state behind for good
+        for name, executor in (
+            ("reset", LambdaExecutor(preload_modules=modules, reset_state=True)),
+            ("keep", LambdaExecutor()),
+        ):
+            try:
+                report(name, measure(executor, config, jobs))
+            finally:
+                executor.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--modules", default="json,decimal,email.parser,http.client")
+    args = parser.parse_args()
+    main(args.jobs, [name for name in args.modules.split(",") if name])
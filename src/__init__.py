@@ -10,11 +10,16 @@ from .domain import (
     FileProvider,
     LogSink,
     LogLevel,
+    LogRecord,
     ExecutionResult,
     ExecutionStatus,
+    BatchStats,
     FileRequirement,
     FileOutput,
     ScriptConfig,
+    ResourceLimits,
+    ResourceUsage,
+    CapturedOutput,
     DomainException,
     ScriptExecutionException,
     InvalidScriptException,
@@ -22,7 +27,19 @@ from .domain import (
 from .infrastructure import (
     LocalSubprocessExecutor,
     LambdaExecutor,
+    HandlerContext,
+    SubinterpreterExecutor,
+    PooledInProcessExecutor,
     WorkerExecutor,
+    ProcessSpawner,
+    PopenSpawner,
+    PosixSpawnSpawner,
+    ZygoteSpawner,
+    InterpreterPoolSpawner,
+    BytecodeCache,
+    CodeObjectCache,
+    InterpreterSnapshot,
+    CpuAllocator,
     LocalFileProvider,
     S3FileProvider,
     HTTPFileProvider,
@@ -30,6 +47,7 @@ from .infrastructure import (
     StdoutLogSink,
     SSELogSink,
     CompositeLogSink,
+    BatchingLogSink,
 )
 
 __version__ = "0.1.0"
@@ -42,18 +60,36 @@ __all__ = [
     "FileProvider",
     "LogSink",
     "LogLevel",
+    "LogRecord",
     "ExecutionResult",
     "ExecutionStatus",
+    "BatchStats",
     "FileRequirement",
     "FileOutput",
     "ScriptConfig",
+    "ResourceLimits",
+    "ResourceUsage",
+    "CapturedOutput",
     "DomainException",
     "ScriptExecutionException",
     "InvalidScriptException",
     # Infrastructure - Executors
     "LocalSubprocessExecutor",
     "LambdaExecutor",
+    "HandlerContext",
+    "SubinterpreterExecutor",
+    "PooledInProcessExecutor",
     "WorkerExecutor",
+    # Infrastructure - Process Spawners
+    "ProcessSpawner",
+    "PopenSpawner",
+    "PosixSpawnSpawner",
+    "ZygoteSpawner",
+    "InterpreterPoolSpawner",
+    "BytecodeCache",
+    "CodeObjectCache",
+    "InterpreterSnapshot",
+    "CpuAllocator",
     # Infrastructure - File Providers
     "LocalFileProvider",
     "S3FileProvider",
@@ -63,5 +99,6 @@ __all__ = [
     "StdoutLogSink",
     "SSELogSink",
     "CompositeLogSink",
+    "BatchingLogSink",
 ]
 
@@ -1,6 +1,7 @@
 """Run script use case - Orchestrates script execution."""
 
 import time
+from dataclasses import replace
 from typing import AsyncIterator
 
 from ..domain import (
@@ -51,14 +52,7 @@ class RunScriptUseCase:
 
             # Create result with actual duration if not set
             if result.duration_seconds == 0.0:
-                result = ExecutionResult(
-                    status=result.status,
-                    exit_code=result.exit_code,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
-                    duration_seconds=duration,
-                    metadata=result.metadata,
-                )
+                result = replace(result, duration_seconds=duration)
 
             self._emit_log(
                 "INFO",
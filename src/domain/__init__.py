@@ -5,8 +5,18 @@ This layer contains no dependencies on infrastructure, frameworks, or external l
 
 from .executor import ScriptExecutor
 from .file_provider import FileProvider
-from .logging import LogSink, LogLevel
-from .models import ExecutionResult, ExecutionStatus, FileRequirement, FileOutput, ScriptConfig
+from .logging import LogSink, LogLevel, LogRecord
+from .models import (
+    BatchStats,
+    ExecutionResult,
+    ExecutionStatus,
+    FileRequirement,
+    FileOutput,
+    ResourceLimits,
+    ResourceUsage,
+    ScriptConfig,
+)
+from .output import CapturedOutput
 from .exceptions import (
     DomainException,
     ScriptExecutionException,
@@ -18,11 +28,16 @@ __all__ = [
     "FileProvider",
     "LogSink",
     "LogLevel",
+    "LogRecord",
     "ExecutionResult",
     "ExecutionStatus",
+    "BatchStats",
     "FileRequirement",
     "FileOutput",
     "ScriptConfig",
+    "ResourceLimits",
+    "ResourceUsage",
+    "CapturedOutput",
     "DomainException",
     "ScriptExecutionException",
     "InvalidScriptException",
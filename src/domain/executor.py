@@ -1,10 +1,13 @@
 """Domain executor interfaces."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from typing import AsyncIterable, AsyncIterator, Iterable
 
+from .exceptions import ScriptExecutionException
 from .logging import LogSink, LogLevel
-from .models import ExecutionResult, ScriptConfig
+from .models import BatchStats, ExecutionResult, ExecutionStatus, ScriptConfig
 
 
 class ScriptExecutor(ABC):
@@ -35,13 +38,16 @@ class ScriptExecutor(ABC):
         pass
 
     @abstractmethod
-    async def execute_async(
+    def execute_async(
         self,
         config: ScriptConfig,
         log_sink: LogSink | None = None,
     ) -> AsyncIterator[ExecutionResult | str]:
         """Execute a Python script asynchronously, yielding logs and final result.
 
+        Implementations are async generators (``async def`` with ``yield``),
+        so calling this returns the iterator directly, without awaiting.
+
         Args:
             config: Script execution configuration
             log_sink: Optional log sink for streaming logs
@@ -54,3 +60,129 @@ class ScriptExecutor(ABC):
         """
         pass
 
+    async def execute_many(
+        self,
+        configs: Iterable[ScriptConfig] | AsyncIterable[ScriptConfig],
+        max_parallel: int = 8,
+        log_sink: LogSink | None = None,
+    ) -> AsyncIterator[ExecutionResult | BatchStats]:
+        """Execute many scripts with bounded parallelism, yielding results as they complete.
+
+        Configs are pulled from ``configs`` only when a slot is free, so the
+        input can be a lazy (sync or async) iterator of any length. Results
+        arrive in completion order; use ``config.metadata`` (copied to
+        ``result.metadata``) to correlate them. A job whose executor raises
+        yields a FAILED result with the error in ``stderr`` instead of
+        aborting the batch. Stopping iteration early cancels running jobs.
+
+        Args:
+            configs: Script configurations to run
+            max_parallel: Maximum number of jobs running at once
+            log_sink: Optional log sink shared by all jobs
+
+        Yields:
+            One ExecutionResult per config, then a final BatchStats
+        """
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        if isinstance(configs, AsyncIterable):
+            source = aiter(configs)
+        else:
+            source = _to_async_iterator(configs)
+
+        started = time.monotonic()
+        submitted = errors = 0
+        job_seconds = 0.0
+        counts = {status: 0 for status in ExecutionStatus}
+        running: set[asyncio.Task[tuple[ExecutionResult, bool]]] = set()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(running) < max_parallel:
+                    try:
+                        config = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    running.add(asyncio.create_task(self._execute_batch_job(config, log_sink)))
+                    submitted += 1
+
+                if not running:
+                    break
+
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result, raised = task.result()
+                    errors += raised
+                    counts[result.status] += 1
+                    job_seconds += result.duration_seconds
+                    yield result
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        yield BatchStats(
+            submitted=submitted,
+            succeeded=counts[ExecutionStatus.SUCCESS],
+            failed=counts[ExecutionStatus.FAILED] + counts[ExecutionStatus.CANCELLED],
+            timed_out=counts[ExecutionStatus.TIMEOUT],
+            errors=errors,
+            max_parallel=max_parallel,
+            wall_seconds=time.monotonic() - started,
+            job_seconds=job_seconds,
+        )
+
+    async def _execute_batch_job(
+        self, config: ScriptConfig, log_sink: LogSink | None
+    ) -> tuple[ExecutionResult, bool]:
+        """Run one job of an execute_many batch.
+
+        Executor errors are turned into FAILED results (with no exit code)
+        so one bad job cannot abort the batch.
+
+        Returns:
+            Tuple of (result, whether the executor raised)
+        """
+        start_time = time.time()
+        try:
+            return await self._run_batch_job(config, log_sink), False
+        except Exception as e:
+            if log_sink:
+                log_sink.emit(LogLevel.ERROR, f"Batch job failed: {config.script_path}: {e}")
+            return (
+                ExecutionResult(
+                    status=ExecutionStatus.FAILED,
+                    exit_code=None,
+                    stdout="",
+                    stderr=str(e),
+                    duration_seconds=time.time() - start_time,
+                    metadata=config.metadata,
+                ),
+                True,
+            )
+
+    async def _run_batch_job(
+        self, config: ScriptConfig, log_sink: LogSink | None
+    ) -> ExecutionResult:
+        """Run one job and return its result.
+
+        The default drains execute_async; executors override this with a
+        cheaper path where one exists (e.g. one that skips per-line yields).
+        """
+        result = None
+        async for item in self.execute_async(config, log_sink):
+            if isinstance(item, ExecutionResult):
+                result = item
+        if result is None:
+            raise ScriptExecutionException(f"No result produced for {config.script_path}")
+        return result
+
+
+async def _to_async_iterator(items: Iterable[ScriptConfig]) -> AsyncIterator[ScriptConfig]:
+    """Adapt a (possibly lazy) iterable to an async iterator."""
+    for item in items:
+        yield item
@@ -1,8 +1,9 @@
 """Domain logging interfaces."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Sequence
 
 
 class LogLevel(str, Enum):
@@ -15,6 +16,15 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+@dataclass(slots=True)  # Not frozen: frozen dataclasses are slow to create per output line
+class LogRecord:
+    """A single log message, as passed to LogSink.emit_batch."""
+
+    level: LogLevel
+    message: str
+    metadata: dict[str, str] | None = None
+
+
 class LogSink(ABC):
     """Abstract interface for log sinks.
 
@@ -33,6 +43,19 @@ class LogSink(ABC):
         """
         pass
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Emit several log messages in order.
+
+        The default implementation calls emit for each record; sinks with a
+        per-message delivery cost should override it to deliver the batch
+        at once.
+
+        Args:
+            records: Log records to emit
+        """
+        for record in records:
+            self.emit(record.level, record.message, record.metadata)
+
     @abstractmethod
     def close(self) -> None:
         """Close the log sink and release resources."""
@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Iterator, TextIO
+
+from .output import CapturedOutput
 
 
 class ExecutionStatus(str, Enum):
@@ -54,6 +56,40 @@ class FileOutput:
             raise ValueError("destination cannot be empty")
 
 
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Resource limits for one script run.
+
+    The ``max_*`` limits are per-process rlimits on the script (and
+    inherited by anything it starts); the ``cgroup_*`` limits cover the
+    whole job and need a cgroup v2 hierarchy the executor may manage.
+    """
+
+    max_memory_bytes: int | None = None  # Address space per process (RLIMIT_AS)
+    max_cpu_seconds: int | None = None  # CPU time per process (RLIMIT_CPU)
+    max_open_files: int | None = None  # Open file descriptors per process (RLIMIT_NOFILE)
+    cgroup_memory_bytes: int | None = None  # Memory for the whole job (memory.max)
+    cgroup_cpus: float | None = None  # CPU bandwidth for the whole job, in CPUs (cpu.max)
+
+    def __post_init__(self) -> None:
+        """Validate limits."""
+        for name in (
+            "max_memory_bytes",
+            "max_cpu_seconds",
+            "max_open_files",
+            "cgroup_memory_bytes",
+            "cgroup_cpus",
+        ):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+    @property
+    def uses_cgroup(self) -> bool:
+        """Whether any limit needs a cgroup."""
+        return self.cgroup_memory_bytes is not None or self.cgroup_cpus is not None
+
+
 @dataclass(frozen=True)
 class ScriptConfig:
     """Configuration for script execution."""
@@ -65,6 +101,7 @@ class ScriptConfig:
     file_requirements: list[FileRequirement] | None = None
     file_outputs: list[FileOutput] | None = None
     metadata: dict[str, Any] | None = None
+    resource_limits: ResourceLimits | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -72,6 +109,24 @@ class ScriptConfig:
             raise ValueError("script_path cannot be empty")
 
 
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Resources consumed by a script run (as reported by getrusage/wait4)."""
+
+    user_cpu_seconds: float
+    system_cpu_seconds: float
+    max_rss_bytes: int  # Peak resident set size
+    major_page_faults: int  # Faults that required I/O
+    minor_page_faults: int  # Faults served without I/O
+    voluntary_context_switches: int  # Typically waiting on I/O or locks
+    involuntary_context_switches: int  # Preempted by the scheduler
+
+    @property
+    def cpu_seconds(self) -> float:
+        """Total CPU time (user + system)."""
+        return self.user_cpu_seconds + self.system_cpu_seconds
+
+
 @dataclass(frozen=True)
 class ExecutionResult:
     """Result of script execution."""
@@ -82,9 +137,97 @@ class ExecutionResult:
     stderr: str
     duration_seconds: float
     metadata: dict[str, Any] | None = None
+    stdout_capture: CapturedOutput | None = None  # Full stdout when stdout is truncated
+    stderr_capture: CapturedOutput | None = None  # Full stderr when stderr is truncated
+    resource_usage: ResourceUsage | None = None
 
     @property
     def is_success(self) -> bool:
         """Check if execution was successful."""
         return self.status == ExecutionStatus.SUCCESS
 
+    def iter_lines(self, stream: str = "stdout") -> Iterator[str]:
+        """Iterate over every captured line of a stream, including spilled ones.
+
+        Args:
+            stream: "stdout" or "stderr"
+
+        Returns:
+            Iterator of lines without line terminators
+        """
+        capture = self._capture(stream)
+        if capture is not None:
+            return capture.iter_lines()
+        return iter(self._text(stream).splitlines())
+
+    def tail(self, lines: int = 100, stream: str = "stdout") -> list[str]:
+        """Return the last lines of a stream.
+
+        Args:
+            lines: Maximum number of lines to return
+            stream: "stdout" or "stderr"
+
+        Returns:
+            Up to ``lines`` most recent lines
+        """
+        capture = self._capture(stream)
+        if capture is not None:
+            return capture.tail(lines)
+        return self._text(stream).splitlines()[-lines:] if lines > 0 else []
+
+    def open_spill(self, stream: str = "stdout") -> TextIO | None:
+        """Open the part of a stream that was spilled to disk.
+
+        Args:
+            stream: "stdout" or "stderr"
+
+        Returns:
+            Text file with the spilled lines, or None if nothing was spilled
+        """
+        capture = self._capture(stream)
+        return capture.open_spill() if capture is not None else None
+
+    def _capture(self, stream: str) -> CapturedOutput | None:
+        """Return the capture object for a stream name."""
+        if stream not in ("stdout", "stderr"):
+            raise ValueError(f"Unknown stream: {stream}")
+        return self.stdout_capture if stream == "stdout" else self.stderr_capture
+
+    def _text(self, stream: str) -> str:
+        """Return the string field for a stream name."""
+        return self.stdout if stream == "stdout" else self.stderr
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Aggregate statistics for a batch run (ScriptExecutor.execute_many)."""
+
+    submitted: int  # Configs taken from the input
+    succeeded: int
+    failed: int  # Includes jobs whose executor raised
+    timed_out: int
+    errors: int  # Jobs whose executor raised instead of returning a result
+    max_parallel: int
+    wall_seconds: float  # From first submission to last completion
+    job_seconds: float  # Sum of per-job durations
+
+    @property
+    def completed(self) -> int:
+        """Number of jobs that produced a result."""
+        return self.succeeded + self.failed + self.timed_out
+
+    @property
+    def jobs_per_second(self) -> float:
+        """Completed jobs per wall-clock second."""
+        return self.completed / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def mean_job_seconds(self) -> float:
+        """Average job duration."""
+        return self.job_seconds / self.completed if self.completed else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the available parallel slots that were busy (0.0 - 1.0)."""
+        capacity = self.wall_seconds * self.max_parallel
+        return min(1.0, self.job_seconds / capacity) if capacity > 0 else 0.0
@@ -0,0 +1,71 @@
+"""Domain output capture interface."""
+
+from abc import ABC, abstractmethod
+from typing import Iterator, TextIO
+
+
+class CapturedOutput(ABC):
+    """Captured output of one stream (stdout or stderr) of a script run.
+
+    Implementations may keep only part of the output in memory, so callers
+    should prefer the lazy accessors over materializing everything at once.
+    """
+
+    @property
+    @abstractmethod
+    def line_count(self) -> int:
+        """Total number of lines captured."""
+        pass
+
+    @property
+    @abstractmethod
+    def spilled(self) -> bool:
+        """Whether part of the output was moved out of memory."""
+        pass
+
+    @abstractmethod
+    def iter_lines(self) -> Iterator[str]:
+        """Iterate over every captured line in order.
+
+        Returns:
+            Iterator of lines without line terminators
+        """
+        pass
+
+    @abstractmethod
+    def tail(self, lines: int = 100) -> list[str]:
+        """Return the last captured lines.
+
+        Args:
+            lines: Maximum number of lines to return
+
+        Returns:
+            Up to ``lines`` most recent lines
+        """
+        pass
+
+    @abstractmethod
+    def open_spill(self) -> TextIO | None:
+        """Open the spilled part of the output for reading.
+
+        Returns:
+            A text file positioned at the first spilled line, or None if
+            nothing was spilled
+        """
+        pass
+
+    @abstractmethod
+    def text(self) -> str:
+        """Return the in-memory output as a single string.
+
+        When output was spilled, the spilled middle section is replaced by a
+        marker line, so the result stays bounded.
+
+        Returns:
+            Captured text joined with newlines
+        """
+        pass
+
+    def close(self) -> None:
+        """Release storage backing the capture (e.g. delete a spill file)."""
+        pass
@@ -1,8 +1,17 @@
 """Infrastructure layer - Adapters and implementations."""
 
 from .executors.local import LocalSubprocessExecutor
-from .executors.lambda_exec import LambdaExecutor
+from .executors.lambda_exec import HandlerContext, LambdaExecutor
+from .executors.subinterpreter import SubinterpreterExecutor
+from .executors.pooled import PooledInProcessExecutor
 from .executors.worker import WorkerExecutor
+from .executors.spawn import ProcessSpawner, PopenSpawner, PosixSpawnSpawner
+from .executors.zygote import ZygoteSpawner
+from .executors.pool import InterpreterPoolSpawner
+from .executors.bytecode import BytecodeCache
+from .executors.code_cache import CodeObjectCache
+from .executors.snapshot import InterpreterSnapshot
+from .executors.affinity import CpuAllocator
 
 from .file_providers.local import LocalFileProvider
 from .file_providers.s3 import S3FileProvider
@@ -12,12 +21,26 @@ from .file_providers.composite import CompositeFileProvider
 from .logging.stdout import StdoutLogSink
 from .logging.sse import SSELogSink
 from .logging.composite import CompositeLogSink
+from .logging.batching import BatchingLogSink
 
 __all__ = [
     # Executors
     "LocalSubprocessExecutor",
     "LambdaExecutor",
+    "HandlerContext",
+    "SubinterpreterExecutor",
+    "PooledInProcessExecutor",
     "WorkerExecutor",
+    # Process Spawners
+    "ProcessSpawner",
+    "PopenSpawner",
+    "PosixSpawnSpawner",
+    "ZygoteSpawner",
+    "InterpreterPoolSpawner",
+    "BytecodeCache",
+    "CodeObjectCache",
+    "InterpreterSnapshot",
+    "CpuAllocator",
     # File Providers
     "LocalFileProvider",
     "S3FileProvider",
@@ -27,5 +50,6 @@ __all__ = [
     "StdoutLogSink",
     "SSELogSink",
     "CompositeLogSink",
+    "BatchingLogSink",
 ]
 
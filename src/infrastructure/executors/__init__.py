@@ -1,8 +1,32 @@
 """Script executor implementations."""
 
 from .local import LocalSubprocessExecutor
-from .lambda_exec import LambdaExecutor
+from .lambda_exec import HandlerContext, LambdaExecutor
+from .subinterpreter import SubinterpreterExecutor
+from .pooled import PooledInProcessExecutor
 from .worker import WorkerExecutor
+from .spawn import ProcessSpawner, PopenSpawner, PosixSpawnSpawner
+from .zygote import ZygoteSpawner
+from .pool import InterpreterPoolSpawner
+from .bytecode import BytecodeCache
+from .code_cache import CodeObjectCache
+from .snapshot import InterpreterSnapshot
+from .affinity import CpuAllocator
 
-__all__ = ["LocalSubprocessExecutor", "LambdaExecutor", "WorkerExecutor"]
-
+__all__ = [
+    "LocalSubprocessExecutor",
+    "LambdaExecutor",
+    "HandlerContext",
+    "SubinterpreterExecutor",
+    "PooledInProcessExecutor",
+    "WorkerExecutor",
+    "ProcessSpawner",
+    "PopenSpawner",
+    "PosixSpawnSpawner",
+    "ZygoteSpawner",
+    "InterpreterPoolSpawner",
+    "BytecodeCache",
+    "CodeObjectCache",
+    "InterpreterSnapshot",
+    "CpuAllocator",
+]
@@ -0,0 +1,124 @@
+"""CPU core allocation for pinning parallel jobs."""
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+_NODE_ROOT = Path("/sys/devices/system/node")
+
+
+@dataclass(frozen=True)
+class CpuAssignment:
+    """CPUs assigned to one job."""
+
+    cpus: tuple[int, ...]
+    numa_node: int | None  # None if the CPUs span nodes or topology is unknown
+
+    def as_metadata(self) -> dict[str, object]:
+        """Return the assignment as ExecutionResult metadata entries."""
+        return {"cpu_affinity": list(self.cpus), "numa_node": self.numa_node}
+
+
+class CpuAllocator:
+    """Hands out disjoint CPU sets to concurrently running jobs.
+
+    Each job gets ``width`` CPUs from a single NUMA node where possible
+    (so its memory stays local), choosing the node with the most free
+    CPUs to spread load across nodes. When no CPUs are free the job runs
+    unpinned rather than waiting, so callers are never blocked; it then
+    competes for CPUs like any other process. Topology is read from
+    ``/sys/devices/system/node``; without it all CPUs form one node.
+    Allocators are thread-safe and can be shared between executors.
+    """
+
+    def __init__(self, width: int = 1, cpus: set[int] | None = None) -> None:
+        """Initialize the allocator.
+
+        Args:
+            width: Number of CPUs per job
+            cpus: CPUs to allocate from (default: the CPUs this process may run on)
+
+        Raises:
+            ValueError: If width is not between 1 and the number of CPUs
+        """
+        available = set(cpus) if cpus is not None else os.sched_getaffinity(0)
+        if not 1 <= width <= len(available):
+            raise ValueError(f"width must be between 1 and {len(available)}")
+        self._width = width
+        self._lock = threading.Lock()
+        self._free = _numa_nodes(available)
+        self._node_of = {cpu: node for node, cpus in self._free.items() for cpu in cpus}
+
+    @property
+    def width(self) -> int:
+        """Number of CPUs per job."""
+        return self._width
+
+    def acquire(self) -> CpuAssignment | None:
+        """Reserve CPUs for a job.
+
+        Returns:
+            The assignment, or None if fewer than ``width`` CPUs are free
+        """
+        with self._lock:
+            candidates = [node for node, free in self._free.items() if len(free) >= self._width]
+            if candidates:
+                node = max(candidates, key=lambda n: len(self._free[n]))
+                cpus = sorted(self._free[node])[: self._width]
+                self._free[node].difference_update(cpus)
+                return CpuAssignment(tuple(cpus), node)
+
+            # No single node has room: span nodes if enough CPUs are free overall
+            if sum(len(free) for free in self._free.values()) < self._width:
+                return None
+            cpus = []
+            for free in sorted(self._free.values(), key=len, reverse=True):
+                taken = sorted(free)[: self._width - len(cpus)]
+                free.difference_update(taken)
+                cpus.extend(taken)
+                if len(cpus) == self._width:
+                    break
+            return CpuAssignment(tuple(sorted(cpus)), None)
+
+    def release(self, assignment: CpuAssignment) -> None:
+        """Return a job's CPUs to the pool.
+
+        Args:
+            assignment: Assignment returned by acquire
+        """
+        with self._lock:
+            for cpu in assignment.cpus:
+                self._free[self._node_of[cpu]].add(cpu)
+
+
+def _numa_nodes(cpus: set[int]) -> dict[int | None, set[int]]:
+    """Group CPUs by NUMA node, using /sys topology when available."""
+    nodes: dict[int | None, set[int]] = {}
+    try:
+        entries = sorted(_NODE_ROOT.glob("node[0-9]*"))
+    except OSError:
+        entries = []
+    for entry in entries:
+        try:
+            node_cpus = _parse_cpulist((entry / "cpulist").read_text()) & cpus
+        except (OSError, ValueError):
+            continue
+        if node_cpus:
+            nodes[int(entry.name[4:])] = node_cpus
+
+    unassigned = cpus - set().union(*nodes.values())
+    if unassigned:
+        nodes[None] = unassigned
+    return nodes
+
+
+def _parse_cpulist(text: str) -> set[int]:
+    """Parse a kernel CPU list such as ``0-3,8-11``."""
+    cpus: set[int] = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
@@ -0,0 +1,108 @@
+"""Content-addressed bytecode cache shared across script runs."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType
+
+from .bytecode_main import load_code
+
+# Launcher that runs a script from its cache file (see bytecode_main.py)
+BYTECODE_MAIN = str(Path(__file__).with_name("bytecode_main.py"))
+
+
+class BytecodeCache:
+    """Directory of compiled scripts keyed by source content.
+
+    Python never writes bytecode for the top-level script it runs, and
+    scripts staged into fresh working directories lose any ``__pycache__``
+    on cleanup, so large generated scripts are recompiled on every run.
+    Entries here are keyed by a hash of the script's source and the
+    interpreter that runs it, so any job running identical source - from
+    any directory - loads the code object instead of compiling it.
+
+    Entries are written by whichever process compiles the script first,
+    and only if the source it compiled is the one the entry was looked up
+    for (the script may change in between); concurrent writers are safe. The cache never evicts: point it at a
+    directory that is cleaned up externally if scripts churn.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory, created if missing
+                (default: ``jobflow-bytecode`` in the system temp dir)
+        """
+        self._directory = Path(directory or Path(tempfile.gettempdir()) / "jobflow-bytecode")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cache files."""
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        """Number of runs that found their script already compiled."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of runs that had to compile their script."""
+        return self._misses
+
+    def entry_for(self, script_path: str, python_executable: str) -> str | None:
+        """Return the cache file for a script run by a given interpreter, counting a hit or miss.
+
+        Args:
+            script_path: Path to the script source
+            python_executable: Interpreter that will run the script
+
+        Returns:
+            Path of the cache file (which may not exist yet), or None if
+            the script cannot be read
+        """
+        try:
+            with open(script_path, "rb") as source_file:
+                source_digest = hashlib.sha256(source_file.read()).hexdigest()
+        except OSError:
+            return None
+
+        interpreter = hashlib.sha256(os.path.realpath(python_executable).encode()).hexdigest()
+        # The name starts with the source hash, which load_code checks before writing
+        entry = self._directory / f"{source_digest}-{interpreter[:16]}.bin"
+        self._count(entry.exists())
+        return str(entry)
+
+    def load(self, script_path: str) -> CodeType:
+        """Load a script's code object for the current interpreter, compiling it on a miss.
+
+        Args:
+            script_path: Path to the script source
+
+        Returns:
+            The script's code object
+
+        Raises:
+            OSError: If the script cannot be read
+            SyntaxError: If the script does not compile
+        """
+        entry = self.entry_for(script_path, sys.executable)
+        if entry is None:
+            raise FileNotFoundError(f"Script not found: {script_path}")
+        return load_code(script_path, entry)
+
+    def _count(self, hit: bool) -> None:
+        """Record a hit or a miss."""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
@@ -0,0 +1,133 @@
+"""Run a script from a shared bytecode cache file.
+
+Started as ``python bytecode_main.py <cache-path> <script-path>`` in
+place of ``python <script-path>``. Top-level scripts are never cached
+by the interpreter itself, so this loads the script's code object from
+the cache file (or compiles it and writes the cache file) and runs it
+as ``__main__``. Like script_host.py, this file is run directly and may
+only use the standard library; its imports are kept to a minimum so
+the launch stays as cheap as running the script directly.
+"""
+
+import builtins
+import marshal
+import os
+import sys
+from types import CodeType
+
+# Far cheaper to import than importlib.util, whose start-up cost would eat into the savings
+from importlib._bootstrap_external import MAGIC_NUMBER
+
+
+def load_code(script_path: str, cache_path: str) -> CodeType:
+    """Load a script's code object from the cache, compiling and storing it on a miss.
+
+    Cache files start with the interpreter's bytecode magic number, so a
+    file written by a different Python version is treated as a miss and
+    overwritten. Cache file names start with the SHA-256 of the source
+    they were looked up for; if the script changed since, the code is
+    compiled but not stored. Failing to write the cache is never an error.
+
+    Args:
+        script_path: Path to the script source
+        cache_path: Cache file for this script's content
+
+    Returns:
+        The script's code object
+
+    Raises:
+        OSError: If the script cannot be read
+        SyntaxError: If the script does not compile
+    """
+    try:
+        with open(cache_path, "rb") as cache_file:
+            if cache_file.read(len(MAGIC_NUMBER)) == MAGIC_NUMBER:
+                cached: CodeType = marshal.load(cache_file)
+                # The entry may have been written by a job running the script from another path
+                if cached.co_filename != script_path:
+                    cached = _with_filename(cached, script_path)
+                return cached
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(script_path, "rb") as source_file:
+        source = source_file.read()
+    code = compile(source, script_path, "exec", dont_inherit=True)
+
+    # Only imported on a miss: compiling costs far more anyway
+    import hashlib
+
+    if not os.path.basename(cache_path).startswith(hashlib.sha256(source).hexdigest()):
+        return code
+
+    # Write to a private file and rename, so concurrent jobs never see a partial file
+    temporary = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as cache_file:
+            cache_file.write(MAGIC_NUMBER)
+            marshal.dump(code, cache_file)
+        os.replace(temporary, cache_path)
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+    return code
+
+
+def _with_filename(code: CodeType, filename: str) -> CodeType:
+    """Return a copy of a code object (and the code nested in it) compiled "from" another file."""
+    consts = tuple(
+        _with_filename(const, filename) if isinstance(const, CodeType) else const
+        for const in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def run_main(code: CodeType, script_path: str) -> None:
+    """Run a code object as ``__main__``, like ``python script.py`` would.
+
+    Args:
+        code: Compiled script
+        script_path: Path the code was compiled from
+    """
+    main = type(sys)("__main__")
+    main.__file__ = script_path
+    main.__builtins__ = builtins  # type: ignore[attr-defined]
+    saved_main = sys.modules["__main__"]
+    sys.modules["__main__"] = main
+    try:
+        exec(code, main.__dict__)
+    finally:
+        sys.modules["__main__"] = saved_main
+
+
+def _main() -> None:
+    """Entry point: load (or compile) the script and run it."""
+    cache_path, script_path = sys.argv[1], sys.argv[2]
+    sys.argv = [script_path]
+    sys.path[0] = os.path.dirname(os.path.realpath(script_path))
+
+    try:
+        code = load_code(script_path, cache_path)
+    except FileNotFoundError as e:
+        # Same message and exit code as ``python missing.py``
+        sys.stderr.write(
+            f"{sys.executable}: can't open file {script_path!r}: [Errno 2] {e.strerror}\n"
+        )
+        sys.exit(2)
+
+    try:
+        run_main(code, script_path)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        import traceback
+
+        # Hide this file's frame so tracebacks look like ``python script.py``
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)  # type: ignore[union-attr]
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
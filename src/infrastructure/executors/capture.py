@@ -0,0 +1,271 @@
+"""Bounded output capture with spill-to-disk."""
+
+import io
+import os
+import tempfile
+from collections import deque
+from typing import IO, Callable, Iterator, TextIO
+
+from ...domain import CapturedOutput
+from .streaming import LineDecoder
+
+# Encoding settings shared by the writer and readers of a spill file. surrogateescape
+# round-trips lines decoded from undecodable bytes.
+_SPILL_ENCODING = "utf-8"
+_SPILL_ERRORS = "surrogateescape"
+
+# Chunk size for reading output files back
+_READ_SIZE = 64 * 1024
+
+
+class SpillingOutputBuffer(CapturedOutput):
+    """Keeps the head and tail of a stream in memory and spills the middle to disk.
+
+    The first half of the memory budget holds the head of the output; the
+    second half is a rolling window over the most recent lines. Lines that
+    fall out of the window are appended to a temporary file, which is only
+    created once the budget is exceeded. Sizes are measured in characters,
+    which approximates bytes for mostly-ASCII output.
+    """
+
+    def __init__(
+        self, memory_budget_bytes: int = 16 * 1024 * 1024, spill_directory: str | None = None
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            memory_budget_bytes: Approximate memory allowed for head plus tail
+            spill_directory: Directory for the spill file (default: system temp dir)
+        """
+        self._head_budget = memory_budget_bytes // 2
+        self._tail_budget = memory_budget_bytes - self._head_budget
+        self._spill_directory = spill_directory
+
+        self._head: list[str] = []
+        self._head_size = 0
+        self._head_full = False
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self._spill: IO[str] | None = None
+        self._spilled_lines = 0
+        self._line_count = 0
+
+    @property
+    def line_count(self) -> int:
+        """Total number of lines captured."""
+        return self._line_count
+
+    @property
+    def spilled(self) -> bool:
+        """Whether part of the output was moved to the spill file."""
+        return self._spilled_lines > 0
+
+    def append(self, line: str) -> None:
+        """Capture one line.
+
+        Args:
+            line: Line without its terminator
+        """
+        self._line_count += 1
+        size = len(line) + 1
+
+        if not self._head_full:
+            if self._head_size + size <= self._head_budget:
+                self._head.append(line)
+                self._head_size += size
+                return
+            self._head_full = True
+
+        self._tail.append(line)
+        self._tail_size += size
+        while self._tail_size > self._tail_budget and self._tail:
+            evicted = self._tail.popleft()
+            self._tail_size -= len(evicted) + 1
+            self._write_spill(evicted)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Iterate over head, spilled and tail lines in order."""
+        yield from list(self._head)
+        spill = self.open_spill()
+        if spill is not None:
+            with spill:
+                for line in spill:
+                    yield line[:-1] if line.endswith("\n") else line
+        yield from list(self._tail)
+
+    def tail(self, lines: int = 100) -> list[str]:
+        """Return the last captured lines (from memory when possible)."""
+        if lines <= 0:
+            return []
+        if lines <= len(self._tail):
+            return list(self._tail)[-lines:]
+        if not self.spilled:
+            return (self._head + list(self._tail))[-lines:]
+        # The in-memory window is too short - fall back to a full pass
+        return list(deque(self.iter_lines(), maxlen=lines))
+
+    def open_spill(self) -> TextIO | None:
+        """Open the spilled lines (those between head and tail) for reading."""
+        if self._spill is None:
+            return None
+        self._spill.flush()
+        return open(self._spill.name, encoding=_SPILL_ENCODING, errors=_SPILL_ERRORS, newline="\n")
+
+    def text(self) -> str:
+        """Return head and tail joined with newlines, marking any spilled section."""
+        if not self.spilled:
+            return "\n".join(self._head + list(self._tail))
+        marker = f"... [{self._spilled_lines} lines spilled to disk] ..."
+        return "\n".join([*self._head, marker, *self._tail])
+
+    def close(self) -> None:
+        """Delete the spill file."""
+        if self._spill is not None:
+            self._spill.close()
+
+    def __repr__(self) -> str:
+        """Return a short summary instead of the captured content."""
+        return (
+            f"{type(self).__name__}(line_count={self._line_count}, "
+            f"spilled_lines={self._spilled_lines})"
+        )
+
+    def _write_spill(self, line: str) -> None:
+        """Append a line to the spill file, creating it on first use."""
+        if self._spill is None:
+            self._spill = tempfile.NamedTemporaryFile(
+                mode="w+",
+                encoding=_SPILL_ENCODING,
+                errors=_SPILL_ERRORS,
+                newline="\n",
+                prefix="jobflow-output-",
+                suffix=".log",
+                dir=self._spill_directory,
+            )
+        self._spill.write(line + "\n")
+        self._spilled_lines += 1
+
+
+class FileOutputCapture(CapturedOutput):
+    """Output a script wrote straight to a file, read back on demand.
+
+    The script's stdout or stderr descriptor is the file itself, so the
+    output never passes through the executor while the script runs. The
+    file is kept after the run; ``text()`` only holds its last
+    ``tail_bytes`` bytes, and every other accessor reads the file lazily.
+    The whole file counts as spilled.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        decoder_factory: Callable[[], LineDecoder] = LineDecoder,
+        tail_bytes: int = 64 * 1024,
+    ) -> None:
+        """Initialize the capture.
+
+        Args:
+            path: File holding the output
+            decoder_factory: Creates the decoder that splits the file into lines
+            tail_bytes: Bytes from the end of the file returned by text()
+        """
+        self._path = path
+        self._decoder_factory = decoder_factory
+        self._tail_bytes = tail_bytes
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        decoder_factory: Callable[[], LineDecoder] = LineDecoder,
+        tail_bytes: int = 64 * 1024,
+    ) -> tuple["FileOutputCapture", int]:
+        """Create the output file and a capture for it.
+
+        Args:
+            path: File to create (must not exist)
+            decoder_factory: Creates the decoder that splits the file into lines
+            tail_bytes: Bytes from the end of the file returned by text()
+
+        Returns:
+            Tuple of (capture, write-only descriptor to hand to the script)
+
+        Raises:
+            OSError: If the file exists or cannot be created
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o644)
+        return cls(path, decoder_factory, tail_bytes), fd
+
+    @property
+    def path(self) -> str:
+        """File holding the output."""
+        return self._path
+
+    @property
+    def line_count(self) -> int:
+        """Total number of lines in the file."""
+        count = 0
+        last = b"\n"
+        with open(self._path, "rb") as output:
+            while chunk := output.read(_READ_SIZE):
+                count += chunk.count(b"\n")
+                last = chunk[-1:]
+        return count if last == b"\n" else count + 1
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the script wrote any output."""
+        return os.path.getsize(self._path) > 0
+
+    def iter_lines(self) -> Iterator[str]:
+        """Iterate over every line of the file."""
+        decoder = self._decoder_factory()
+        with open(self._path, "rb") as output:
+            while chunk := output.read(_READ_SIZE):
+                yield from decoder.feed(chunk)
+        yield from decoder.flush()
+
+    def tail(self, lines: int = 100) -> list[str]:
+        """Return the last lines, reading backwards from the end of the file."""
+        if lines <= 0:
+            return []
+        with open(self._path, "rb") as output:
+            position = output.seek(0, io.SEEK_END)
+            data = b""
+            while position > 0 and data.count(b"\n") <= lines:
+                size = min(_READ_SIZE, position)
+                position -= size
+                output.seek(position)
+                data = output.read(size) + data
+        return self._decode(data, partial=position > 0)[-lines:]
+
+    def open_spill(self) -> TextIO | None:
+        """Open the whole file, or return None if it is empty."""
+        if not self.spilled:
+            return None
+        decoder = self._decoder_factory()
+        return open(self._path, encoding=decoder.encoding, errors=decoder.errors)
+
+    def text(self) -> str:
+        """Return the last ``tail_bytes`` of the file, marking any part left out."""
+        with open(self._path, "rb") as output:
+            size = output.seek(0, io.SEEK_END)
+            skipped = max(0, size - self._tail_bytes)
+            output.seek(skipped)
+            lines = self._decode(output.read(), partial=skipped > 0)
+        if skipped:
+            lines.insert(0, f"... [{skipped} earlier bytes in {self._path}] ...")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """Return a short summary instead of the captured content."""
+        return f"{type(self).__name__}(path={self._path!r})"
+
+    def _decode(self, data: bytes, partial: bool) -> list[str]:
+        """Decode a chunk of the file, dropping a leading partial line if it starts mid-file."""
+        if partial:
+            newline = data.find(b"\n")
+            if newline >= 0:
+                data = data[newline + 1 :]
+        decoder = self._decoder_factory()
+        return decoder.feed(data) + decoder.flush()
@@ -0,0 +1,135 @@
+"""In-memory cache of compiled scripts for in-process execution."""
+
+import os
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Callable
+
+
+def compile_script(script_path: str) -> CodeType:
+    """Read and compile a script.
+
+    Args:
+        script_path: Path to the script source
+
+    Returns:
+        The script's code object
+
+    Raises:
+        OSError: If the script cannot be read
+        SyntaxError: If the script does not compile
+    """
+    with open(script_path, "rb") as source_file:
+        return compile(source_file.read(), script_path, "exec", dont_inherit=True)
+
+
+def script_identity(script_path: str) -> tuple[str, int, int]:
+    """Identify a script file's current version.
+
+    Args:
+        script_path: Path to the script source
+
+    Returns:
+        Tuple of (absolute path, modification time in ns, size)
+
+    Raises:
+        OSError: If the script cannot be read
+    """
+    path = os.path.abspath(script_path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+class CodeObjectCache:
+    """LRU cache of compiled scripts keyed by path, modification time and size.
+
+    A warm process that runs the same scripts over and over only pays for
+    one ``stat`` per run instead of reading and compiling the source. An
+    entry is replaced as soon as its file's mtime or size changes. Safe to
+    share between threads and executors.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of scripts kept; the least recently used is
+                evicted beyond that (0 disables caching)
+
+        Raises:
+            ValueError: If max_entries is negative
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries cannot be negative")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, int, CodeType]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached scripts."""
+        return self._max_entries
+
+    @property
+    def size(self) -> int:
+        """Number of cached scripts."""
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """Number of loads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of loads that had to compile the script."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries dropped to stay within max_entries."""
+        return self._evictions
+
+    def load(
+        self, script_path: str, loader: Callable[[str], CodeType] = compile_script
+    ) -> CodeType:
+        """Return a script's code object, compiling it on a miss.
+
+        Args:
+            script_path: Path to the script source
+            loader: Compiles the script on a miss (e.g. BytecodeCache.load)
+
+        Returns:
+            The script's code object
+
+        Raises:
+            OSError: If the script cannot be read
+            SyntaxError: If the script does not compile
+        """
+        path, mtime_ns, size = script_identity(script_path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (mtime_ns, size):
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return entry[2]
+            self._misses += 1
+
+        code = loader(script_path)
+        if self._max_entries:
+            with self._lock:
+                self._entries[path] = (mtime_ns, size, code)
+                self._entries.move_to_end(path)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return code
+
+    def clear(self) -> None:
+        """Drop all cached scripts."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,384 @@
+"""Per-invocation process state for scripts running in-process.
+
+Several scripts may run in one interpreter at the same time, each on its
+own thread. The process-wide objects they use are replaced once by
+proxies that route every access to the state of the invocation running
+in the current context (a ContextVar), falling back to the real objects
+outside of invocations:
+
+- ``sys.stdout`` / ``sys.stderr`` write to the invocation's capture streams
+- ``os.environ`` (and ``os.getenv``) read and write the invocation's
+  private copy of the environment, if it has one
+
+The proxies are installed on first use and removed again by
+``uninstall_routing`` once no invocation is running.
+
+Working directories cannot be routed this way; instead, threads that
+run scripts unshare their filesystem attributes from the rest of the
+process (Linux), so ``os.chdir`` only affects the calling thread.
+
+Scripts are stopped at their deadline by raising ScriptTimeout in the
+thread running them (see ``deadline``).
+"""
+
+import contextlib
+import contextvars
+import ctypes
+import io
+import os
+import signal
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, MutableMapping, TextIO
+
+# unshare(2) flag: give the calling thread its own cwd, root and umask
+_CLONE_FS = 0x200
+
+_install_lock = threading.Lock()
+_active_invocations = 0  # Guarded by _install_lock
+_thread_state = threading.local()
+
+
+@dataclass
+class Invocation:
+    """Process state seen by one running script."""
+
+    stdout: TextIO
+    stderr: TextIO
+    environ: dict[str, str] | None = None  # None: use the real os.environ
+
+
+_current: contextvars.ContextVar[Invocation | None] = contextvars.ContextVar(
+    "jobflow_invocation", default=None
+)
+
+
+class RoutedStream(io.TextIOBase):
+    """Stand-in for sys.stdout or sys.stderr that writes to the current invocation's stream."""
+
+    def __init__(self, name: str, fallback: TextIO) -> None:
+        """Initialize the stream.
+
+        Args:
+            name: "stdout" or "stderr" (the Invocation attribute to route to)
+            fallback: Stream used outside of invocations
+        """
+        self._name = name
+        self.fallback = fallback
+
+    def _target(self) -> TextIO:
+        """Return the stream writes currently go to."""
+        invocation = _current.get()
+        if invocation is None:
+            return self.fallback
+        stream: TextIO = getattr(invocation, self._name)
+        return stream
+
+    def write(self, text: str) -> int:
+        """Write to the current invocation's stream."""
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        """Flush the current invocation's stream."""
+        self._target().flush()
+
+    def writable(self) -> bool:
+        """Routed streams are always writable."""
+        return True
+
+    def isatty(self) -> bool:
+        """Whether the current target is a terminal."""
+        return self._target().isatty()
+
+    def fileno(self) -> int:
+        """Descriptor of the fallback stream, outside of invocations.
+
+        Raises:
+            io.UnsupportedOperation: Inside an invocation: captures have no
+                descriptor, and writing to the fallback's would bypass the
+                capture and mix with other invocations' output
+        """
+        if _current.get() is not None:
+            raise io.UnsupportedOperation(f"captured {self._name} has no file descriptor")
+        return self.fallback.fileno()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        """Encoding of the fallback stream."""
+        return getattr(self.fallback, "encoding", None) or "utf-8"
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate anything else (e.g. ``buffer``) to the current target."""
+        return getattr(self._target(), name)
+
+
+class LineStream(io.StringIO):
+    """Capture stream that also hands every completed line to a callback.
+
+    Used to stream a script's output live while it runs on another
+    thread; the callback is called on the script's thread.
+    """
+
+    def __init__(self, on_lines: Callable[[list[str]], None]) -> None:
+        """Initialize the stream.
+
+        Args:
+            on_lines: Receives the lines completed by each write, without terminators
+        """
+        super().__init__()
+        self._on_lines = on_lines
+        self._partial = ""
+
+    def write(self, text: str) -> int:
+        """Capture text and pass on the lines it completes."""
+        written = super().write(text)
+        if "\n" in text:
+            lines = (self._partial + text).split("\n")
+            self._partial = lines.pop()
+            self._on_lines([line.rstrip("\r") for line in lines])
+        else:
+            self._partial += text
+        return written
+
+    def finish(self) -> None:
+        """Pass on a final line that has no terminator."""
+        if self._partial:
+            self._on_lines([self._partial.rstrip("\r")])
+            self._partial = ""
+
+
+class RoutedEnviron(MutableMapping[str, str]):
+    """Stand-in for os.environ that uses the current invocation's environment copy.
+
+    Only Python-level access is routed: child processes started without
+    an explicit ``env`` and C code calling getenv() see the real
+    environment.
+    """
+
+    def __init__(self, real: MutableMapping[str, str]) -> None:
+        """Initialize the mapping.
+
+        Args:
+            real: The real os.environ
+        """
+        self.real = real
+
+    def _target(self) -> MutableMapping[str, str]:
+        """Return the mapping accesses currently go to."""
+        invocation = _current.get()
+        if invocation is None or invocation.environ is None:
+            return self.real
+        return invocation.environ
+
+    def __getitem__(self, key: str) -> str:
+        return self._target()[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._target()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._target()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._target()))
+
+    def __len__(self) -> int:
+        return len(self._target())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._target())!r})"
+
+    def copy(self) -> dict[str, str]:
+        """Return the current environment as a dict (like os.environ.copy)."""
+        return dict(self._target())
+
+
+def install_routing(environ: bool = False) -> None:
+    """Install the routing proxies (idempotent).
+
+    Streams are re-installed if something else replaced sys.stdout or
+    sys.stderr in the meantime, with the replacement as the fallback.
+
+    Args:
+        environ: Whether to route os.environ as well
+    """
+    with _install_lock:
+        if not isinstance(sys.stdout, RoutedStream):
+            sys.stdout = RoutedStream("stdout", sys.stdout)
+        if not isinstance(sys.stderr, RoutedStream):
+            sys.stderr = RoutedStream("stderr", sys.stderr)
+        if environ and not isinstance(os.environ, RoutedEnviron):
+            # os.getenv and friends look the name up in the os module, so they follow
+            os.environ = RoutedEnviron(os.environ)  # type: ignore[assignment]
+
+
+def uninstall_routing() -> bool:
+    """Put the real sys.stdout, sys.stderr and os.environ back.
+
+    Nothing is changed while an invocation is running; routing is
+    installed again by the next one. Streams that something else has
+    replaced since are left alone.
+
+    Returns:
+        True if no routing proxy is installed any more
+    """
+    with _install_lock:
+        if _active_invocations:
+            return False
+        if isinstance(sys.stdout, RoutedStream):
+            sys.stdout = sys.stdout.fallback
+        if isinstance(sys.stderr, RoutedStream):
+            sys.stderr = sys.stderr.fallback
+        if isinstance(os.environ, RoutedEnviron):
+            os.environ = os.environ.real  # type: ignore[assignment]
+        return True
+
+
+@contextlib.contextmanager
+def invocation(
+    stdout: TextIO, stderr: TextIO, environ: dict[str, str] | None = None
+) -> Iterator[Invocation]:
+    """Route the process state of the current context to one invocation.
+
+    Args:
+        stdout: Stream receiving the script's stdout
+        stderr: Stream receiving the script's stderr
+        environ: Private environment of the script (requires
+            ``install_routing(environ=True)``), or None for the real one
+
+    Yields:
+        The active invocation
+    """
+    global _active_invocations
+    with _install_lock:
+        _active_invocations += 1
+    try:
+        install_routing(environ=environ is not None)
+        state = Invocation(stdout, stderr, environ)
+        token = _current.set(state)
+        try:
+            yield state
+        finally:
+            _current.reset(token)
+    finally:
+        with _install_lock:
+            _active_invocations -= 1
+
+
+def real_environ() -> MutableMapping[str, str]:
+    """Return the real process environment, even while os.environ is routed."""
+    environ = os.environ
+    return environ.real if isinstance(environ, RoutedEnviron) else environ
+
+
+def isolate_thread_cwd() -> bool:
+    """Give the calling thread its own working directory (Linux unshare(CLONE_FS)).
+
+    Afterwards ``os.chdir`` in this thread no longer affects other threads.
+
+    Returns:
+        True if the thread is (now) isolated
+    """
+    if getattr(_thread_state, "isolated", False):
+        return True
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        isolated = bool(libc.unshare(_CLONE_FS) == 0)
+    except (OSError, AttributeError):
+        isolated = False
+    _thread_state.isolated = isolated
+    return isolated
+
+
+def thread_cwd_isolated() -> bool:
+    """Whether the calling thread has its own working directory."""
+    return bool(getattr(_thread_state, "isolated", False))
+
+
+class ScriptTimeout(BaseException):
+    """Raised inside a script that ran past its deadline.
+
+    Derives from BaseException, so the script's ``except Exception``
+    handlers do not swallow it.
+    """
+
+
+@contextlib.contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Raise ScriptTimeout in the calling thread if the block runs longer than ``seconds``.
+
+    On the main thread a SIGALRM timer interrupts the block (the previous
+    handler and timer are restored afterwards). Other threads cannot
+    receive signals, so the exception is injected into them instead
+    (PyThreadState_SetAsyncExc). Either way it only takes effect between
+    Python bytecodes: code blocked inside a C call is stopped once the
+    call returns (on the main thread, blocking system calls are
+    interrupted by the signal).
+
+    Args:
+        seconds: Time limit, or None for no limit
+    """
+    if not seconds:
+        yield
+    elif threading.current_thread() is threading.main_thread() and hasattr(signal, "setitimer"):
+        with _alarm(seconds):
+            yield
+    else:
+        with _async_timeout(seconds):
+            yield
+
+
+@contextlib.contextmanager
+def _alarm(seconds: float) -> Iterator[None]:
+    """Interrupt the main thread with ScriptTimeout after ``seconds`` (SIGALRM)."""
+
+    def expire(signum: int, frame: Any) -> None:
+        raise ScriptTimeout
+
+    previous_handler = signal.signal(signal.SIGALRM, expire)
+    previous_delay, previous_interval = signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        elapsed = seconds - signal.setitimer(signal.ITIMER_REAL, 0)[0]
+        signal.signal(signal.SIGALRM, previous_handler)
+        if previous_delay:
+            # Resume the timer we displaced (fire it right away if it has expired since)
+            signal.setitimer(
+                signal.ITIMER_REAL, max(previous_delay - elapsed, 1e-6), previous_interval
+            )
+
+
+@contextlib.contextmanager
+def _async_timeout(seconds: float) -> Iterator[None]:
+    """Inject ScriptTimeout into the calling thread after ``seconds``."""
+    thread_id = threading.get_ident()
+    lock = threading.Lock()
+    state = {"armed": True, "fired": False}
+
+    def expire() -> None:
+        with lock:
+            if state["armed"]:
+                _set_async_exc(thread_id, ScriptTimeout)
+                state["fired"] = True
+
+    timer = threading.Timer(seconds, expire)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        with lock:
+            state["armed"] = False
+            if state["fired"]:
+                # Fired as the block finished: drop the exception if it is still pending
+                _set_async_exc(thread_id, None)
+
+
+def _set_async_exc(thread_id: int, exception: type[BaseException] | None) -> None:
+    """Schedule an exception in another thread (None clears a pending one)."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(exception) if exception else None
+    )
@@ -1,43 +1,195 @@
 """Lambda-style in-process executor implementation."""
 
-import importlib.util
+import asyncio
+import contextlib
+import functools
+import importlib
+import os
+import pickle
+import selectors
+import signal
+import threading
 import sys
 import time
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from io import StringIO
-from typing import AsyncIterator
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
 
 from pathlib import Path
 
 from ...domain import (
+    BatchStats,
     ScriptExecutor,
     ScriptConfig,
     ExecutionResult,
     ExecutionStatus,
     LogSink,
     LogLevel,
+    LogRecord,
     ScriptExecutionException,
     FileProvider,
 )
+from .bytecode import BytecodeCache
+from .code_cache import CodeObjectCache, compile_script, script_identity
+from .snapshot import InterpreterSnapshot
+from .streaming import STDERR, STDOUT, OutputLine, OutputPump
+from .inprocess import (
+    LineStream,
+    ScriptTimeout,
+    deadline,
+    invocation,
+    isolate_thread_cwd,
+    real_environ,
+    thread_cwd_isolated,
+    uninstall_routing,
+)
+
+
+@dataclass(frozen=True)
+class HandlerContext:
+    """Context passed to handlers as their second argument (like a Lambda context)."""
+
+    function_name: str  # Script file name without extension
+    invocation_id: str  # Unique per invocation
+    deadline: float | None  # time.monotonic() value the job must finish by, if it has a timeout
+
+    def get_remaining_time_in_millis(self) -> int | None:
+        """Return the time left until the deadline, or None without a timeout."""
+        if self.deadline is None:
+            return None
+        return max(0, int((self.deadline - time.monotonic()) * 1000))
 
 
 class LambdaExecutor(ScriptExecutor):
     """Executes Python scripts in-process (Lambda-style).
 
     This executor runs scripts in the same process, capturing
-    stdout/stderr and handling exceptions.
+    stdout/stderr and handling exceptions. Compiled scripts are kept in
+    an in-memory LRU cache, and every run executes in a fresh module
+    namespace.
+
+    By default scripts run one at a time on the calling thread. With
+    ``max_workers`` above 1 they run on a pool of threads instead, so
+    I/O-bound scripts can overlap: output is captured per script by
+    context-routed sys.stdout/sys.stderr proxies, every script gets a
+    private copy of os.environ, and each pool thread has its own working
+    directory (see inprocess.py).
+
+    ``execute_async`` and ``execute_many`` always run scripts on the pool
+    (one thread by default), so the event loop stays responsive and
+    output is streamed while the script runs.
+
+    With ``reset_state`` the interpreter is rolled back after scripts
+    run (see InterpreterSnapshot): modules they imported, ``sys.path``
+    edits and environment changes are undone, except for the standard
+    library and the packages in ``preload_modules``, which stay warm.
+    While scripts overlap the rollback waits for the last one to finish.
+
+    Scripts can also be handlers: with ``metadata["handler"]`` set to a
+    function name, the script is executed once as a module that stays
+    loaded, and each job calls ``handler(event, context)`` with
+    ``metadata.get("event")`` and a HandlerContext. Its return value is
+    stored in ``result.metadata["handler_result"]``. The module is
+    loaded again when the script file changes.
+
+    With ``fork_per_invocation`` every job runs in a child forked from
+    the warm process: it starts with everything the executor has
+    imported and compiled (shared copy-on-write), while crashes,
+    ``os._exit``, environment changes and leaks stay in the child. Its
+    stdout/stderr are streamed back over pipes; the exit code and any
+    handler result come back over a third pipe (pickled).
+
+    ``config.timeout_seconds`` is enforced: a script still running at
+    its deadline is stopped and the job ends with status TIMEOUT and the
+    output captured so far. Scripts on the calling (main) thread are
+    interrupted by SIGALRM, scripts on pool threads by an exception
+    raised asynchronously in their thread (see inprocess.deadline); both
+    are cooperative, so a script stuck in a long C call stops once the
+    call returns, and a bare ``except:`` can swallow the timeout. The
+    working directory is restored as usual, and when scripts run one at
+    a time, the modules, ``sys.path`` and environment changes of the
+    timed-out script are rolled back (concurrent scripts have private
+    environments). Forked children are killed at their deadline instead.
     """
 
     def __init__(
-        self, file_provider: FileProvider | None = None, temp_directory: str = "/tmp"
+        self,
+        file_provider: FileProvider | None = None,
+        temp_directory: str = "/tmp",
+        bytecode_cache: BytecodeCache | None = None,
+        code_cache: CodeObjectCache | None = None,
+        max_workers: int = 1,
+        preload_modules: Iterable[str] = (),
+        reset_state: bool = False,
+        fork_per_invocation: bool = False,
     ) -> None:
         """Initialize the executor.
 
         Args:
             file_provider: Optional file provider for staging required files
             temp_directory: Directory for staging files (default: /tmp for Lambda)
+            bytecode_cache: Optional shared on-disk cache of compiled scripts,
+                consulted when a script is not in the code cache
+            code_cache: In-memory cache of compiled scripts (default: a
+                private CodeObjectCache; pass ``CodeObjectCache(0)`` to
+                compile on every run)
+            max_workers: Number of scripts that may run at the same time,
+                each on its own thread (default: 1, on the calling thread)
+            preload_modules: Modules imported now and kept loaded for all
+                scripts (e.g. heavy shared dependencies)
+            reset_state: Whether to roll back the modules, sys.path and
+                environment changes of scripts after they run
+            fork_per_invocation: Whether to run every job in a forked child
+                process (POSIX)
+
+        Raises:
+            ValueError: If max_workers is less than 1, or forking is not
+                available
+            ImportError: If a preloaded module cannot be imported
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if fork_per_invocation and not hasattr(os, "fork"):
+            raise ValueError("fork_per_invocation needs os.fork")
         self._file_provider = file_provider
         self._temp_directory = temp_directory
+        self._bytecode_cache = bytecode_cache
+        self._code_cache = code_cache if code_cache is not None else CodeObjectCache()
+        self._max_workers = max_workers
+        # Threads are started on first use, so sync-only callers pay nothing
+        self._pool = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="lambda-exec", initializer=isolate_thread_cwd
+        )
+
+        preload = list(preload_modules)
+        for name in preload:
+            importlib.import_module(name)
+        self._keep_packages = frozenset(name.partition(".")[0] for name in preload)
+        self._reset_state = reset_state
+        self._fork_per_invocation = fork_per_invocation
+        self._state_lock = threading.Lock()
+        self._running = 0
+        self._snapshot: InterpreterSnapshot | None = None
+        # Loaded handler modules: absolute script path -> ((mtime_ns, size), module)
+        self._handler_modules: dict[str, tuple[tuple[int, int], types.ModuleType]] = {}
+        self._handler_lock = threading.Lock()
+
+    @property
+    def code_cache(self) -> CodeObjectCache:
+        """In-memory cache of compiled scripts (see its hit and miss counters)."""
+        return self._code_cache
+
+    def close(self) -> None:
+        """Stop the worker threads, waiting for running scripts.
+
+        Also puts the real sys.stdout, sys.stderr and os.environ back,
+        unless scripts of another executor are still running.
+        """
+        self._pool.shutdown()
+        uninstall_routing()
 
     def execute(
         self,
@@ -56,87 +208,81 @@ class LambdaExecutor(ScriptExecutor):
         Raises:
             ScriptExecutionException: If execution fails
         """
+        if self._max_workers > 1:
+            return self._pool.submit(self._execute, config, log_sink).result()
+        return self._execute(config, log_sink)
+
+    def _execute(
+        self,
+        config: ScriptConfig,
+        log_sink: LogSink | None,
+        streams: tuple[LineStream, LineStream] | None = None,
+    ) -> ExecutionResult:
+        """Run one script on the current thread (see execute).
+
+        Args:
+            config: Script execution configuration
+            log_sink: Optional log sink for staging messages and, unless
+                streams are given, the captured output
+            streams: Capture streams that already pass output lines on as
+                they are written (stdout, stderr)
+        """
         start_time = time.time()
-        stdout_capture = StringIO()
-        stderr_capture = StringIO()
+        stdout_capture: StringIO = streams[0] if streams else StringIO()
+        stderr_capture: StringIO = streams[1] if streams else StringIO()
         staged_files: list[Path] = []
-
-        # Save original stdout/stderr
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
+        self._enter_script()
 
         try:
             # Stage required files if file provider is available
             if self._file_provider and config.file_requirements:
                 staged_files = self._stage_files(config, log_sink)
-            
-            # Redirect stdout/stderr
-            sys.stdout = stdout_capture
-            sys.stderr = stderr_capture
-
-            # Set environment variables
-            if config.environment_variables:
-                import os
-
-                for key, value in config.environment_variables.items():
-                    os.environ[key] = value
-
-            # Change working directory if specified
-            if config.working_directory:
-                import os
-
-                original_cwd = os.getcwd()
-                os.chdir(config.working_directory)
-            else:
-                original_cwd = None
 
-            try:
-                # Load and execute the script
-                spec = importlib.util.spec_from_file_location("script", config.script_path)
-                if spec is None or spec.loader is None:
-                    raise ScriptExecutionException(f"Could not load script: {config.script_path}")
-
-                module = importlib.util.module_from_spec(spec)
-                sys.modules["script"] = module
-
-                # Execute the script
-                spec.loader.exec_module(module)
-
-                exit_code = 0
-                status = ExecutionStatus.SUCCESS
-
-            except SystemExit as e:
-                exit_code = e.code if isinstance(e.code, int) else 0
-                status = ExecutionStatus.SUCCESS if exit_code == 0 else ExecutionStatus.FAILED
-            except Exception as e:
-                # Capture exception in stderr
-                import traceback
-
-                traceback.print_exc()
-                exit_code = 1
-                status = ExecutionStatus.FAILED
-
-            finally:
-                # Restore working directory
-                if original_cwd:
-                    import os
-
-                    os.chdir(original_cwd)
-
-                # Restore stdout/stderr
-                sys.stdout = original_stdout
-                sys.stderr = original_stderr
+            # A script stopped midway may leave half-done state behind; keep a way back
+            rollback = (
+                InterpreterSnapshot.capture()
+                if config.timeout_seconds
+                and self._max_workers == 1
+                and not self._reset_state
+                and not self._fork_per_invocation
+                else None
+            )
+            environ = self._prepare_environment(config)
+            if (
+                config.working_directory
+                and self._max_workers > 1
+                and not thread_cwd_isolated()
+            ):
+                raise ScriptExecutionException(
+                    "working_directory needs per-thread working directories "
+                    "(Linux unshare) when running scripts concurrently"
+                )
+
+            notes: dict[str, Any] = {}
+            with invocation(stdout_capture, stderr_capture, environ):
+                exit_code, status = self._run_script(config, notes)
+
+            if status == ExecutionStatus.TIMEOUT:
+                if rollback is not None:
+                    rollback.restore(self._keep_packages)
+                if log_sink:
+                    log_sink.emit(
+                        LogLevel.WARNING,
+                        f"Script execution timed out after {config.timeout_seconds} seconds",
+                    )
 
             # Get captured output
             stdout_content = stdout_capture.getvalue()
             stderr_content = stderr_capture.getvalue()
 
-            # Stream to log sink if available
-            if log_sink:
-                for line in stdout_content.splitlines():
-                    log_sink.emit(LogLevel.INFO, line)
-                for line in stderr_content.splitlines():
-                    log_sink.emit(LogLevel.ERROR, line)
+            if streams:
+                for stream in streams:
+                    stream.finish()
+            elif log_sink:
+                log_sink.emit_batch(
+                    [LogRecord(LogLevel.INFO, line) for line in stdout_content.splitlines()]
+                    + [LogRecord(LogLevel.ERROR, line) for line in stderr_content.splitlines()]
+                )
 
             duration = time.time() - start_time
 
@@ -146,7 +292,7 @@ class LambdaExecutor(ScriptExecutor):
                 stdout=stdout_content,
                 stderr=stderr_content,
                 duration_seconds=duration,
-                metadata=config.metadata,
+                metadata={**(config.metadata or {}), **notes} if notes else config.metadata,
             )
 
             # Upload output files if file provider is available
@@ -157,25 +303,313 @@ class LambdaExecutor(ScriptExecutor):
 
         except Exception as e:
             duration = time.time() - start_time
-            # Restore stdout/stderr in case of error
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
             raise ScriptExecutionException(f"In-process execution failed: {str(e)}") from e
         finally:
             # Cleanup staged files
             if self._file_provider:
                 for staged_file in staged_files:
                     self._file_provider.cleanup(staged_file)
+            self._leave_script()
+
+    def _enter_script(self) -> None:
+        """Count a starting script, snapshotting the interpreter if none is running."""
+        with self._state_lock:
+            if self._running == 0 and self._reset_state:
+                self._snapshot = InterpreterSnapshot.capture()
+            self._running += 1
+
+    def _leave_script(self) -> None:
+        """Count a finished script, restoring the snapshot once none is running."""
+        with self._state_lock:
+            self._running -= 1
+            if self._running == 0 and self._snapshot is not None:
+                self._snapshot.restore(self._keep_packages)
+                self._snapshot = None
+
+    def _prepare_environment(self, config: ScriptConfig) -> dict[str, str] | None:
+        """Set up the environment a script sees.
+
+        Scripts running one at a time share os.environ, to which the
+        config's variables are applied. Concurrent scripts each get a
+        private copy with the variables overlaid instead.
+
+        Args:
+            config: Script configuration
+
+        Returns:
+            The script's private environment, or None if it uses os.environ
+        """
+        if self._fork_per_invocation:
+            return None  # Applied in the forked child
+        overrides = config.environment_variables or {}
+        if self._max_workers > 1:
+            return {**real_environ(), **overrides}
+        for key, value in overrides.items():
+            os.environ[key] = value
+        return None
+
+    def _run_script(
+        self, config: ScriptConfig, notes: dict[str, Any]
+    ) -> tuple[int | None, ExecutionStatus]:
+        """Execute the script (or call its handler) inside its working directory.
+
+        Exceptions raised by the script are printed to its stderr. A script
+        stopped at its deadline has no exit code.
+
+        Args:
+            config: Script configuration
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            Tuple of (exit code, status)
+        """
+        # Change working directory if specified (only this thread's on pool threads)
+        original_cwd = os.getcwd() if config.working_directory else None
+        if config.working_directory:
+            os.chdir(config.working_directory)
+
+        try:
+            if self._fork_per_invocation:
+                return self._run_forked(config, notes)
+
+            handler_name = (config.metadata or {}).get("handler")
+            with deadline(config.timeout_seconds):
+                if handler_name:
+                    notes["handler_result"] = self._call_handler(
+                        config, handler_name, self._load_handler_module(config)
+                    )
+                else:
+                    # Execute the compiled script in a fresh module
+                    exec(self._load_code(config), self._new_module(config).__dict__)
+            return 0, ExecutionStatus.SUCCESS
+
+        except ScriptTimeout:
+            return None, ExecutionStatus.TIMEOUT
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 0
+            return exit_code, ExecutionStatus.SUCCESS if exit_code == 0 else ExecutionStatus.FAILED
+        except Exception:
+            # Capture exception in stderr
+            import traceback
+
+            traceback.print_exc()
+            return 1, ExecutionStatus.FAILED
+
+        finally:
+            # Restore working directory
+            if original_cwd:
+                os.chdir(original_cwd)
+
+    def _load_code(self, config: ScriptConfig) -> types.CodeType:
+        """Return the script's compiled code from the code cache."""
+        return self._code_cache.load(
+            config.script_path,
+            self._bytecode_cache.load if self._bytecode_cache else compile_script,
+        )
+
+    @staticmethod
+    def _new_module(config: ScriptConfig) -> types.ModuleType:
+        """Create the module a script runs in (registered as ``script``)."""
+        module = types.ModuleType("script")
+        module.__file__ = config.script_path
+        sys.modules["script"] = module
+        return module
+
+    def _load_handler_module(self, config: ScriptConfig) -> types.ModuleType:
+        """Return the script's loaded handler module, loading it if needed.
+
+        The module is executed again only when the script file changed (its
+        modification time or size), not when the code cache merely compiled
+        it again, e.g. after evicting it.
+        """
+        path, mtime_ns, size = script_identity(config.script_path)
+        with self._handler_lock:
+            entry = self._handler_modules.get(path)
+            if entry is None or entry[0] != (mtime_ns, size):
+                module = self._new_module(config)
+                exec(self._load_code(config), module.__dict__)
+                entry = self._handler_modules[path] = ((mtime_ns, size), module)
+            return entry[1]
+
+    @staticmethod
+    def _call_handler(config: ScriptConfig, handler_name: str, module: types.ModuleType) -> Any:
+        """Call a handler of a loaded module.
+
+        Args:
+            config: Script configuration
+            handler_name: Name of the handler function in the script
+            module: The script's handler module
+
+        Returns:
+            The handler's return value
+        """
+        handler = getattr(module, handler_name)
+        context = HandlerContext(
+            function_name=Path(config.script_path).stem,
+            invocation_id=uuid.uuid4().hex,
+            deadline=(
+                time.monotonic() + config.timeout_seconds if config.timeout_seconds else None
+            ),
+        )
+        return handler((config.metadata or {}).get("event"), context)
+
+    def _run_forked(
+        self, config: ScriptConfig, notes: dict[str, Any]
+    ) -> tuple[int | None, ExecutionStatus]:
+        """Run the script in a child forked from this process and wait for it.
+
+        The script is compiled (or its handler module loaded) here first, so
+        it stays warm for later forks. The child's output is written to this
+        thread's (routed) sys.stdout and sys.stderr as it arrives. A child
+        still running at the deadline is killed.
+
+        Args:
+            config: Script configuration
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            Tuple of (exit code, status); the exit code is negative if the
+            child was killed by a signal
+        """
+        handler_name = (config.metadata or {}).get("handler")
+        run: Callable[[], Any]
+        if handler_name:
+            run = functools.partial(
+                self._call_handler, config, handler_name, self._load_handler_module(config)
+            )
+        else:
+            code = self._load_code(config)
+            run = functools.partial(exec, code, self._new_module(config).__dict__)
+
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        result_read, result_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            exit_status = 70  # EX_SOFTWARE, if the child fails outside the script
+            try:
+                for fd in (stdout_read, stderr_read, result_read):
+                    os.close(fd)
+                self._forked_child(config, run, stdout_write, stderr_write, result_write)
+                exit_status = 0
+            finally:
+                os._exit(exit_status)
+
+        for fd in (stdout_write, stderr_write, result_write):
+            os.close(fd)
+        streams = {STDOUT: sys.stdout, STDERR: sys.stderr}
+
+        def forward(line: OutputLine) -> None:
+            streams[line.stream].write(line.text + "\n")
+
+        timeout_at = (
+            time.monotonic() + config.timeout_seconds if config.timeout_seconds else None
+        )
+        timed_out = False
+        payload: bytes | None = None
+        wait_status: int | None = None
+        try:
+            with open(stdout_read, "rb") as stdout, open(stderr_read, "rb") as stderr:
+                pump = OutputPump(stdout, stderr, forward)
+                try:
+                    timed_out = not pump.run(timeout_at)
+                    if timed_out:
+                        os.kill(pid, signal.SIGKILL)
+                        # Collect what it wrote; processes it started may hold the pipes open
+                        pump.run(time.monotonic() + 1)
+                finally:
+                    pump.close()
+            # The script may close its output early and keep running: stay within the deadline
+            if not timed_out:
+                payload = _read_pipe(result_read, timeout_at)
+                timed_out = payload is None
+            if not timed_out:
+                wait_status = _wait_child(pid, timeout_at)
+                timed_out = wait_status is None
+        finally:
+            os.close(result_read)
+            if wait_status is None:
+                # Timed out or interrupted: never leave the child running
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGKILL)
+                _, wait_status = os.waitpid(pid, 0)
+
+        if timed_out:
+            return os.waitstatus_to_exitcode(wait_status), ExecutionStatus.TIMEOUT
+        if payload:
+            exit_code, child_notes = pickle.loads(payload)
+            notes.update(child_notes)
+        else:
+            # Died without reporting back (os._exit, signal, ...)
+            exit_code = os.waitstatus_to_exitcode(wait_status)
+            if exit_code == 0:
+                exit_code = 1
+        return exit_code, ExecutionStatus.SUCCESS if exit_code == 0 else ExecutionStatus.FAILED
+
+    def _forked_child(
+        self,
+        config: ScriptConfig,
+        run: Callable[[], Any],
+        stdout_fd: int,
+        stderr_fd: int,
+        result_fd: int,
+    ) -> None:
+        """Run the script (or handler) in a forked child and report back (see _run_forked).
+
+        Output pipes are closed before the result is written, so the parent
+        (which drains them until EOF first) never blocks a large result.
+        """
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+        # Plain line-buffered streams replace the routed ones, so output streams live
+        for name, fd in (("stdout", 1), ("stderr", 2)):
+            stream = open(fd, "w", buffering=1, encoding="utf-8", errors="backslashreplace", closefd=False)
+            setattr(sys, name, stream)
+        real_environ().update(config.environment_variables or {})
+
+        notes: dict[str, Any] = {}
+        exit_code = 0
+        try:
+            value = run()
+            if (config.metadata or {}).get("handler"):
+                notes["handler_result"] = value
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 0
+        except BaseException:
+            import traceback
+
+            traceback.print_exc()
+            exit_code = 1
+
+        try:
+            payload = pickle.dumps((exit_code, notes))
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+            payload = pickle.dumps((exit_code or 1, {}))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.close(1)
+        os.close(2)
+        with open(result_fd, "wb") as result:
+            result.write(payload)
 
     async def execute_async(
         self,
         config: ScriptConfig,
         log_sink: LogSink | None = None,
     ) -> AsyncIterator[ExecutionResult | str]:
-        """Execute a Python script asynchronously in-process.
+        """Execute a Python script in-process, streaming its output.
 
-        Note: In-process execution is inherently synchronous, but we
-        yield logs as they're captured to maintain async interface.
+        The script runs on a pool thread while the event loop keeps
+        running. Each line it writes is handed to the loop as soon as it
+        is complete, then yielded and emitted to the log sink from the
+        loop's thread (stdout as INFO, stderr as ERROR, in write order).
+        If the caller stops iterating early the script still runs to
+        completion on its thread.
 
         Args:
             config: Script execution configuration
@@ -187,19 +621,68 @@ class LambdaExecutor(ScriptExecutor):
         Raises:
             ScriptExecutionException: If execution fails
         """
-        # For in-process execution, we run synchronously but yield results
-        result = self.execute(config, log_sink)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[list[LogRecord], bool] | None] = asyncio.Queue()
+
+        def forward(records: list[LogRecord], output: bool) -> None:
+            # Called on the script's thread
+            loop.call_soon_threadsafe(queue.put_nowait, (records, output))
+
+        def output_stream(level: LogLevel) -> LineStream:
+            return LineStream(lambda lines: forward([LogRecord(level, line) for line in lines], True))
+
+        job = loop.run_in_executor(
+            self._pool,
+            self._execute,
+            config,
+            _ForwardingLogSink(forward) if log_sink else None,
+            (output_stream(LogLevel.INFO), output_stream(LogLevel.ERROR)),
+        )
+        # Completion is scheduled after every line the script wrote, so this comes last
+        job.add_done_callback(lambda _: queue.put_nowait(None))
+
+        while (item := await queue.get()) is not None:
+            records, output = item
+            if log_sink:
+                log_sink.emit_batch(records)
+            if output:
+                for record in records:
+                    yield record.message
+
+        yield await job
 
-        # Yield stdout lines
-        for line in result.stdout.splitlines():
-            yield line
+    def execute_many(
+        self,
+        configs: Iterable[ScriptConfig] | AsyncIterable[ScriptConfig],
+        max_parallel: int = 8,
+        log_sink: LogSink | None = None,
+    ) -> AsyncIterator[ExecutionResult | BatchStats]:
+        """Execute many scripts in-process, yielding results as they complete.
 
-        # Yield stderr lines
-        for line in result.stderr.splitlines():
-            yield line
+        In thread-pool mode up to ``min(max_parallel, max_workers)`` jobs run
+        at the same time on the pool. Otherwise scripts share the
+        interpreter's working directory and environment, so jobs run one at
+        a time regardless of ``max_parallel``. Configs are pulled lazily,
+        one per job.
+
+        Args:
+            configs: Script configurations to run
+            max_parallel: Maximum number of jobs running at once
+            log_sink: Optional log sink shared by all jobs
 
-        # Yield final result
-        yield result
+        Yields:
+            One ExecutionResult per config, then a final BatchStats
+        """
+        return super().execute_many(
+            configs, max_parallel=min(max_parallel, self._max_workers), log_sink=log_sink
+        )
+
+    async def _run_batch_job(
+        self, config: ScriptConfig, log_sink: LogSink | None
+    ) -> ExecutionResult:
+        """Run one execute_many job on the pool, without re-yielding its output."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._execute, config, log_sink)
 
     def _stage_files(self, config: ScriptConfig, log_sink: LogSink | None = None) -> list[Path]:
         """Stage required files before execution in Lambda context.
@@ -310,3 +793,77 @@ class LambdaExecutor(ScriptExecutor):
                         f"Failed to upload optional output file {file_output.source}: {str(e)}",
                     )
 
+
+def _read_pipe(fd: int, deadline: float | None) -> bytes | None:
+    """Read a pipe until EOF.
+
+    Args:
+        fd: Read end of the pipe
+        deadline: Optional time.monotonic() value to give up at
+
+    Returns:
+        The data read, or None if the deadline passed first
+    """
+    chunks: list[bytes] = []
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                return None
+            if selector.select(timeout):
+                data = os.read(fd, 65536)
+                if not data:
+                    return b"".join(chunks)
+                chunks.append(data)
+
+
+def _wait_child(pid: int, deadline: float | None) -> int | None:
+    """Reap a child process.
+
+    Args:
+        pid: Child process id
+        deadline: Optional time.monotonic() value to give up at
+
+    Returns:
+        The child's wait status, or None if it was still running at the deadline
+    """
+    if deadline is not None:
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            # No pidfds (older kernels, other platforms): poll
+            while True:
+                reaped, wait_status = os.waitpid(pid, os.WNOHANG)
+                if reaped:
+                    return wait_status
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.01)
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(pidfd, selectors.EVENT_READ)
+                if not selector.select(max(0.0, deadline - time.monotonic())):
+                    return None
+        finally:
+            os.close(pidfd)
+    return os.waitpid(pid, 0)[1]
+
+
+class _ForwardingLogSink(LogSink):
+    """Log sink that hands records to a callback (used to cross threads)."""
+
+    def __init__(self, forward: Callable[[list[LogRecord], bool], None]) -> None:
+        self._forward = forward
+
+    def emit(self, level: LogLevel, message: str, metadata: dict[str, str] | None = None) -> None:
+        """Forward one log message."""
+        self._forward([LogRecord(level, message, metadata)], False)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Forward several log messages at once."""
+        if records:
+            self._forward(list(records), False)
+
+    def close(self) -> None:
+        """Nothing to release; the real sink is owned by the caller."""
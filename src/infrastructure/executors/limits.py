@@ -0,0 +1,230 @@
+"""Per-job resource governance: rlimits and cgroup v2 slices."""
+
+import itertools
+import os
+import resource
+import signal
+import time
+from pathlib import Path
+
+from ...domain import ResourceLimits
+
+# Failure reasons reported in ExecutionResult.metadata["failure_reason"]
+OOM_KILLED = "oom_killed"
+MEMORY_LIMIT = "memory_limit"
+CPU_LIMIT = "cpu_limit"
+OPEN_FILES_LIMIT = "open_files_limit"
+
+# cpu.max period in microseconds (the kernel default)
+_CPU_PERIOD = 100_000
+
+_job_ids = itertools.count(1)
+
+
+def rlimit_settings(limits: ResourceLimits | None) -> dict[str, int] | None:
+    """Translate ResourceLimits into rlimit values keyed by resource name.
+
+    Names (e.g. ``"RLIMIT_AS"``) rather than numbers are used so the
+    settings can be passed through the JSON protocol of script hosts.
+
+    Args:
+        limits: Limits of a job, if any
+
+    Returns:
+        Mapping of resource name to limit, or None if there are no rlimits
+    """
+    if limits is None:
+        return None
+    settings = {
+        name: value
+        for name, value in (
+            ("RLIMIT_AS", limits.max_memory_bytes),
+            ("RLIMIT_CPU", limits.max_cpu_seconds),
+            ("RLIMIT_NOFILE", limits.max_open_files),
+        )
+        if value is not None
+    }
+    return settings or None
+
+
+def set_rlimits(settings: dict[str, int]) -> None:
+    """Apply rlimits to the calling process.
+
+    Called in a freshly forked script process before it starts the
+    script, so the limits are in place from its first instruction.
+    Limits are clamped to the current hard limit, which unprivileged
+    processes cannot raise. The CPU hard limit is set one second above
+    the soft limit so the script receives SIGXCPU before SIGKILL.
+
+    Args:
+        settings: Output of rlimit_settings
+    """
+    for name, value in settings.items():
+        which = getattr(resource, name)
+        _, hard = resource.getrlimit(which)
+        new_hard = value + 1 if which == resource.RLIMIT_CPU else value
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+            new_hard = min(new_hard, hard)
+        resource.setrlimit(which, (value, new_hard))
+
+
+def join_cgroup(procs_path: str) -> None:
+    """Move the calling process into a cgroup (best effort).
+
+    Called in a freshly forked script process before it starts the
+    script. Failures are ignored here: the executor moves the process
+    again after the launch (a no-op if it is already in the group) and
+    reports ``cgroup_error`` if that fails too.
+
+    Args:
+        procs_path: The group's ``cgroup.procs`` file
+    """
+    try:
+        fd = os.open(procs_path, os.O_WRONLY)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class CgroupSlice:
+    """A cgroup v2 child group holding one job's processes.
+
+    Created under a parent group the executor is allowed to manage (a
+    delegated subtree with the memory and cpu controllers enabled in its
+    ``cgroup.subtree_control``).
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the slice.
+
+        Args:
+            path: Directory of the (already created) cgroup
+        """
+        self.path = path
+
+    @classmethod
+    def create(cls, parent: str, limits: ResourceLimits) -> "CgroupSlice":
+        """Create a job cgroup and configure its limits.
+
+        Args:
+            parent: Directory of the delegated parent cgroup
+            limits: Job limits (cgroup_memory_bytes / cgroup_cpus are used)
+
+        Returns:
+            The new slice
+
+        Raises:
+            OSError: If the cgroup cannot be created or configured
+        """
+        path = Path(parent) / f"jobflow-{os.getpid()}-{next(_job_ids)}"
+        path.mkdir()
+        group = cls(path)
+        try:
+            if limits.cgroup_memory_bytes is not None:
+                group._write("memory.max", str(limits.cgroup_memory_bytes))
+                # Fail fast instead of thrashing swap once the limit is reached
+                if (path / "memory.swap.max").exists():
+                    group._write("memory.swap.max", "0")
+            if limits.cgroup_cpus is not None:
+                quota = max(1000, int(limits.cgroup_cpus * _CPU_PERIOD))
+                group._write("cpu.max", f"{quota} {_CPU_PERIOD}")
+        except OSError:
+            group.remove()
+            raise
+        return group
+
+    def add(self, pid: int) -> None:
+        """Move a process into the group.
+
+        Args:
+            pid: Process to move
+
+        Raises:
+            OSError: If the process cannot be moved
+        """
+        self._write("cgroup.procs", str(pid))
+
+    @property
+    def procs_path(self) -> str:
+        """Path of the group's ``cgroup.procs`` file (see join_cgroup)."""
+        return str(self.path / "cgroup.procs")
+
+    def oom_killed(self) -> bool:
+        """Whether the kernel OOM-killed a process of this group."""
+        try:
+            events = (self.path / "memory.events").read_text()
+        except OSError:
+            return False
+        for line in events.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "oom_kill" and int(value) > 0:
+                return True
+        return False
+
+    def remove(self) -> None:
+        """Kill anything left in the group and delete it (best effort)."""
+        try:
+            (self.path / "cgroup.kill").write_text("1")
+        except OSError:
+            pass
+        # The kernel needs a moment to empty the group after its last process exits
+        for _ in range(50):
+            try:
+                self.path.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                time.sleep(0.01)
+
+    def _write(self, name: str, value: str) -> None:
+        """Write a cgroup interface file."""
+        (self.path / name).write_text(value)
+
+
+def limit_failure_reason(
+    limits: ResourceLimits | None,
+    exit_code: int | None,
+    stderr_tail: list[str],
+    cgroup: CgroupSlice | None,
+    cpu_seconds: float | None = None,
+) -> str | None:
+    """Work out whether a failed run was stopped by one of its limits.
+
+    rlimit failures are inferred from how the script died: SIGXCPU (or
+    SIGKILL at the CPU limit) for CPU time, and the final traceback line
+    for MemoryError and EMFILE, which is how Python surfaces exhausted
+    address space and descriptors.
+
+    Args:
+        limits: Limits of the job
+        exit_code: Exit code (negative: killed by that signal)
+        stderr_tail: Last lines of the job's stderr
+        cgroup: The job's cgroup slice, if one was used
+        cpu_seconds: CPU time the script used, if known
+
+    Returns:
+        One of the failure reason constants, or None
+    """
+    if limits is None or exit_code == 0:
+        return None
+    if cgroup is not None and cgroup.oom_killed():
+        return OOM_KILLED
+    if limits.max_cpu_seconds is not None:
+        if exit_code == -signal.SIGXCPU or (
+            exit_code == -signal.SIGKILL
+            and cpu_seconds is not None
+            and cpu_seconds >= limits.max_cpu_seconds
+        ):
+            return CPU_LIMIT
+
+    last_line = stderr_tail[-1] if stderr_tail else ""
+    if limits.max_memory_bytes is not None and last_line.startswith("MemoryError"):
+        return MEMORY_LIMIT
+    if limits.max_open_files is not None and "[Errno 24]" in last_line:
+        return OPEN_FILES_LIMIT
+    return None
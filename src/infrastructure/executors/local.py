@@ -1,13 +1,20 @@
 """Local subprocess executor implementation."""
 
 import asyncio
+import contextlib
+import fcntl
+import functools
+import itertools
+import os
+import signal
 import subprocess
 import time
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, Mapping
 
 from pathlib import Path
 
 from ...domain import (
+    CapturedOutput,
     ScriptExecutor,
     ScriptConfig,
     ExecutionResult,
@@ -17,22 +24,154 @@ from ...domain import (
     ScriptExecutionException,
     FileProvider,
 )
+from ..logging.batching import BatchingLogSink
+from .affinity import CpuAllocator, CpuAssignment
+from .bytecode import BytecodeCache
+from .capture import FileOutputCapture, SpillingOutputBuffer
+from .inprocess import real_environ
+from .limits import CgroupSlice, limit_failure_reason, rlimit_settings
+from .sampler import ResourceSample, ResourceSampler
+from .spawn import LaunchRequest, PopenSpawner, ProcessSpawner, SpawnedProcess
+from .streaming import (
+    SPLIT,
+    STDOUT,
+    LineDecoder,
+    OutputLine,
+    OutputPump,
+    merge_output_async,
+)
+
+# How long to keep collecting output after a timed-out process group was killed.
+# Bounded because a descendant that escaped the group may still hold the pipes open.
+_POST_KILL_DRAIN_SECONDS = 1.0
+
+# Distinguishes output files of jobs started in the same second
+_output_file_ids = itertools.count(1)
 
 
 class LocalSubprocessExecutor(ScriptExecutor):
-    """Executes Python scripts as local subprocesses."""
+    """Executes Python scripts as local subprocesses.
+
+    How processes are started is delegated to a ProcessSpawner: by default
+    every script gets a fresh interpreter (PopenSpawner); a ZygoteSpawner
+    forks scripts from a pre-warmed server instead.
+    """
 
     def __init__(
-        self, python_executable: str = "python3", file_provider: FileProvider | None = None
+        self,
+        python_executable: str = "python3",
+        file_provider: FileProvider | None = None,
+        kill_grace_seconds: float = 5.0,
+        spawner: ProcessSpawner | None = None,
+        output_memory_budget_bytes: int = 16 * 1024 * 1024,
+        spill_directory: str | None = None,
+        resource_sample_interval_seconds: float | None = None,
+        output_encoding: str = "utf-8",
+        output_errors: str = "replace",
+        max_line_length: int | None = None,
+        long_lines: str = SPLIT,
+        read_size: int = 65536,
+        base_environment: Mapping[str, str] | None = None,
+        bytecode_cache: BytecodeCache | None = None,
+        cgroup_parent: str | None = None,
+        cpu_allocator: CpuAllocator | None = None,
+        output_directory: str | None = None,
+        output_tail_bytes: int = 64 * 1024,
+        log_batch_size: int = 256,
+        log_batch_delay_seconds: float = 0.05,
     ) -> None:
         """Initialize the executor.
 
         Args:
             python_executable: Path to Python executable (default: python3)
             file_provider: Optional file provider for staging required files
+            kill_grace_seconds: Time between SIGTERM and SIGKILL when a script
+                exceeds its timeout (default: 5 seconds)
+            spawner: Process spawning strategy (default: PopenSpawner)
+            output_memory_budget_bytes: Approximate memory kept per output
+                stream; the middle of longer output is spilled to disk
+                (default: 16 MiB)
+            spill_directory: Directory for spill files (default: system temp dir)
+            resource_sample_interval_seconds: If set, sample the job's process
+                tree (CPU, RSS, I/O, open fds) at this interval; samples are
+                emitted as DEBUG log metadata and collected in
+                ``result.metadata["resource_timeline"]`` (default: disabled)
+            output_encoding: Encoding of the script's output (default: utf-8)
+            output_errors: Decoding error policy (default: replace)
+            max_line_length: Maximum characters per output line; longer lines
+                are split or truncated according to ``long_lines``
+                (default: unlimited)
+            long_lines: "split" or "truncate" (default: split)
+            read_size: Bytes read from the pipes per system call; values
+                above the pipe capacity also enlarge the pipes where the
+                platform allows it (default: 64 KiB)
+            base_environment: Environment every script starts from, with
+                each config's environment_variables overlaid (default: a
+                snapshot of os.environ, refreshed whenever os.environ changes)
+            bytecode_cache: Optional shared cache of compiled scripts, so
+                repeated runs of the same source skip compilation
+            cgroup_parent: Delegated cgroup v2 directory (memory and cpu
+                controllers enabled for its children) under which jobs with
+                cgroup limits get their own group
+            cpu_allocator: Optional allocator that pins each job to its own
+                CPUs while it runs; the assignment is recorded in
+                ``result.metadata["cpu_affinity"]`` (None if no CPUs were
+                free and the job ran unpinned)
+            output_directory: If set, each script writes its stdout and stderr
+                straight to files in this directory instead of pipes, so the
+                executor never reads or decodes its output; the files are
+                kept, their paths are recorded in ``result.metadata``
+                ("stdout_path", "stderr_path") and no lines are streamed to
+                the log sink (default: capture through pipes)
+            output_tail_bytes: With output_directory, how much of the end of
+                each file result.stdout and result.stderr hold (default: 64 KiB)
+            log_batch_size: Output lines and other log messages are passed
+                to the log sink in batches (LogSink.emit_batch) of up to this
+                many records; 1 emits every message on its own (default: 256)
+            log_batch_delay_seconds: Maximum time a message is held back
+                to fill a batch (default: 50 ms)
+
+        Raises:
+            LookupError: If the encoding or error policy is unknown
+            ValueError: If max_line_length or long_lines is invalid
         """
         self._python_executable = python_executable
         self._file_provider = file_provider
+        self._kill_grace_seconds = kill_grace_seconds
+        self._spawner = spawner or PopenSpawner()
+        self._output_memory_budget_bytes = output_memory_budget_bytes
+        self._spill_directory = spill_directory
+        self._resource_sample_interval = resource_sample_interval_seconds
+        self._decoder_factory = functools.partial(
+            LineDecoder, output_encoding, output_errors, max_line_length, long_lines
+        )
+        self._decoder_factory()  # Fail fast on invalid settings
+        self._read_size = read_size
+        self._base_environment = dict(base_environment) if base_environment is not None else None
+        self._inherits_environment = base_environment is None
+        self._environment_source: dict[Any, Any] | None = None  # os.environ storage snapshotted
+        self._bytecode_cache = bytecode_cache
+        self._cgroup_parent = cgroup_parent
+        self._cpu_allocator = cpu_allocator
+        self._output_directory = output_directory
+        self._output_tail_bytes = output_tail_bytes
+        self._log_batch_size = log_batch_size
+        self._log_batch_delay = log_batch_delay_seconds
+
+    def close(self) -> None:
+        """Release resources held by the spawner (e.g. stop a zygote server)."""
+        self._spawner.close()
+
+    def invalidate_environment(self) -> None:
+        """Drop the cached os.environ snapshot.
+
+        Changes to os.environ are picked up automatically; this only frees
+        the snapshot. Has no effect when an explicit ``base_environment``
+        was given.
+        """
+        if self._inherits_environment:
+            self._base_environment = None
+            self._environment_source = None
 
     def execute(
         self,
@@ -52,57 +191,91 @@ class LocalSubprocessExecutor(ScriptExecutor):
             ScriptExecutionException: If execution fails
         """
         start_time = time.time()
+        staged_files: list[Path] = []
+        cgroup: CgroupSlice | None = None
+        cpus: CpuAssignment | None = None
+        notes: dict[str, Any] = {}
+        log_batch = self._new_log_batch(log_sink)
+        if log_batch:
+            log_sink = log_batch
 
         try:
+            # Stage required files if file provider is available
+            if self._file_provider and config.file_requirements:
+                staged_files = self._stage_files(config, log_sink)
+
             # Build environment
             env = self._build_environment(config)
 
-            # Build command
-            cmd = [self._python_executable, config.script_path]
-
-            # Execute subprocess
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=config.working_directory,
-                env=env,
+            # Start the script in its own session so a timeout can kill the whole group
+            cpus = self._acquire_cpus(notes)
+            output_files = self._create_output_files(config, notes)
+            cgroup = self._create_cgroup(config, notes)
+            process, stdout_fd, stderr_fd = self._spawn(
+                config, env, cpus, output_files[2] if output_files else None, cgroup
             )
+            cgroup = self._enter_cgroup(cgroup, process, notes)
 
-            # Stream output if log sink is provided
-            stdout_lines: list[str] = []
-            stderr_lines: list[str] = []
+            stdout_capture = self._new_capture()
+            stderr_capture = self._new_capture()
+            captures: tuple[CapturedOutput, CapturedOutput] = (
+                output_files[:2] if output_files else (stdout_capture, stderr_capture)
+            )
+            sampler = self._new_sampler(process, cgroup, log_sink)
 
-            if log_sink:
-                # Read output line by line using communicate with real-time streaming
-                # For true streaming, we'd need threading, but for simplicity we'll
-                # read after completion and stream to log sink
-                stdout, stderr = process.communicate()
-                exit_code = process.returncode
-
-                # Stream to log sink
-                if stdout:
-                    for line in stdout.splitlines():
-                        line = line.rstrip("\n\r")
-                        stdout_lines.append(line)
-                        log_sink.emit(LogLevel.INFO, line)
-                if stderr:
-                    for line in stderr.splitlines():
-                        line = line.rstrip("\n\r")
-                        stderr_lines.append(line)
-                        log_sink.emit(LogLevel.ERROR, line)
-            else:
-                # Wait and capture all output
-                stdout, stderr = process.communicate()
-                exit_code = process.returncode
-                stdout_lines = stdout.splitlines() if stdout else []
-                stderr_lines = stderr.splitlines() if stderr else []
+            def on_line(line: OutputLine) -> None:
+                if line.stream == STDOUT:
+                    stdout_capture.append(line.text)
+                    if log_sink:
+                        log_sink.emit(LogLevel.INFO, line.text)
+                else:
+                    stderr_capture.append(line.text)
+                    if log_sink:
+                        log_sink.emit(LogLevel.ERROR, line.text)
+
+            deadline = (
+                time.monotonic() + config.timeout_seconds if config.timeout_seconds else None
+            )
+
+            # Drain both pipes concurrently, forwarding lines as they arrive
+            with contextlib.ExitStack() as pipes:
+                stdout, stderr = (
+                    pipes.enter_context(open(fd, "rb", buffering=0)) if fd is not None else None
+                    for fd in (stdout_fd, stderr_fd)
+                )
+                pump = OutputPump(
+                    stdout, stderr, on_line, self._read_size, self._decoder_factory
+                )
+                try:
+                    timed_out = not self._wait_for_exit(
+                        process, pump, deadline, sampler, log_batch
+                    )
+                    if timed_out:
+                        self._terminate(process, pump)
+                    pump.close()
+                    exit_code = process.wait()
+                finally:
+                    # Never leave the group running if streaming was interrupted
+                    if process.returncode is None:
+                        process.signal_group(signal.SIGKILL)
+                        process.wait()
+                    process.close()
 
             duration = time.time() - start_time
+            if not timed_out:
+                self._note_limit_failure(
+                    config, process, exit_code, captures[1], cgroup, notes, log_sink
+                )
 
             # Determine status
-            if exit_code == 0:
+            if timed_out:
+                status = ExecutionStatus.TIMEOUT
+                if log_sink:
+                    log_sink.emit(
+                        LogLevel.WARNING,
+                        f"Script execution timed out after {config.timeout_seconds} seconds",
+                    )
+            elif exit_code == 0:
                 status = ExecutionStatus.SUCCESS
             else:
                 status = ExecutionStatus.FAILED
@@ -110,14 +283,18 @@ class LocalSubprocessExecutor(ScriptExecutor):
             result = ExecutionResult(
                 status=status,
                 exit_code=exit_code,
-                stdout="\n".join(stdout_lines),
-                stderr="\n".join(stderr_lines),
+                stdout=captures[0].text(),
+                stderr=captures[1].text(),
                 duration_seconds=duration,
-                metadata=config.metadata,
+                metadata=self._result_metadata(config, sampler, notes),
+                stdout_capture=captures[0],
+                stderr_capture=captures[1],
+                resource_usage=process.resource_usage,
             )
 
-            # Upload output files if file provider is available
-            if self._file_provider and config.file_outputs:
+            # Upload output files if file provider is available (skipped for
+            # timed-out runs, whose outputs are incomplete)
+            if self._file_provider and config.file_outputs and not timed_out:
                 self._upload_output_files(config, log_sink)
 
             return result
@@ -126,22 +303,22 @@ class LocalSubprocessExecutor(ScriptExecutor):
             raise ScriptExecutionException(
                 f"Python executable not found: {self._python_executable}"
             )
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
-            raise ScriptExecutionException(
-                f"Script execution timed out after {config.timeout_seconds} seconds",
-                exit_code=None,
-            )
         except Exception as e:
             duration = time.time() - start_time
             raise ScriptExecutionException(f"Subprocess execution failed: {str(e)}") from e
         finally:
+            if log_batch:
+                log_batch.flush()
+            if cgroup:
+                cgroup.remove()
+            if cpus and self._cpu_allocator:
+                self._cpu_allocator.release(cpus)
             # Cleanup staged files
             if self._file_provider:
                 for staged_file in staged_files:
                     self._file_provider.cleanup(staged_file)
 
-    async def execute_async(
+    def execute_async(
         self,
         config: ScriptConfig,
         log_sink: LogSink | None = None,
@@ -158,8 +335,47 @@ class LocalSubprocessExecutor(ScriptExecutor):
         Raises:
             ScriptExecutionException: If execution fails
         """
+        return self._execute_streaming(config, log_sink, yield_lines=True)
+
+    async def _run_batch_job(
+        self, config: ScriptConfig, log_sink: LogSink | None
+    ) -> ExecutionResult:
+        """Run one execute_many job without yielding its output line by line."""
+        result = None
+        # Drained to the end so the generator's cleanup runs before returning
+        async for item in self._execute_streaming(config, log_sink, yield_lines=False):
+            result = item
+        if not isinstance(result, ExecutionResult):
+            raise ScriptExecutionException(f"No result produced for {config.script_path}")
+        return result
+
+    async def _execute_streaming(
+        self,
+        config: ScriptConfig,
+        log_sink: LogSink | None,
+        yield_lines: bool,
+    ) -> AsyncIterator[ExecutionResult | str]:
+        """Run a script on the event loop (shared by execute_async and execute_many).
+
+        Args:
+            config: Script execution configuration
+            log_sink: Optional log sink for streaming logs
+            yield_lines: Whether to yield output lines before the result
+
+        Yields:
+            Output lines (if requested), then the final ExecutionResult
+        """
         start_time = time.time()
         staged_files: list[Path] = []
+        cgroup: CgroupSlice | None = None
+        cpus: CpuAssignment | None = None
+        notes: dict[str, Any] = {}
+        logs_pending = asyncio.Event()
+        log_batch = self._new_log_batch(log_sink, logs_pending.set)
+        log_flusher: asyncio.Task[None] | None = None
+        if log_batch:
+            log_sink = log_batch
+            log_flusher = asyncio.create_task(self._flush_logs_async(log_batch, logs_pending))
 
         try:
             # Stage required files if file provider is available
@@ -169,45 +385,93 @@ class LocalSubprocessExecutor(ScriptExecutor):
             # Build environment
             env = self._build_environment(config)
 
-            # Build command
-            cmd = [self._python_executable, config.script_path]
+            # Start the script in its own session so a timeout can kill the whole group
+            cpus = self._acquire_cpus(notes)
+            output_files = self._create_output_files(config, notes)
+            cgroup = self._create_cgroup(config, notes)
+            process, stdout_fd, stderr_fd = self._spawn(
+                config, env, cpus, output_files[2] if output_files else None, cgroup
+            )
+            cgroup = self._enter_cgroup(cgroup, process, notes)
 
-            # Create async subprocess
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=config.working_directory,
-                env=env,
+            stdout_capture = self._new_capture()
+            stderr_capture = self._new_capture()
+            captures: tuple[CapturedOutput, CapturedOutput] = (
+                output_files[:2] if output_files else (stdout_capture, stderr_capture)
             )
+            sampler = self._new_sampler(process, cgroup, log_sink)
 
-            stdout_lines: list[str] = []
-            stderr_lines: list[str] = []
+            watchdog: asyncio.Task[None] | None = None
+            sampling: asyncio.Task[None] | None = None
+            expired = asyncio.Event()
+            transports: list[asyncio.ReadTransport] = []
+            stdout: asyncio.StreamReader | None = None
+            stderr: asyncio.StreamReader | None = None
 
-            # Stream stdout
-            if process.stdout:
-                async for line in process.stdout:
-                    line_str = line.decode("utf-8").rstrip("\n\r")
-                    stdout_lines.append(line_str)
-                    if log_sink:
-                        log_sink.emit(LogLevel.INFO, line_str)
-                    yield line_str
-
-            # Stream stderr
-            if process.stderr:
-                async for line in process.stderr:
-                    line_str = line.decode("utf-8").rstrip("\n\r")
-                    stderr_lines.append(line_str)
-                    if log_sink:
-                        log_sink.emit(LogLevel.ERROR, line_str)
-                    yield line_str
+            try:
+                if stdout_fd is not None and stderr_fd is not None:
+                    stdout = await self._open_reader(stdout_fd, transports)
+                    stderr = await self._open_reader(stderr_fd, transports)
+                if config.timeout_seconds:
+                    watchdog = asyncio.create_task(
+                        self._enforce_timeout_async(
+                            process, config.timeout_seconds, expired, transports
+                        )
+                    )
+                if sampler:
+                    sampling = asyncio.create_task(self._sample_async(sampler))
+
+                # Drain both pipes concurrently, yielding lines in arrival order
+                async for line in merge_output_async(
+                    stdout, stderr, self._read_size, decoder_factory=self._decoder_factory
+                ):
+                    if line.stream == STDOUT:
+                        stdout_capture.append(line.text)
+                        if log_sink:
+                            log_sink.emit(LogLevel.INFO, line.text)
+                    else:
+                        stderr_capture.append(line.text)
+                        if log_sink:
+                            log_sink.emit(LogLevel.ERROR, line.text)
+                    if yield_lines:
+                        yield line.text
+
+                # Wait for completion
+                exit_code = await process.wait_async()
+            finally:
+                if watchdog:
+                    watchdog.cancel()
+                if sampling:
+                    sampling.cancel()
+                for transport in transports:
+                    transport.close()
+                for fd in (stdout_fd, stderr_fd)[len(transports) :]:
+                    if fd is not None:
+                        os.close(fd)
+                # Reap the rest of a timed-out group, and never leave the group
+                # running if the caller stopped consuming early
+                if expired.is_set() or process.returncode is None:
+                    process.signal_group(signal.SIGKILL)
+                if process.returncode is None:
+                    await process.wait_async()
+                process.close()
 
-            # Wait for completion
-            exit_code = await process.wait()
             duration = time.time() - start_time
+            timed_out = expired.is_set()
+            if not timed_out:
+                self._note_limit_failure(
+                    config, process, exit_code, captures[1], cgroup, notes, log_sink
+                )
 
             # Determine status
-            if exit_code == 0:
+            if timed_out:
+                status = ExecutionStatus.TIMEOUT
+                if log_sink:
+                    log_sink.emit(
+                        LogLevel.WARNING,
+                        f"Script execution timed out after {config.timeout_seconds} seconds",
+                    )
+            elif exit_code == 0:
                 status = ExecutionStatus.SUCCESS
             else:
                 status = ExecutionStatus.FAILED
@@ -215,14 +479,18 @@ class LocalSubprocessExecutor(ScriptExecutor):
             result = ExecutionResult(
                 status=status,
                 exit_code=exit_code,
-                stdout="\n".join(stdout_lines),
-                stderr="\n".join(stderr_lines),
+                stdout=captures[0].text(),
+                stderr=captures[1].text(),
                 duration_seconds=duration,
-                metadata=config.metadata,
+                metadata=self._result_metadata(config, sampler, notes),
+                stdout_capture=captures[0],
+                stderr_capture=captures[1],
+                resource_usage=process.resource_usage,
             )
 
-            # Upload output files if file provider is available
-            if self._file_provider and config.file_outputs:
+            # Upload output files if file provider is available (skipped for
+            # timed-out runs, whose outputs are incomplete)
+            if self._file_provider and config.file_outputs and not timed_out:
                 await self._upload_output_files_async(config)
 
             yield result
@@ -231,21 +499,436 @@ class LocalSubprocessExecutor(ScriptExecutor):
             raise ScriptExecutionException(
                 f"Python executable not found: {self._python_executable}"
             )
-        except asyncio.TimeoutError:
-            duration = time.time() - start_time
-            raise ScriptExecutionException(
-                f"Script execution timed out after {config.timeout_seconds} seconds",
-                exit_code=None,
-            )
         except Exception as e:
             duration = time.time() - start_time
             raise ScriptExecutionException(f"Async subprocess execution failed: {str(e)}") from e
         finally:
+            if log_flusher:
+                log_flusher.cancel()
+            if log_batch:
+                log_batch.flush()
+            if cgroup:
+                cgroup.remove()
+            if cpus and self._cpu_allocator:
+                self._cpu_allocator.release(cpus)
             # Cleanup staged files
             if self._file_provider:
                 for staged_file in staged_files:
                     self._file_provider.cleanup(staged_file)
 
+    def _new_capture(self) -> SpillingOutputBuffer:
+        """Create a bounded capture buffer for one output stream."""
+        return SpillingOutputBuffer(self._output_memory_budget_bytes, self._spill_directory)
+
+    def _create_output_files(
+        self, config: ScriptConfig, notes: dict[str, Any]
+    ) -> tuple[FileOutputCapture, FileOutputCapture, tuple[int, int]] | None:
+        """Create the files a job writes its output to, if an output directory is set.
+
+        Args:
+            config: Script configuration
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            Tuple of (stdout capture, stderr capture, write fds of both
+            files), or None when output is captured through pipes
+        """
+        if self._output_directory is None:
+            return None
+
+        stem = os.path.join(
+            self._output_directory,
+            f"{Path(config.script_path).stem}-{time.strftime('%Y%m%dT%H%M%S')}"
+            f"-{os.getpid()}-{next(_output_file_ids)}",
+        )
+        stdout, stdout_fd = FileOutputCapture.create(
+            f"{stem}.stdout.log", self._decoder_factory, self._output_tail_bytes
+        )
+        try:
+            stderr, stderr_fd = FileOutputCapture.create(
+                f"{stem}.stderr.log", self._decoder_factory, self._output_tail_bytes
+            )
+        except BaseException:
+            os.close(stdout_fd)
+            raise
+        notes["stdout_path"] = stdout.path
+        notes["stderr_path"] = stderr.path
+        return stdout, stderr, (stdout_fd, stderr_fd)
+
+    def _new_log_batch(
+        self, log_sink: LogSink | None, on_pending: Callable[[], None] | None = None
+    ) -> BatchingLogSink | None:
+        """Wrap a job's log sink so its messages are emitted in batches, if batching is enabled.
+
+        Args:
+            log_sink: The caller's log sink
+            on_pending: Called when a message arrives while none are pending
+
+        Returns:
+            The batching sink, or None if there is no sink or batching is disabled
+        """
+        if log_sink is None or self._log_batch_size <= 1:
+            return None
+        return BatchingLogSink(log_sink, self._log_batch_size, self._log_batch_delay, on_pending)
+
+    async def _flush_logs_async(self, log_batch: BatchingLogSink, pending: asyncio.Event) -> None:
+        """Flush batched log messages on time while a job runs, until cancelled.
+
+        Args:
+            log_batch: The job's batching sink
+            pending: Event set whenever a message arrives while none were pending
+        """
+        while True:
+            await pending.wait()
+            pending.clear()
+            due = log_batch.next_due
+            if due is not None:
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+                log_batch.flush_due()
+
+    def _new_sampler(
+        self, process: SpawnedProcess, cgroup: CgroupSlice | None, log_sink: LogSink | None
+    ) -> ResourceSampler | None:
+        """Create a resource sampler for a job, if sampling is enabled."""
+        if not self._resource_sample_interval:
+            return None
+
+        def on_sample(sample: ResourceSample) -> None:
+            if log_sink:
+                log_sink.emit(LogLevel.DEBUG, "Resource sample", sample.as_metadata())
+
+        return ResourceSampler(
+            process.pid,
+            self._resource_sample_interval,
+            on_sample,
+            cgroup_path=cgroup.path if cgroup else None,
+        )
+
+    def _result_metadata(
+        self, config: ScriptConfig, sampler: ResourceSampler | None, notes: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Build result metadata: the config's metadata plus timeline and execution notes."""
+        if sampler is None and not notes:
+            return config.metadata
+        metadata = dict(config.metadata or {})
+        if sampler is not None:
+            metadata["resource_timeline"] = sampler.timeline()
+        metadata.update(notes)
+        return metadata
+
+    def _create_cgroup(self, config: ScriptConfig, notes: dict[str, Any]) -> CgroupSlice | None:
+        """Create a job's own cgroup if its limits ask for one.
+
+        The script joins the group itself before it starts (see
+        LaunchRequest.cgroup_procs). Failures do not fail the job (its
+        rlimits still apply); the reason is recorded as
+        ``notes["cgroup_error"]``.
+
+        Args:
+            config: Script configuration
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            The job's cgroup slice, or None
+        """
+        limits = config.resource_limits
+        if limits is None or not limits.uses_cgroup:
+            return None
+        if self._cgroup_parent is None:
+            notes["cgroup_error"] = "no cgroup_parent configured"
+            return None
+        try:
+            return CgroupSlice.create(self._cgroup_parent, limits)
+        except OSError as e:
+            notes["cgroup_error"] = str(e)
+            return None
+
+    def _enter_cgroup(
+        self, group: CgroupSlice | None, process: SpawnedProcess, notes: dict[str, Any]
+    ) -> CgroupSlice | None:
+        """Make sure a freshly started job is in its cgroup.
+
+        Moving the process is a no-op if it joined the group before
+        exec, and covers spawners that could not make it join.
+
+        Args:
+            group: The job's cgroup slice, if any
+            process: Freshly started script process
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            The job's cgroup slice, or None if the job is not in one
+        """
+        if group is None:
+            return None
+        if not process.dedicated:
+            group.remove()
+            notes["cgroup_error"] = "not supported for jobs sharing a worker process"
+            return None
+        try:
+            group.add(process.pid)
+        except ProcessLookupError:
+            pass  # Already finished (inside the group, if joining it worked)
+        except OSError as e:
+            group.remove()
+            notes["cgroup_error"] = str(e)
+            return None
+        return group
+
+    def _note_limit_failure(
+        self,
+        config: ScriptConfig,
+        process: SpawnedProcess,
+        exit_code: int,
+        stderr_capture: CapturedOutput,
+        cgroup: CgroupSlice | None,
+        notes: dict[str, Any],
+        log_sink: LogSink | None,
+    ) -> None:
+        """Record ``notes["failure_reason"]`` if the job was stopped by a resource limit."""
+        usage = process.resource_usage
+        reason = limit_failure_reason(
+            config.resource_limits,
+            exit_code,
+            stderr_capture.tail(1),
+            cgroup,
+            usage.cpu_seconds if usage else None,
+        )
+        if reason:
+            notes["failure_reason"] = reason
+            if log_sink:
+                log_sink.emit(LogLevel.WARNING, f"Script stopped by resource limit: {reason}")
+
+    def _acquire_cpus(self, notes: dict[str, Any]) -> CpuAssignment | None:
+        """Reserve CPUs for a job if a CPU allocator is configured.
+
+        Args:
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            The job's CPUs, or None if it runs unpinned
+        """
+        if self._cpu_allocator is None:
+            return None
+        cpus = self._cpu_allocator.acquire()
+        if cpus is None:
+            notes["cpu_affinity"] = None
+        else:
+            notes.update(cpus.as_metadata())
+        return cpus
+
+    def _spawn(
+        self,
+        config: ScriptConfig,
+        env: dict[str, str] | None,
+        cpus: CpuAssignment | None = None,
+        output_fds: tuple[int, int] | None = None,
+        cgroup: CgroupSlice | None = None,
+    ) -> tuple[SpawnedProcess, int | None, int | None]:
+        """Start the script with fresh stdout/stderr pipes (or the given output files).
+
+        Args:
+            config: Script configuration
+            env: Environment for the script (None inherits the parent's)
+            cpus: CPUs to pin the script to, if any
+            output_fds: Files to wire stdout and stderr to instead of pipes;
+                closed here once the script holds its own copies
+            cgroup: cgroup for the script to join before it starts, if any
+
+        Returns:
+            Tuple of (process handle, stdout read fd, stderr read fd); the
+            read fds are None when writing to output files
+        """
+        stdout_read: int | None = None
+        stderr_read: int | None = None
+        if output_fds is None:
+            stdout_read, stdout_write = os.pipe()
+            stderr_read, stderr_write = os.pipe()
+            self._resize_pipe(stdout_read)
+            self._resize_pipe(stderr_read)
+        else:
+            stdout_write, stderr_write = output_fds
+        try:
+            process = self._spawner.spawn(
+                LaunchRequest(
+                    python_executable=self._python_executable,
+                    script_path=config.script_path,
+                    working_directory=config.working_directory,
+                    environment=env,
+                    stdout_fd=stdout_write,
+                    stderr_fd=stderr_write,
+                    code_cache_path=self._code_cache_path(config),
+                    rlimits=rlimit_settings(config.resource_limits),
+                    cpu_affinity=cpus.cpus if cpus else None,
+                    cgroup_procs=cgroup.procs_path if cgroup else None,
+                )
+            )
+        except BaseException:
+            for read_fd in (stdout_read, stderr_read):
+                if read_fd is not None:
+                    os.close(read_fd)
+            raise
+        finally:
+            # The child holds its own copies; ours must go so EOF is seen on exit
+            os.close(stdout_write)
+            os.close(stderr_write)
+        return process, stdout_read, stderr_read
+
+    def _code_cache_path(self, config: ScriptConfig) -> str | None:
+        """Look up the bytecode cache entry for a job's script, if caching is enabled."""
+        if self._bytecode_cache is None:
+            return None
+        # The script path is resolved in the job's working directory, as the interpreter does
+        script = Path(config.working_directory or ".") / config.script_path
+        return self._bytecode_cache.entry_for(str(script), self._python_executable)
+
+    def _resize_pipe(self, fd: int) -> None:
+        """Grow a pipe to hold a full read_size chunk (Linux only, best effort)."""
+        if self._read_size <= 65536 or not hasattr(fcntl, "F_SETPIPE_SZ"):
+            return
+        try:
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, self._read_size)
+        except OSError:
+            # Above /proc/sys/fs/pipe-max-size for unprivileged users
+            pass
+
+    async def _open_reader(
+        self, fd: int, transports: list[asyncio.ReadTransport]
+    ) -> asyncio.StreamReader:
+        """Attach an asyncio stream reader to a pipe read end.
+
+        Args:
+            fd: Pipe read descriptor (owned by the transport afterwards)
+            transports: List the created transport is appended to
+
+        Returns:
+            StreamReader fed from the pipe
+        """
+        loop = asyncio.get_running_loop()
+        # The reader pauses the pipe once it buffers twice its limit
+        reader = asyncio.StreamReader(limit=max(self._read_size, 65536))
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), open(fd, "rb", buffering=0)
+        )
+        transports.append(transport)
+        return reader
+
+    def _wait_for_exit(
+        self,
+        process: SpawnedProcess,
+        pump: OutputPump,
+        deadline: float | None,
+        sampler: ResourceSampler | None = None,
+        log_batch: BatchingLogSink | None = None,
+    ) -> bool:
+        """Drain output and wait for the process to exit.
+
+        Args:
+            process: Running child process
+            pump: Output pump attached to the child's pipes
+            deadline: Optional time.monotonic() value after which the run times out
+            sampler: Optional resource sampler, run whenever a sample is due
+            log_batch: Optional batching log sink, flushed whenever its batch is due
+
+        Returns:
+            True if the process exited before the deadline, False otherwise
+        """
+        if log_batch:
+            # A message arriving mid-run must cut the wait short so it is flushed on time
+            log_batch.on_pending = pump.stop
+        try:
+            drained = False
+            while True:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    return False
+                if sampler and now >= sampler.next_due:
+                    sampler.sample()
+                if log_batch:
+                    log_batch.flush_due(now)
+
+                # Wake up for whichever comes first: the deadline, the next sample or a log flush
+                wakes = [deadline]
+                if sampler:
+                    wakes.append(sampler.next_due)
+                if log_batch:
+                    wakes.append(log_batch.next_due)
+                wake = min((t for t in wakes if t is not None), default=None)
+
+                if not drained:
+                    drained = pump.run(wake)
+                    continue
+                try:
+                    process.wait(timeout=None if wake is None else max(0.0, wake - now))
+                except subprocess.TimeoutExpired:
+                    continue
+                return True
+        finally:
+            if log_batch:
+                log_batch.on_pending = None
+
+    def _terminate(self, process: SpawnedProcess, pump: OutputPump) -> None:
+        """Terminate a timed-out process group (SIGTERM, grace period, then SIGKILL).
+
+        Output keeps being drained during the grace period so shutdown
+        handlers cannot block on a full pipe.
+
+        Args:
+            process: Timed-out child process (session leader)
+            pump: Output pump attached to the child's pipes
+        """
+        grace_deadline = time.monotonic() + self._kill_grace_seconds
+        process.signal_group(signal.SIGTERM)
+
+        if pump.run(grace_deadline):
+            try:
+                process.wait(timeout=max(0.0, grace_deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                pass
+
+        # Kill whatever is left, including grandchildren that ignored SIGTERM
+        process.signal_group(signal.SIGKILL)
+        pump.run(time.monotonic() + _POST_KILL_DRAIN_SECONDS)
+
+    async def _sample_async(self, sampler: ResourceSampler) -> None:
+        """Take resource samples on the event loop until cancelled.
+
+        Args:
+            sampler: Sampler for the running job
+        """
+        while True:
+            await asyncio.sleep(max(0.0, sampler.next_due - time.monotonic()))
+            sampler.sample()
+
+    async def _enforce_timeout_async(
+        self,
+        process: SpawnedProcess,
+        timeout: float,
+        expired: asyncio.Event,
+        transports: list[asyncio.ReadTransport],
+    ) -> None:
+        """Terminate the process group once the timeout elapses.
+
+        Args:
+            process: Running child process (session leader)
+            timeout: Seconds to allow before terminating
+            expired: Event set when the timeout fires
+            transports: Pipe transports, closed after a bounded post-kill drain
+        """
+        await asyncio.sleep(timeout)
+        expired.set()
+        process.signal_group(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait_async(), self._kill_grace_seconds)
+        except asyncio.TimeoutError:
+            pass
+        process.signal_group(signal.SIGKILL)
+
+        # A descendant that escaped the group may hold the pipes open; stop waiting for it
+        await asyncio.sleep(_POST_KILL_DRAIN_SECONDS)
+        for transport in transports:
+            transport.close()
+
     def _stage_files(self, config: ScriptConfig, log_sink: LogSink | None = None) -> list[Path]:
         """Stage required files before execution.
 
@@ -415,17 +1098,30 @@ class LocalSubprocessExecutor(ScriptExecutor):
     def _build_environment(self, config: ScriptConfig) -> dict[str, str] | None:
         """Build environment variables for subprocess.
 
+        Without an explicit base environment, jobs without overrides simply
+        inherit the parent's environment, and overrides are overlaid on a
+        cached snapshot of os.environ instead of a fresh copy per job. The
+        snapshot is taken again whenever os.environ no longer matches it,
+        so both kinds of job see the same environment. Spawners must treat
+        the returned dictionary as read-only.
+
         Args:
             config: Script configuration
 
         Returns:
             Environment dictionary or None to inherit from parent
         """
-        if config.environment_variables:
-            import os
-
-            env = os.environ.copy()
-            env.update(config.environment_variables)
-            return env
-        return None
+        overrides = config.environment_variables
+        if self._inherits_environment and not overrides:
+            return None
+
+        # The real environment, even while in-process scripts have os.environ routed
+        environ = real_environ()
+        # Compare os.environ's encoded storage: cheap, unlike decoding a fresh copy
+        source = getattr(environ, "_data", environ)
+        base = self._base_environment
+        if base is None or (self._inherits_environment and source != self._environment_source):
+            self._environment_source = dict(source)
+            base = self._base_environment = dict(environ)
+        return base | overrides if overrides else base
 
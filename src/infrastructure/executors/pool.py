@@ -0,0 +1,224 @@
+"""Pooled, recycled interpreter spawner for LocalSubprocessExecutor."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import threading
+from types import SimpleNamespace
+from typing import Iterable
+
+from .process import resource_usage_from_rusage
+from .script_host import MessageBuffer, send_message, start_host
+from .spawn import LaunchRequest, ProcessSpawner, SpawnedProcess, wake_future
+
+
+class _Worker:
+    """A long-lived interpreter serving one job at a time."""
+
+    def __init__(self, process: subprocess.Popen[bytes], control: socket.socket) -> None:
+        self.process = process
+        self.control = control
+        self.jobs = 0
+
+    def stop(self) -> None:
+        """Close the control socket and reap the worker."""
+        self.control.close()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class PooledProcess(SpawnedProcess):
+    """Handle to a job running inside a pooled worker interpreter.
+
+    The pid is the worker's, so timeout enforcement terminates the whole
+    worker (which is then replaced). The job is finished when the worker
+    reports its exit code; if the worker dies instead (``os._exit``, a
+    crash, a kill), its own exit status becomes the job's return code.
+    Resource usage is the worker's usage delta over the job, with the
+    worker's peak RSS standing in for the job's.
+    """
+
+    dedicated = False
+
+    def __init__(self, worker: _Worker, pool: "InterpreterPoolSpawner", script_path: str) -> None:
+        """Initialize the handle.
+
+        Args:
+            worker: Worker running the job
+            pool: Pool the worker is returned to when the job finishes
+            script_path: Script path (used in timeout errors)
+        """
+        super().__init__(worker.process.pid)
+        self._worker = worker
+        self._pool = pool
+        self._script_path = script_path
+        self._buffer = MessageBuffer()
+
+    def signal_group(self, sig: int) -> None:
+        """Signal the worker's group, unless the job already finished and the worker moved on."""
+        if self.returncode is None:
+            super().signal_group(sig)
+
+    def poll(self) -> int | None:
+        """Check whether the job has finished without blocking."""
+        if self.returncode is None:
+            self._receive(blocking=False)
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the worker to report the job's exit code."""
+        if self.returncode is None:
+            self._worker.control.settimeout(timeout)
+            try:
+                while self.returncode is None:
+                    self._receive(blocking=True)
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(self._script_path, timeout)  # type: ignore[arg-type]
+        return self.returncode
+
+    async def wait_async(self) -> int:
+        """Wait for the job to finish by watching the control socket on the event loop."""
+        loop = asyncio.get_running_loop()
+        fd = self._worker.control.fileno()
+
+        while self.returncode is None:
+            readable: asyncio.Future[None] = loop.create_future()
+            loop.add_reader(fd, wake_future, readable)
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+            self.poll()
+        return self.returncode
+
+    def _receive(self, blocking: bool) -> None:
+        """Read from the control socket and finish the job once it reports."""
+        if not blocking:
+            self._worker.control.setblocking(False)
+        try:
+            data = self._worker.control.recv(4096)
+        except BlockingIOError:
+            return
+
+        if not data:
+            # The worker died mid-job: its exit status is the job's
+            self.returncode = self._worker.process.wait()
+            self._pool._release(self._worker, healthy=False)
+            return
+
+        for message in self._buffer.feed(data):
+            self.resource_usage = resource_usage_from_rusage(SimpleNamespace(**message["rusage"]))
+            self.returncode = message["exit_code"]
+            self._pool._release(self._worker, healthy=True, rss_bytes=message["rss_bytes"])
+
+
+class InterpreterPoolSpawner(ProcessSpawner):
+    """Runs scripts in a pool of persistent, recycled worker interpreters.
+
+    Each worker executes successive scripts via ``runpy`` in a fresh
+    ``__main__`` namespace, so interpreter start-up (and importing
+    ``preload_modules``) is paid once per worker rather than once per job,
+    while scripts still run in a separate process from the executor.
+    Workers are recycled after ``max_jobs_per_worker`` jobs or once their
+    RSS exceeds ``max_rss_bytes`` (like gunicorn's ``max_requests``), and
+    replaced whenever a job kills or crashes its worker.
+
+    At most ``size`` idle workers are kept warm. When every worker is busy
+    a temporary worker is started for the job instead of blocking, so
+    callers on an event loop are never stalled by the pool.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_jobs_per_worker: int | None = 1000,
+        max_rss_bytes: int | None = None,
+        preload_modules: Iterable[str] = (),
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Number of warm worker interpreters to keep
+            max_jobs_per_worker: Recycle a worker after this many jobs (None: never)
+            max_rss_bytes: Recycle a worker whose RSS exceeds this after a job (None: never)
+            preload_modules: Modules every worker imports once at start-up
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._size = size
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._max_rss_bytes = max_rss_bytes
+        self._preload_modules = list(preload_modules)
+        self._lock = threading.Lock()
+        self._idle: list[_Worker] = []
+        self._closed = False
+
+    def spawn(self, request: LaunchRequest) -> SpawnedProcess:
+        """Hand the script to an idle worker, starting one if necessary."""
+        worker = self._acquire(request.python_executable)
+        try:
+            socket.send_fds(worker.control, [b"J"], [request.stdout_fd, request.stderr_fd])
+            send_message(
+                worker.control,
+                {
+                    "script_path": request.script_path,
+                    "working_directory": request.working_directory,
+                    "code_cache_path": request.code_cache_path,
+                    "rlimits": request.rlimits,
+                    "cpu_affinity": request.cpu_affinity,
+                    "environment": (
+                        request.environment if request.environment is not None else dict(os.environ)
+                    ),
+                },
+            )
+        except BaseException:
+            self._release(worker, healthy=False)
+            raise
+
+        worker.jobs += 1
+        return PooledProcess(worker, self, request.script_path)
+
+    def close(self) -> None:
+        """Stop all idle workers; busy workers are stopped when their job ends."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def _acquire(self, python_executable: str) -> _Worker:
+        """Take an idle, live worker or start a new one."""
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.poll() is None:
+                    return worker
+                worker.control.close()
+
+        process, control = start_host(python_executable, "worker", self._preload_modules)
+        return _Worker(process, control)
+
+    def _release(self, worker: _Worker, healthy: bool, rss_bytes: int = 0) -> None:
+        """Return a worker after its job, recycling it if it is due."""
+        worker.control.setblocking(True)
+        recycle = (
+            not healthy
+            or (self._max_jobs_per_worker is not None and worker.jobs >= self._max_jobs_per_worker)
+            or (self._max_rss_bytes is not None and rss_bytes > self._max_rss_bytes)
+        )
+
+        with self._lock:
+            if not recycle and not self._closed and len(self._idle) < self._size:
+                self._idle.append(worker)
+                return
+
+        if healthy:
+            worker.stop()
+        else:
+            worker.control.close()
+            worker.process.kill()
+            worker.process.wait()
@@ -0,0 +1,460 @@
+"""Pool of worker processes running warm LambdaExecutors."""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from ...domain import (
+    BatchStats,
+    ExecutionResult,
+    ExecutionStatus,
+    FileProvider,
+    LogLevel,
+    LogRecord,
+    LogSink,
+    ScriptConfig,
+    ScriptExecutionException,
+    ScriptExecutor,
+)
+from .inprocess import LineStream
+from .lambda_exec import LambdaExecutor, _ForwardingLogSink
+from .script_host import current_rss
+from .spawn import wake_future
+
+
+def _dumps(message: tuple[Any, ...]) -> bytes:
+    """Serialize a protocol message."""
+    return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _worker_main(conn: Connection, options: dict[str, Any]) -> None:
+    """Serve jobs with a warm LambdaExecutor until the connection closes.
+
+    Requests are pickled ``(config, stream)`` tuples. With ``stream`` the
+    worker sends ``("out", lines)``, ``("err", lines)`` and ``("log",
+    records)`` messages while the job runs; every job ends with
+    ``("result", result, rss_bytes)`` or ``("error", message, rss_bytes)``.
+
+    Args:
+        conn: Worker end of the pipe to the executor
+        options: LambdaExecutor keyword arguments
+    """
+    # Interrupts are the executor's business; it stops workers by closing their pipe
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    executor = LambdaExecutor(**options)
+    conn.send_bytes(_dumps(("ready", current_rss())))
+
+    def send(*message: Any) -> None:
+        conn.send_bytes(_dumps(message))
+
+    while True:
+        try:
+            config, stream = pickle.loads(conn.recv_bytes())
+        except EOFError:
+            break
+        streams = None
+        log_sink = None
+        if stream:
+            streams = (
+                LineStream(functools.partial(send, "out")),
+                LineStream(functools.partial(send, "err")),
+            )
+            log_sink = _ForwardingLogSink(lambda records, output: send("log", records))
+        try:
+            result = executor._execute(config, log_sink, streams)
+        except Exception as e:
+            send("error", str(e), current_rss())
+        else:
+            send("result", result, current_rss())
+
+
+class _Worker:
+    """A worker process serving one job at a time."""
+
+    def __init__(self, process: BaseProcess, conn: Connection, baseline_rss: int) -> None:
+        self.process = process
+        self.conn = conn
+        self.baseline_rss = baseline_rss  # RSS once warm, before the first job
+        self.jobs = 0
+
+    def stop(self) -> None:
+        """Close the pipe (the worker exits at EOF) and reap the worker."""
+        self.conn.close()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+
+    def kill(self) -> None:
+        """Kill and reap the worker."""
+        self.conn.close()
+        self.process.kill()
+        self.process.join()
+
+
+class _Job:
+    """Executor-side state of one job running in a worker."""
+
+    def __init__(self, config: ScriptConfig, log_sink: LogSink | None) -> None:
+        self.config = config
+        self.log_sink = log_sink
+        self.start_time = time.time()
+        self.output: dict[str, list[str]] = {"out": [], "err": []}
+        self.result: ExecutionResult | None = None
+        self.finished = False  # The worker reported back and can take the next job
+        self.rss_bytes = 0
+
+    def handle(self, data: bytes) -> list[str]:
+        """Process one message from the worker.
+
+        Args:
+            data: Serialized message
+
+        Returns:
+            Output lines the message carried
+
+        Raises:
+            ScriptExecutionException: If the worker reports that execution failed
+        """
+        kind, *payload = pickle.loads(data)
+        if kind in self.output:
+            lines: list[str] = payload[0]
+            self.output[kind].extend(lines)
+            if self.log_sink:
+                level = LogLevel.INFO if kind == "out" else LogLevel.ERROR
+                self.log_sink.emit_batch([LogRecord(level, line) for line in lines])
+            return lines
+        if kind == "log":
+            if self.log_sink:
+                self.log_sink.emit_batch(payload[0])
+            return []
+
+        self.finished = True
+        self.rss_bytes = payload[1]
+        if kind == "error":
+            raise ScriptExecutionException(payload[0])
+        self.result = payload[0]
+        return []
+
+    def worker_died(self, exit_code: int | None) -> ExecutionResult:
+        """Finish the job as FAILED because its worker exited mid-job (os._exit, crash, kill)."""
+        stderr = "\n".join(self.output["err"] + [f"Worker process exited with code {exit_code}"])
+        self.result = ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            exit_code=exit_code,
+            stdout="\n".join(self.output["out"]),
+            stderr=stderr + "\n",
+            duration_seconds=time.time() - self.start_time,
+            metadata=self.config.metadata,
+        )
+        return self.result
+
+
+class PooledInProcessExecutor(ScriptExecutor):
+    """Runs scripts in a pool of worker processes, each with a warm LambdaExecutor.
+
+    Scripts run in-process inside the workers, so they keep LambdaExecutor's
+    warm imports, compiled-script cache and handler mode, while the pool
+    spreads CPU-bound jobs across cores. Configs and results travel over
+    pipes as pickles; output is only streamed back while a log sink or
+    ``execute_async`` consumes it. Workers are recycled after
+    ``max_jobs_per_worker`` jobs or once their RSS has grown by more than
+    ``max_rss_growth_bytes`` since they became ready, and replaced when a
+    job kills them.
+
+    At most ``size`` workers exist at a time. When every worker is busy,
+    a job waits for the next one to become idle (or to be replaced), and
+    ``execute_many`` runs at most ``size`` jobs at once. Workers are
+    started with multiprocessing's ``spawn`` method by default, so the
+    program's main module must be importable without side effects
+    (``if __name__ == "__main__":``), and the file provider must be
+    picklable.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_jobs_per_worker: int | None = 1000,
+        max_rss_growth_bytes: int | None = None,
+        file_provider: FileProvider | None = None,
+        temp_directory: str = "/tmp",
+        preload_modules: Iterable[str] = (),
+        reset_state: bool = False,
+        start_method: str = "spawn",
+    ) -> None:
+        """Initialize the pool (workers are started on demand).
+
+        Args:
+            size: Number of warm workers to keep (default: the number of CPUs)
+            max_jobs_per_worker: Recycle a worker after this many jobs (None: never)
+            max_rss_growth_bytes: Recycle a worker whose RSS grew by more than
+                this over its jobs (None: never)
+            file_provider: Optional file provider for staging required files
+            temp_directory: Directory for staging files in the workers
+            preload_modules: Modules every worker imports once at start-up
+            reset_state: Whether workers roll back script state after each
+                job (see LambdaExecutor)
+            start_method: multiprocessing start method for workers
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        size = size if size is not None else os.cpu_count() or 1
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._size = size
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._max_rss_growth_bytes = max_rss_growth_bytes
+        self._context = multiprocessing.get_context(start_method)
+        self._worker_options = {
+            "file_provider": file_provider,
+            "temp_directory": temp_directory,
+            "preload_modules": list(preload_modules),
+            "reset_state": reset_state,
+        }
+        self._lock = threading.Lock()
+        # Signalled whenever a worker becomes idle or a worker slot frees up
+        self._available = threading.Condition(self._lock)
+        self._idle: list[_Worker] = []
+        self._workers = 0  # Live workers, idle or busy (at most size)
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop all idle workers; busy workers are stopped when their job ends."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._retire(worker, kill=False)
+
+    def execute(
+        self,
+        config: ScriptConfig,
+        log_sink: LogSink | None = None,
+    ) -> ExecutionResult:
+        """Execute a Python script in a pooled worker.
+
+        Args:
+            config: Script execution configuration
+            log_sink: Optional log sink for streaming logs
+
+        Returns:
+            ExecutionResult containing execution outcome
+
+        Raises:
+            ScriptExecutionException: If execution fails
+        """
+        worker = self._acquire()
+        job = _Job(config, log_sink)
+        try:
+            worker.conn.send_bytes(_dumps((config, log_sink is not None)))
+            while True:
+                try:
+                    data = worker.conn.recv_bytes()
+                except EOFError:
+                    worker.process.join()
+                    return job.worker_died(worker.process.exitcode)
+                job.handle(data)
+                if job.result is not None:
+                    return job.result
+        finally:
+            self._release(worker, job)
+
+    async def execute_async(
+        self,
+        config: ScriptConfig,
+        log_sink: LogSink | None = None,
+    ) -> AsyncIterator[ExecutionResult | str]:
+        """Execute a Python script in a pooled worker, streaming its output.
+
+        Args:
+            config: Script execution configuration
+            log_sink: Optional log sink for streaming logs
+
+        Yields:
+            Either log messages (str) or the final ExecutionResult
+
+        Raises:
+            ScriptExecutionException: If execution fails
+        """
+        async for item in self._run_async(config, log_sink, stream=True):
+            yield item
+
+    def execute_many(
+        self,
+        configs: Iterable[ScriptConfig] | AsyncIterable[ScriptConfig],
+        max_parallel: int = 8,
+        log_sink: LogSink | None = None,
+    ) -> AsyncIterator[ExecutionResult | BatchStats]:
+        """Execute many scripts in pooled workers, yielding results as they complete.
+
+        Up to ``min(max_parallel, size)`` jobs run at the same time, one per
+        worker. Configs are pulled lazily, one per job.
+
+        Args:
+            configs: Script configurations to run
+            max_parallel: Maximum number of jobs running at once
+            log_sink: Optional log sink shared by all jobs
+
+        Yields:
+            One ExecutionResult per config, then a final BatchStats
+        """
+        return super().execute_many(
+            configs, max_parallel=min(max_parallel, self._size), log_sink=log_sink
+        )
+
+    async def _run_batch_job(
+        self, config: ScriptConfig, log_sink: LogSink | None
+    ) -> ExecutionResult:
+        """Run one execute_many job, streaming output only if there is a log sink."""
+        async for item in self._run_async(config, log_sink, stream=log_sink is not None):
+            if isinstance(item, ExecutionResult):
+                return item
+        raise ScriptExecutionException(f"No result produced for {config.script_path}")
+
+    async def _run_async(
+        self, config: ScriptConfig, log_sink: LogSink | None, stream: bool
+    ) -> AsyncIterator[ExecutionResult | str]:
+        """Run a job by watching the worker's pipe on the event loop.
+
+        Yields:
+            Output lines (if streaming), then the ExecutionResult
+        """
+        loop = asyncio.get_running_loop()
+        # Waiting for or starting a worker takes a while; keep the loop responsive meanwhile
+        acquiring = loop.run_in_executor(None, self._acquire)
+        try:
+            worker = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The worker still arrives; hand it to the next job
+            acquiring.add_done_callback(self._put_back_acquired)
+            raise
+        job = _Job(config, log_sink)
+        try:
+            worker.conn.send_bytes(_dumps((config, stream)))
+            fd = worker.conn.fileno()
+            while job.result is None:
+                readable: asyncio.Future[None] = loop.create_future()
+                loop.add_reader(fd, wake_future, readable)
+                try:
+                    await readable
+                finally:
+                    loop.remove_reader(fd)
+
+                while job.result is None and worker.conn.poll():
+                    try:
+                        data = worker.conn.recv_bytes()
+                    except EOFError:
+                        worker.process.join()
+                        job.worker_died(worker.process.exitcode)
+                        break
+                    for line in job.handle(data):
+                        yield line
+            yield job.result
+        finally:
+            self._release(worker, job)
+
+    def _acquire(self) -> _Worker:
+        """Take an idle, live worker, start one if there are fewer than ``size``, or wait.
+
+        Raises:
+            ChildProcessError: If a new worker exits during start-up
+        """
+        with self._available:
+            while True:
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.process.is_alive():
+                        return worker
+                    worker.conn.close()
+                    self._workers -= 1
+                if self._workers < self._size:
+                    self._workers += 1
+                    break
+                self._available.wait()
+
+        try:
+            return self._start_worker()
+        except BaseException:
+            with self._available:
+                self._workers -= 1
+                self._available.notify()
+            raise
+
+    def _start_worker(self) -> _Worker:
+        """Start a worker and wait until it is warm.
+
+        Raises:
+            ChildProcessError: If the worker exits during start-up
+        """
+        conn, worker_conn = self._context.Pipe()
+        process = self._context.Process(  # type: ignore[attr-defined]
+            target=_worker_main,
+            args=(worker_conn, self._worker_options),
+            name="jobflow-inprocess-worker",
+            daemon=True,
+        )
+        try:
+            process.start()
+        finally:
+            worker_conn.close()
+        try:
+            # Block until preloading has finished so the first job gets a warm worker
+            _, rss_bytes = pickle.loads(conn.recv_bytes())
+        except EOFError:
+            conn.close()
+            process.join()
+            raise ChildProcessError(
+                f"In-process worker exited during start-up (exit code {process.exitcode})"
+            ) from None
+        return _Worker(process, conn, rss_bytes)
+
+    def _release(self, worker: _Worker, job: _Job) -> None:
+        """Return a worker after its job, recycling it if it is due."""
+        worker.jobs += 1
+        recycle = (
+            not job.finished
+            or (self._max_jobs_per_worker is not None and worker.jobs >= self._max_jobs_per_worker)
+            or (
+                self._max_rss_growth_bytes is not None
+                and job.rss_bytes - worker.baseline_rss > self._max_rss_growth_bytes
+            )
+        )
+
+        if recycle:
+            self._retire(worker, kill=not job.finished)
+        else:
+            self._put_back(worker)
+
+    def _put_back(self, worker: _Worker) -> None:
+        """Make a worker idle for the next job (or stop it once the pool is closed)."""
+        with self._available:
+            if not self._closed:
+                self._idle.append(worker)
+                self._available.notify()
+                return
+        self._retire(worker, kill=False)
+
+    def _put_back_acquired(self, acquiring: "asyncio.Future[_Worker]") -> None:
+        """Put back a worker acquired for a job that was cancelled meanwhile."""
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self._put_back(acquiring.result())
+
+    def _retire(self, worker: _Worker, kill: bool) -> None:
+        """Stop (or kill) a worker and free its slot for a new one."""
+        try:
+            if kill:
+                worker.kill()
+            else:
+                worker.stop()
+        finally:
+            with self._available:
+                self._workers -= 1
+                self._available.notify()
@@ -0,0 +1,48 @@
+"""Process lifecycle helpers for subprocess executors."""
+
+import os
+import sys
+from typing import Any
+
+from ...domain import ResourceUsage
+
+# ru_maxrss is reported in KiB on Linux but in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def signal_process_group(pgid: int, sig: int) -> None:
+    """Send a signal to every process in a process group.
+
+    Children are started in their own session, so the group id equals the
+    leader's pid and the signal also reaches any grandchildren the script
+    spawned. A group that has already exited is ignored.
+
+    Args:
+        pgid: Process group id (the pid of the session leader)
+        sig: Signal number to send
+    """
+    try:
+        os.killpg(pgid, sig)
+    except (ProcessLookupError, PermissionError):
+        # Group already gone (PermissionError is reported for zombie groups on some platforms)
+        pass
+
+
+def resource_usage_from_rusage(rusage: Any) -> ResourceUsage:
+    """Convert a resource.struct_rusage (or an object with ``ru_*`` attributes).
+
+    Args:
+        rusage: Result of os.wait4 / resource.getrusage, or an equivalent namespace
+
+    Returns:
+        ResourceUsage with the maximum RSS normalized to bytes
+    """
+    return ResourceUsage(
+        user_cpu_seconds=rusage.ru_utime,
+        system_cpu_seconds=rusage.ru_stime,
+        max_rss_bytes=rusage.ru_maxrss * _MAXRSS_UNIT,
+        major_page_faults=rusage.ru_majflt,
+        minor_page_faults=rusage.ru_minflt,
+        voluntary_context_switches=rusage.ru_nvcsw,
+        involuntary_context_switches=rusage.ru_nivcsw,
+    )
@@ -0,0 +1,211 @@
+"""Live resource sampling of running jobs via /proc."""
+
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+_PROC = "/proc"
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """Point-in-time resource readings for a job's process tree."""
+
+    elapsed_seconds: float  # Time since sampling started
+    cpu_percent: float  # CPU use since the previous sample (100 = one core)
+    rss_bytes: int  # Summed resident set size
+    read_bytes: int  # Cumulative storage reads (/proc/<pid>/io), live processes only
+    write_bytes: int  # Cumulative storage writes (/proc/<pid>/io), live processes only
+    open_fds: int  # Summed open file descriptors
+    processes: int  # Number of processes in the tree
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the sample as a plain dictionary."""
+        return asdict(self)
+
+    def as_metadata(self) -> dict[str, str]:
+        """Return the sample as LogSink metadata (string values)."""
+        return {key: str(value) for key, value in asdict(self).items()}
+
+
+class ResourceSampler:
+    """Samples CPU, memory, I/O and descriptor usage of a job's process tree.
+
+    The tree is the job's process and its descendants, found by following
+    ``/proc/<pid>/task/<tid>/children`` down from the job's process, so
+    only the job's own processes are read. Descendants whose parent
+    exited were re-parented away from the tree and are no longer counted.
+    Jobs in their own cgroup are sampled from the group's
+    ``cgroup.procs`` instead, which covers those too. Kernels without
+    ``children`` files fall back to scanning /proc for the job's session
+    (scripts are started as session leaders). The sampler does no
+    scheduling of its own: the executor calls
+    ``sample`` whenever ``next_due`` passes, from the same thread that
+    handles output, so log sinks are never called concurrently. On systems
+    without /proc, sampling is a no-op.
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        interval_seconds: float,
+        on_sample: Callable[[ResourceSample], None] | None = None,
+        cgroup_path: Path | None = None,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            pid: Pid of the job's process (the leader of its session)
+            interval_seconds: Time between samples
+            on_sample: Optional callback invoked with every sample
+            cgroup_path: Directory of the job's own cgroup, if it has one
+        """
+        self._pid = pid
+        self._cgroup_procs = cgroup_path / "cgroup.procs" if cgroup_path else None
+        self._interval = interval_seconds
+        self._on_sample = on_sample
+        self._enabled = os.path.isdir(_PROC)
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if self._enabled else 100
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if self._enabled else 4096
+        # Needs CONFIG_PROC_CHILDREN
+        self._children_supported = os.path.exists(f"{_PROC}/thread-self/children")
+        self._started = time.monotonic()
+        self._last_time = self._started
+        self._last_ticks: dict[int, int] = {}
+        self._samples: list[ResourceSample] = []
+        self.next_due = self._started + interval_seconds
+
+    @property
+    def samples(self) -> list[ResourceSample]:
+        """Samples taken so far."""
+        return list(self._samples)
+
+    def timeline(self) -> list[dict[str, Any]]:
+        """Return the samples as dictionaries (for ExecutionResult metadata)."""
+        return [sample.as_dict() for sample in self._samples]
+
+    def sample(self) -> ResourceSample | None:
+        """Take one sample now and schedule the next one.
+
+        Returns:
+            The sample, or None if the tree could not be read
+        """
+        now = time.monotonic()
+        self.next_due = now + self._interval
+        if not self._enabled:
+            return None
+
+        ticks: dict[int, int] = {}
+        rss_pages = read_bytes = write_bytes = open_fds = 0
+
+        for pid in self._tree_pids():
+            stat = _read_stat(pid)
+            if stat is None:
+                continue
+            ticks[pid] = int(stat[11]) + int(stat[12])  # utime + stime
+            rss_pages += int(stat[21])
+            io = _read_io(pid)
+            read_bytes += io.get("read_bytes", 0)
+            write_bytes += io.get("write_bytes", 0)
+            open_fds += _count_fds(pid)
+
+        # Only processes seen in both samples contribute a reliable delta;
+        # new processes contribute everything they used so far
+        used = sum(max(0, value - self._last_ticks.get(pid, 0)) for pid, value in ticks.items())
+        wall = max(now - self._last_time, 1e-6)
+        cpu_percent = used / self._clock_ticks / wall * 100
+        self._last_ticks = ticks
+        self._last_time = now
+
+        sample = ResourceSample(
+            elapsed_seconds=round(now - self._started, 3),
+            cpu_percent=round(cpu_percent, 1),
+            rss_bytes=rss_pages * self._page_size,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            open_fds=open_fds,
+            processes=len(ticks),
+        )
+        self._samples.append(sample)
+        if self._on_sample:
+            self._on_sample(sample)
+        return sample
+
+    def _tree_pids(self) -> list[int]:
+        """Find every live process of the job."""
+        if self._cgroup_procs is not None:
+            try:
+                return [int(pid) for pid in self._cgroup_procs.read_text().split()]
+            except OSError:
+                pass  # The group is gone; walk the tree instead
+        if not self._children_supported:
+            return self._session_pids()
+
+        pids: list[int] = []
+        pending = [self._pid]
+        while pending:
+            pid = pending.pop()
+            try:
+                tasks = os.listdir(f"{_PROC}/{pid}/task")
+            except OSError:
+                continue  # Exited
+            pids.append(pid)
+            # Children are listed per thread: the one that forked them
+            for tid in tasks:
+                try:
+                    with open(f"{_PROC}/{pid}/task/{tid}/children", "rb") as children_file:
+                        pending.extend(int(child) for child in children_file.read().split())
+                except OSError:
+                    continue
+        return pids
+
+    def _session_pids(self) -> list[int]:
+        """Find every live process in the job's session (scans all of /proc)."""
+        pids: list[int] = []
+        try:
+            entries = os.listdir(_PROC)
+        except OSError:
+            return pids
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            stat = _read_stat(int(entry))
+            if stat is not None and int(stat[3]) == self._pid:
+                pids.append(int(entry))
+        return pids
+
+
+def _read_stat(pid: int) -> list[str] | None:
+    """Read /proc/<pid>/stat fields after the command name (state is index 0)."""
+    try:
+        with open(f"{_PROC}/{pid}/stat", "rb") as stat_file:
+            data = stat_file.read()
+    except OSError:
+        return None
+    # The command name may contain spaces and parentheses; fields follow the last ")"
+    return data[data.rfind(b")") + 2 :].decode("ascii", "replace").split()
+
+
+def _read_io(pid: int) -> dict[str, int]:
+    """Read /proc/<pid>/io counters (empty if not permitted)."""
+    try:
+        with open(f"{_PROC}/{pid}/io") as io_file:
+            lines = io_file.read().splitlines()
+    except OSError:
+        return {}
+    counters = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        if value.strip().isdigit():
+            counters[key] = int(value)
+    return counters
+
+
+def _count_fds(pid: int) -> int:
+    """Count open file descriptors of a process (0 if not permitted)."""
+    try:
+        return len(os.listdir(f"{_PROC}/{pid}/fd"))
+    except OSError:
+        return 0
@@ -0,0 +1,500 @@
+"""Entry points for long-lived interpreters that host script executions.
+
+This file is run directly by a Python interpreter, for example
+``python script_host.py zygote <control-fd> [module ...]``, so it must only
+depend on the standard library. Executor-side code imports the start-up
+and message helpers from here to speak the same protocol.
+"""
+
+import importlib
+import json
+import math
+import os
+import resource
+import runpy
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import traceback
+from pathlib import Path
+from typing import Any
+
+try:
+    from .bytecode_main import load_code, run_main
+except ImportError:
+    # Run directly as a script: bytecode_main.py sits next to this file on sys.path[0]
+    from bytecode_main import load_code, run_main  # type: ignore[no-redef,import-not-found]
+
+_HEADER = struct.Struct("!I")
+
+
+def start_host(
+    python_executable: str, mode: str, modules: list[str]
+) -> tuple["subprocess.Popen[bytes]", socket.socket]:
+    """Start a hosting interpreter and wait until it has preloaded its modules.
+
+    The host runs in its own session with stdin and stdout on /dev/null
+    (stderr is inherited so preload failures stay visible).
+
+    Args:
+        python_executable: Interpreter to run the host with
+        mode: Host mode ("zygote" or "worker")
+        modules: Modules the host imports before serving requests
+
+    Returns:
+        Tuple of (host process, connected control socket)
+
+    Raises:
+        ChildProcessError: If the host exits during start-up
+    """
+    control, remote = socket.socketpair()
+    try:
+        process = subprocess.Popen(
+            [python_executable, str(Path(__file__)), mode, str(remote.fileno()), *modules],
+            pass_fds=(remote.fileno(),),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except BaseException:
+        control.close()
+        raise
+    finally:
+        remote.close()
+
+    # Block until preloading has finished so the first job gets a warm host
+    if control.recv(1) != b"R":
+        control.close()
+        process.wait()
+        raise ChildProcessError(f"Script host ({mode}) exited during start-up")
+    return process, control
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    """Send a length-prefixed JSON message.
+
+    Args:
+        sock: Connected stream socket
+        message: JSON-serializable dictionary
+    """
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any] | None:
+    """Receive a length-prefixed JSON message (blocking).
+
+    Args:
+        sock: Connected stream socket
+
+    Returns:
+        The decoded message, or None if the peer closed the connection
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    payload = _recv_exact(sock, _HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+    message: dict[str, Any] = json.loads(payload)
+    return message
+
+
+class MessageBuffer:
+    """Reassembles length-prefixed JSON messages from arbitrary chunks.
+
+    Used by callers that read with timeouts or non-blocking sockets, where
+    a message may arrive split across several reads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._data = bytearray()
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        """Append received bytes and return every message they complete.
+
+        Args:
+            data: Bytes read from the socket
+
+        Returns:
+            List of complete decoded messages
+        """
+        self._data += data
+        messages = []
+        while len(self._data) >= _HEADER.size:
+            (length,) = _HEADER.unpack_from(self._data)
+            end = _HEADER.size + length
+            if len(self._data) < end:
+                break
+            messages.append(json.loads(self._data[_HEADER.size : end]))
+            del self._data[:end]
+        return messages
+
+
+def run_script(
+    script_path: str,
+    working_directory: str | None,
+    environment: dict[str, str],
+    code_cache_path: str | None = None,
+) -> int:
+    """Run a script as ``__main__`` in the current process.
+
+    Mirrors ``python script.py``: ``sys.argv`` and ``sys.path[0]`` point at
+    the script, ``SystemExit`` codes are honoured and uncaught exceptions
+    print a traceback and yield exit code 1.
+
+    Args:
+        script_path: Path to the script file
+        working_directory: Directory to run in (None keeps the current one)
+        environment: Complete environment for the script
+        code_cache_path: Optional bytecode cache entry to load the script from
+
+    Returns:
+        The script's exit code
+    """
+    if working_directory:
+        os.chdir(working_directory)
+    os.environ.clear()
+    os.environ.update(environment)
+
+    if not os.path.exists(script_path):
+        print(
+            f"{sys.executable}: can't open file {script_path!r}: "
+            f"[Errno 2] No such file or directory",
+            file=sys.stderr,
+        )
+        return 2
+
+    sys.argv = [script_path]
+    sys.path[0] = os.path.dirname(os.path.realpath(script_path))
+
+    try:
+        if code_cache_path is not None:
+            run_main(load_code(script_path, code_cache_path), script_path)
+        else:
+            runpy.run_path(script_path, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = _exit_code(e)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        _flush_stdio()
+    return code
+
+
+def worker_main(control_fd: int, modules: list[str]) -> None:
+    """Run successive scripts in this interpreter until the control socket closes.
+
+    Each request carries the stdout and stderr pipe ends followed by a
+    request message. The script runs in a fresh ``__main__`` namespace with
+    the pipes on fds 1/2; afterwards the working directory, environment,
+    ``sys.argv``/``sys.path``, stdio and modules imported from the script's
+    own directory are restored, and the exit code, current RSS and the
+    job's resource usage are reported back. The executor decides when to
+    recycle the worker.
+
+    Args:
+        control_fd: Descriptor of the control socket shared with the executor
+        modules: Modules to import once before serving requests
+    """
+    _preload(modules)
+    control = socket.socket(fileno=control_fd)
+    control.sendall(b"R")
+
+    while True:
+        message, fds, _, _ = socket.recv_fds(control, 1, 2)
+        if not message:
+            break
+        request = recv_message(control)
+        if request is None or len(fds) != 2:
+            break
+        before = _own_rusage()
+        code = _run_in_worker(request, fds[0], fds[1])
+        usage = _rusage_delta(before, _own_rusage())
+        send_message(control, {"exit_code": code, "rss_bytes": current_rss(), "rusage": usage})
+
+
+def zygote_main(control_fd: int, modules: list[str]) -> None:
+    """Serve fork requests from the executor until the control socket closes.
+
+    Each request carries three descriptors: a job socket plus the stdout
+    and stderr pipe ends. The zygote forks a supervisor per request, which
+    forks the script process and reports its pid and wait status over the
+    job socket; the zygote itself never waits on anything, so it stays
+    responsive to new requests.
+
+    Args:
+        control_fd: Descriptor of the control socket shared with the executor
+        modules: Modules to import once before serving requests
+    """
+    _preload(modules)
+    control = socket.socket(fileno=control_fd)
+    # Supervisors are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    control.sendall(b"R")
+
+    while True:
+        message, fds, _, _ = socket.recv_fds(control, 1, 3)
+        if not message:
+            break
+        if len(fds) != 3:
+            for fd in fds:
+                os.close(fd)
+            continue
+
+        _flush_stdio()
+        if os.fork() == 0:
+            control.close()
+            _supervise(*fds)
+        for fd in fds:
+            os.close(fd)
+
+
+def _supervise(job_fd: int, stdout_fd: int, stderr_fd: int) -> None:
+    """Fork the script process for one request and report on it. Never returns."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    job = socket.socket(fileno=job_fd)
+    try:
+        request = recv_message(job)
+        if request is None:
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            job.close()
+            os.setsid()
+            os.dup2(stdout_fd, 1)
+            os.dup2(stderr_fd, 2)
+            os.close(stdout_fd)
+            os.close(stderr_fd)
+            if request.get("cgroup_procs"):
+                _join_cgroup(request["cgroup_procs"])
+            _set_rlimits(request.get("rlimits") or {}, restorable=False)
+            if request.get("cpu_affinity"):
+                os.sched_setaffinity(0, request["cpu_affinity"])
+            code = run_script(
+                request["script_path"],
+                request["working_directory"],
+                request["environment"],
+                request.get("code_cache_path"),
+            )
+            os._exit(code)
+
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+        send_message(job, {"pid": pid})
+        _, status, rusage = os.wait4(pid, 0)
+        send_message(job, {"status": status, "rusage": _rusage_fields(rusage)})
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(0)
+
+
+def _run_in_worker(request: dict[str, Any], stdout_fd: int, stderr_fd: int) -> int:
+    """Run one pooled job with its pipes on fds 1/2, then restore interpreter state."""
+    cwd = os.getcwd()
+    environment = dict(os.environ)
+    argv = list(sys.argv)
+    path = list(sys.path)
+    stdout, stderr = sys.stdout, sys.stderr
+    modules_before = set(sys.modules)
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+
+    _flush_stdio()
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    os.close(stdout_fd)
+    os.close(stderr_fd)
+    rlimits = _set_rlimits(request.get("rlimits") or {}, restorable=True)
+    affinity = os.sched_getaffinity(0)
+    if request.get("cpu_affinity"):
+        os.sched_setaffinity(0, request["cpu_affinity"])
+
+    try:
+        return run_script(
+            request["script_path"],
+            request["working_directory"],
+            request["environment"],
+            request.get("code_cache_path"),
+        )
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        _flush_stdio()
+        # Dropping our copies of the pipes is what signals EOF to the executor
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+        for which, limits in rlimits.items():
+            resource.setrlimit(which, limits)
+        os.sched_setaffinity(0, affinity)
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(environment)
+        sys.argv[:] = argv
+        sys.path[:] = path
+        _drop_script_modules(modules_before, request["script_path"])
+
+
+def _set_rlimits(settings: dict[str, int], restorable: bool) -> dict[int, tuple[int, int]]:
+    """Apply a job's rlimits to this process.
+
+    A forked script process gets hard limits. A pooled worker only lowers
+    its soft limits, so they can be restored after the job, and its CPU
+    limit counts from the CPU time it has already used.
+
+    Args:
+        settings: rlimit name -> value
+        restorable: Whether the previous limits must be restorable
+
+    Returns:
+        The previous (soft, hard) limits, keyed by resource
+    """
+    previous = {}
+    for name, value in settings.items():
+        which = getattr(resource, name)
+        soft, hard = resource.getrlimit(which)
+        previous[which] = (soft, hard)
+        if which == resource.RLIMIT_CPU:
+            if restorable:
+                usage = resource.getrusage(resource.RUSAGE_SELF)
+                value += math.ceil(usage.ru_utime + usage.ru_stime)
+            # One second of grace between SIGXCPU and SIGKILL
+            new_hard = value + 1
+        else:
+            new_hard = value
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+            new_hard = min(new_hard, hard)
+        resource.setrlimit(which, (value, hard if restorable else new_hard))
+    return previous
+
+
+def _join_cgroup(procs_path: str) -> None:
+    """Move this process into a job's cgroup (best effort, the executor checks)."""
+    try:
+        with open(procs_path, "w") as procs:
+            procs.write(str(os.getpid()))
+    except OSError:
+        pass
+
+
+def _drop_script_modules(modules_before: set[str], script_path: str) -> None:
+    """Forget modules a job imported from its own directory.
+
+    Shared dependencies stay imported (and warm) for later jobs, but helper
+    modules next to the script must not leak into a different script that
+    happens to use the same module name.
+    """
+    script_dir = os.path.dirname(os.path.realpath(script_path)) + os.sep
+    for name in set(sys.modules) - modules_before:
+        module_file = getattr(sys.modules.get(name), "__file__", None) or ""
+        if os.path.realpath(module_file).startswith(script_dir):
+            del sys.modules[name]
+
+
+_RUSAGE_FIELDS = (
+    "ru_utime",
+    "ru_stime",
+    "ru_maxrss",
+    "ru_majflt",
+    "ru_minflt",
+    "ru_nvcsw",
+    "ru_nivcsw",
+)
+
+
+def _rusage_fields(rusage: Any) -> dict[str, Any]:
+    """Extract the reported ``ru_*`` fields of a struct_rusage into a dict."""
+    return {field: getattr(rusage, field) for field in _RUSAGE_FIELDS}
+
+
+def _own_rusage() -> dict[str, Any]:
+    """Return this process's usage plus that of its reaped children."""
+    import resource
+
+    own = _rusage_fields(resource.getrusage(resource.RUSAGE_SELF))
+    children = _rusage_fields(resource.getrusage(resource.RUSAGE_CHILDREN))
+    combined = {field: own[field] + children[field] for field in _RUSAGE_FIELDS}
+    combined["ru_maxrss"] = max(own["ru_maxrss"], children["ru_maxrss"])
+    return combined
+
+
+def _rusage_delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Usage consumed between two snapshots.
+
+    Counters are differenced; ru_maxrss is a lifetime peak that cannot be
+    attributed to a single job, so the worker's current peak is reported.
+    """
+    return {
+        field: after[field] if field == "ru_maxrss" else after[field] - before[field]
+        for field in _RUSAGE_FIELDS
+    }
+
+
+def current_rss() -> int:
+    """Return the current resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # Peak rather than current RSS, in KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _preload(modules: list[str]) -> None:
+    """Import modules once so forked children and later jobs find them warm."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"script host: failed to preload {name}: {e}", file=sys.stderr)
+
+
+def _exit_code(exc: SystemExit) -> int:
+    """Translate a SystemExit into a process exit code like the interpreter does."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code & 0xFF
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _flush_stdio() -> None:
+    """Flush Python-level stdout/stderr buffers, ignoring closed streams."""
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    """Read exactly ``size`` bytes, or return None on EOF."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "zygote":
+        zygote_main(int(sys.argv[2]), sys.argv[3:])
+    elif len(sys.argv) >= 3 and sys.argv[1] == "worker":
+        worker_main(int(sys.argv[2]), sys.argv[3:])
+    else:
+        print("usage: script_host.py {zygote|worker} <control-fd> [module ...]", file=sys.stderr)
+        sys.exit(2)
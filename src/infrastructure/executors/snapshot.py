@@ -0,0 +1,70 @@
+"""Snapshot and restore of process-wide interpreter state for warm in-process reuse."""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Collection, MutableMapping
+
+from .inprocess import real_environ
+
+
+@dataclass(frozen=True)
+class InterpreterSnapshot:
+    """Imported modules, ``sys.path`` and environment at one point in time.
+
+    Restoring rolls back what in-process scripts changed since then:
+    modules they imported are forgotten (so the next script imports its
+    own fresh copies), and ``sys.path`` and the real environment get their
+    previous contents back. Modules from the standard library and from
+    ``keep_packages`` stay imported, so shared heavy dependencies are
+    loaded once per process.
+    """
+
+    modules: frozenset[str]
+    path: tuple[str, ...]
+    environ: dict[Any, Any]  # os.environ's encoded storage (bytes on POSIX)
+
+    @classmethod
+    def capture(cls) -> "InterpreterSnapshot":
+        """Record the current interpreter state."""
+        return cls(frozenset(sys.modules), tuple(sys.path), _encoded(real_environ()))
+
+    def restore(self, keep_packages: Collection[str] = ()) -> int:
+        """Roll the interpreter state back to this snapshot.
+
+        Args:
+            keep_packages: Top-level packages whose newly imported modules
+                stay loaded (in addition to the standard library)
+
+        Returns:
+            Number of modules removed from sys.modules
+        """
+        dropped = 0
+        for name in set(sys.modules) - self.modules:
+            package = name.partition(".")[0]
+            if package in keep_packages or package in sys.stdlib_module_names:
+                continue
+            sys.modules.pop(name, None)
+            dropped += 1
+
+        if tuple(sys.path) != self.path:
+            for entry in set(sys.path) - set(self.path):
+                sys.path_importer_cache.pop(entry, None)
+            sys.path[:] = self.path
+
+        # Compare encoded and only touch changed variables: every assignment calls putenv()
+        environ = real_environ()
+        current = _encoded(environ)
+        if current != self.environ:
+            for key in current.keys() - self.environ.keys():
+                del environ[os.fsdecode(key)]
+            for key, value in self.environ.items():
+                if current.get(key) != value:
+                    environ[os.fsdecode(key)] = os.fsdecode(value)
+        return dropped
+
+
+def _encoded(environ: MutableMapping[str, str]) -> dict[Any, Any]:
+    """Copy the environment without decoding it (decoding every variable is slow)."""
+    data = getattr(environ, "_data", None)  # os._Environ's storage
+    return dict(data) if data is not None else dict(environ)
@@ -0,0 +1,365 @@
+"""Process spawning strategies for LocalSubprocessExecutor."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ...domain import ResourceUsage
+from .bytecode import BYTECODE_MAIN
+from .limits import join_cgroup, set_rlimits
+from .process import resource_usage_from_rusage, signal_process_group
+
+# Signals Python ignores at start-up, reset to their defaults in spawned children
+_RESTORED_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ") if hasattr(signal, name)
+)
+
+
+@dataclass(frozen=True)
+class LaunchRequest:
+    """Everything a spawner needs to start one script process."""
+
+    python_executable: str
+    script_path: str
+    working_directory: str | None
+    environment: dict[str, str] | None  # None inherits the parent environment
+    stdout_fd: int  # Write end of the pipe the script's stdout is wired to
+    stderr_fd: int  # Write end of the pipe the script's stderr is wired to
+    code_cache_path: str | None = None  # BytecodeCache entry to run the script from
+    rlimits: dict[str, int] | None = None  # rlimit name -> value (see limits.rlimit_settings)
+    cpu_affinity: tuple[int, ...] | None = None  # CPUs to pin the script to
+    cgroup_procs: str | None = None  # cgroup.procs file of the group the script joins
+
+    def command(self) -> list[str]:
+        """Return the command line that runs the script in a fresh interpreter."""
+        if self.code_cache_path is not None:
+            return [self.python_executable, BYTECODE_MAIN, self.code_cache_path, self.script_path]
+        return [self.python_executable, self.script_path]
+
+    @property
+    def limited(self) -> bool:
+        """Whether the script process must be set up (limits, CPUs, cgroup) before exec."""
+        return bool(self.rlimits or self.cpu_affinity or self.cgroup_procs)
+
+
+def wake_future(future: asyncio.Future[None]) -> None:
+    """Resolve a wake-up future from an event loop reader callback (idempotent)."""
+    if not future.done():
+        future.set_result(None)
+
+
+class SpawnedProcess(ABC):
+    """Handle to a script process started by a ProcessSpawner.
+
+    The process is always a session leader, so its pid doubles as the
+    process group id used for timeout enforcement. ``returncode`` follows
+    the subprocess convention: negative values mean "killed by signal".
+    ``resource_usage`` is filled in once the process has been reaped, where
+    the spawner can measure it. ``dedicated`` is False when the pid is
+    shared with other jobs over time (pooled workers).
+    """
+
+    dedicated = True
+
+    def __init__(self, pid: int) -> None:
+        """Initialize the handle.
+
+        Args:
+            pid: Process id of the script process
+        """
+        self.pid = pid
+        self.returncode: int | None = None
+        self.resource_usage: ResourceUsage | None = None
+
+    def signal_group(self, sig: int) -> None:
+        """Send a signal to the process group led by this process.
+
+        Args:
+            sig: Signal number to send
+        """
+        signal_process_group(self.pid, sig)
+
+    @abstractmethod
+    def poll(self) -> int | None:
+        """Check whether the process has exited without blocking.
+
+        Returns:
+            The return code, or None if the process is still running
+        """
+        pass
+
+    @abstractmethod
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the process to exit.
+
+        Args:
+            timeout: Optional maximum number of seconds to wait
+
+        Returns:
+            The return code
+
+        Raises:
+            subprocess.TimeoutExpired: If the timeout elapses first
+        """
+        pass
+
+    async def wait_async(self) -> int:
+        """Wait for the process to exit without blocking the event loop.
+
+        The default implementation waits on a dedicated daemon thread rather
+        than the loop's default executor, whose small worker pool would
+        otherwise cap the number of concurrently running jobs.
+
+        Returns:
+            The return code
+        """
+        if self.returncode is not None:
+            return self.returncode
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+
+        def resolve(result: int | None, error: BaseException | None) -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)  # type: ignore[arg-type]
+
+        def waiter() -> None:
+            try:
+                result = self.wait()
+            except BaseException as e:
+                loop.call_soon_threadsafe(resolve, None, e)
+            else:
+                loop.call_soon_threadsafe(resolve, result, None)
+
+        threading.Thread(target=waiter, name=f"wait-{self.pid}", daemon=True).start()
+        return await future
+
+    def close(self) -> None:
+        """Release resources held by the handle (the process itself is not signalled)."""
+        pass
+
+
+class ProcessSpawner(ABC):
+    """Abstract strategy for starting script processes.
+
+    Spawners wire the script's stdout/stderr to the given pipe ends, apply
+    the working directory and environment, and start it in a new session.
+    """
+
+    @abstractmethod
+    def spawn(self, request: LaunchRequest) -> SpawnedProcess:
+        """Start a script process.
+
+        Args:
+            request: Launch parameters
+
+        Returns:
+            Handle to the running process
+
+        Raises:
+            FileNotFoundError: If the Python executable cannot be found
+        """
+        pass
+
+    def close(self) -> None:
+        """Release long-lived resources (server processes, workers)."""
+        pass
+
+
+class ChildProcess(SpawnedProcess):
+    """SpawnedProcess for a direct child of the executor.
+
+    The child is reaped with os.wait4 so its resource usage can be recorded.
+    """
+
+    def __init__(self, pid: int, args: list[str]) -> None:
+        """Initialize the handle.
+
+        Args:
+            pid: Process id of the child
+            args: Command line of the child (used in timeout errors)
+        """
+        super().__init__(pid)
+        self._args = args
+        self._reap_lock = threading.Lock()
+
+    def poll(self) -> int | None:
+        """Check whether the process has exited without blocking."""
+        if self.returncode is None:
+            self._reap(os.WNOHANG)
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the process to exit."""
+        if timeout is None:
+            while self.returncode is None:
+                self._reap(0)
+            return self.returncode
+
+        # Poll with a growing delay, like Popen.wait does for timeouts
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self._args, timeout)
+            time.sleep(min(delay, remaining, 0.05))
+            delay *= 2
+        return self.returncode  # type: ignore[return-value]
+
+    async def wait_async(self) -> int:
+        """Wait for the process to exit using a pidfd where the platform has one."""
+        if self.returncode is not None:
+            return self.returncode
+
+        try:
+            pidfd = os.pidfd_open(self.pid)
+        except (AttributeError, OSError):
+            return await super().wait_async()
+
+        loop = asyncio.get_running_loop()
+        exited: asyncio.Future[None] = loop.create_future()
+        loop.add_reader(pidfd, wake_future, exited)
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        # The process is a zombie now, so this reaps it without blocking
+        return self.wait()
+
+    def _reap(self, options: int) -> None:
+        """Call os.wait4 and record the exit status and resource usage."""
+        with self._reap_lock:
+            if self.returncode is not None:
+                return
+            try:
+                pid, status, rusage = os.wait4(self.pid, options)
+            except ChildProcessError:
+                # Reaped elsewhere (e.g. by a SIGCHLD handler); usage is unknown
+                pid, status, rusage = self.pid, 255 << 8, None
+            if pid == 0:
+                return
+            self._record(status, rusage)
+
+    def _record(self, status: int, rusage: Any) -> None:
+        """Store the exit status and resource usage."""
+        self.returncode = os.waitstatus_to_exitcode(status)
+        if rusage is not None:
+            self.resource_usage = resource_usage_from_rusage(rusage)
+
+
+class PopenProcess(ChildProcess):
+    """ChildProcess started by subprocess.Popen."""
+
+    def __init__(self, process: subprocess.Popen[bytes]) -> None:
+        """Initialize the handle.
+
+        Args:
+            process: Running Popen object
+        """
+        super().__init__(process.pid, process.args)  # type: ignore[arg-type]
+        self._process = process
+
+    def _record(self, status: int, rusage: Any) -> None:
+        """Store the exit status (and usage) on both the handle and the Popen object."""
+        super()._record(status, rusage)
+        # Keeps Popen from warning about (or re-reaping) a child that is gone
+        self._process.returncode = self.returncode
+
+
+class PopenSpawner(ProcessSpawner):
+    """Starts every script with a fresh interpreter via subprocess.Popen (default).
+
+    The cgroup, rlimits and CPU affinity of a job are applied in the
+    forked child before it execs the interpreter, so none of the
+    script's code runs outside of them. Such launches cannot use vfork.
+    """
+
+    def spawn(self, request: LaunchRequest) -> SpawnedProcess:
+        """Start a script process with subprocess.Popen."""
+        process = subprocess.Popen(
+            request.command(),
+            stdout=request.stdout_fd,
+            stderr=request.stderr_fd,
+            cwd=request.working_directory,
+            env=request.environment,
+            start_new_session=True,
+            preexec_fn=_child_setup(request),
+        )
+        return PopenProcess(process)
+
+
+class PosixSpawnSpawner(ProcessSpawner):
+    """Starts every script with a fresh interpreter via os.posix_spawn.
+
+    posix_spawn (vfork + exec in glibc) skips most of Popen's per-launch
+    work: there is no error pipe to read and no descriptor-closing pass
+    in the child. Descriptors the executor creates are close-on-exec
+    (PEP 446), so only stdout and stderr reach the script; descriptors a
+    C extension made inheritable would leak, which is why this spawner is
+    opt-in. Launches with a working directory fall back to a vfork-based
+    Popen call, because os.posix_spawn has no chdir action, and launches
+    with a cgroup, rlimits or CPU affinity fall back to a Popen call that
+    applies them in the child before exec (see PopenSpawner).
+    """
+
+    def spawn(self, request: LaunchRequest) -> SpawnedProcess:
+        """Start a script process with os.posix_spawnp."""
+        args = request.command()
+        if request.working_directory is not None or request.limited:
+            process = subprocess.Popen(
+                args,
+                stdout=request.stdout_fd,
+                stderr=request.stderr_fd,
+                cwd=request.working_directory,
+                env=request.environment,
+                start_new_session=True,
+                close_fds=False,
+                preexec_fn=_child_setup(request),
+            )
+            return PopenProcess(process)
+
+        pid = os.posix_spawnp(
+            request.python_executable,
+            args,
+            request.environment if request.environment is not None else os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, request.stdout_fd, 1),
+                (os.POSIX_SPAWN_DUP2, request.stderr_fd, 2),
+            ],
+            setsid=True,
+            # Like Popen's restore_signals: don't pass on the parent's ignored signals
+            setsigdef=_RESTORED_SIGNALS,
+        )
+        return ChildProcess(pid, args)
+
+
+def _child_setup(request: LaunchRequest) -> Callable[[], None] | None:
+    """Return the preexec_fn that puts a job's limits in place, if it has any.
+
+    Runs in the forked child, so it sticks to system calls: joining the
+    cgroup, setrlimit and sched_setaffinity.
+    """
+    if not request.limited:
+        return None
+
+    def setup() -> None:
+        if request.cgroup_procs:
+            join_cgroup(request.cgroup_procs)
+        if request.rlimits:
+            set_rlimits(request.rlimits)
+        if request.cpu_affinity:
+            os.sched_setaffinity(0, request.cpu_affinity)
+
+    return setup
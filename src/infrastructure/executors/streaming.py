@@ -0,0 +1,335 @@
+"""Output streaming helpers for subprocess executors."""
+
+import asyncio
+import codecs
+import os
+import selectors
+import time
+from dataclasses import dataclass
+from typing import IO, AsyncIterator, Callable
+
+STDOUT = "stdout"
+STDERR = "stderr"
+
+# Policies for lines longer than LineDecoder's max_line_length
+SPLIT = "split"
+TRUNCATE = "truncate"
+
+
+@dataclass(frozen=True, slots=True)
+class OutputLine:
+    """A single line of child process output."""
+
+    stream: str  # STDOUT or STDERR
+    text: str  # Line content without the line terminator
+    timestamp: float  # time.monotonic() when the line was captured
+
+
+class LineDecoder:
+    """Incrementally decodes a byte stream into complete text lines.
+
+    Bytes are fed in arbitrary chunks (as read from a pipe); multi-byte
+    characters split across chunks are handled by an incremental decoder,
+    and only complete lines are returned. Trailing ``\\r`` is stripped so
+    CRLF output yields the same lines as LF output.
+
+    With ``max_line_length`` set, no line longer than that many characters
+    is ever buffered or returned: over-long lines are either split into
+    consecutive pieces (SPLIT) or cut off, discarding the rest of the line
+    (TRUNCATE).
+    """
+
+    def __init__(
+        self,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        max_line_length: int | None = None,
+        long_lines: str = SPLIT,
+    ) -> None:
+        """Initialize the decoder.
+
+        Args:
+            encoding: Text encoding of the stream
+            errors: Decoding error policy (strict, replace, ignore, ...)
+            max_line_length: Maximum characters per line (None: unlimited)
+            long_lines: What to do with longer lines: SPLIT or TRUNCATE
+
+        Raises:
+            LookupError: If the encoding or error policy is unknown
+            ValueError: If max_line_length or long_lines is invalid
+        """
+        if max_line_length is not None and max_line_length < 1:
+            raise ValueError("max_line_length must be at least 1")
+        if long_lines not in (SPLIT, TRUNCATE):
+            raise ValueError(f"long_lines must be {SPLIT!r} or {TRUNCATE!r}")
+        codecs.lookup_error(errors)
+
+        self.encoding = encoding
+        self.errors = errors
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        self._max = max_line_length
+        self._truncate = long_lines == TRUNCATE
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._discarding = False  # TRUNCATE: skipping the rest of a cut-off line
+
+    def feed(self, data: bytes) -> list[str]:
+        """Feed a chunk of bytes and return the lines it completes.
+
+        Args:
+            data: Raw bytes read from the stream
+
+        Returns:
+            List of complete lines (without line terminators)
+        """
+        text = self._decoder.decode(data)
+        if self._max is not None:
+            return self._feed_limited(text, self._max)
+
+        if "\n" not in text:
+            if text:
+                self._pending.append(text)
+            return []
+
+        parts = text.split("\n")
+        if self._pending:
+            self._pending.append(parts[0])
+            parts[0] = "".join(self._pending)
+            self._pending = []
+
+        tail = parts.pop()
+        if tail:
+            self._pending.append(tail)
+        return [part[:-1] if part.endswith("\r") else part for part in parts]
+
+    def flush(self) -> list[str]:
+        """Return the final unterminated line, if any, at end of stream.
+
+        Returns:
+            List containing the last partial line (possibly split), or an empty list
+        """
+        text = self._decoder.decode(b"", final=True)
+        lines: list[str] = []
+        if self._max is not None:
+            lines = self._feed_limited(text, self._max)
+        elif text:
+            self._pending.append(text)
+
+        line = "".join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        self._discarding = False
+        if line:
+            lines.append(line[:-1] if line.endswith("\r") else line)
+        return lines
+
+    def _feed_limited(self, text: str, limit: int) -> list[str]:
+        """Split decoded text into lines, enforcing the line length limit."""
+        lines: list[str] = []
+        parts = text.split("\n")
+        tail = parts.pop()
+
+        for part in parts:
+            if self._discarding:
+                line = "".join(self._pending)
+            elif self._pending:
+                self._pending.append(part)
+                line = "".join(self._pending)
+            else:
+                line = part
+            self._pending = []
+            self._pending_size = 0
+            self._discarding = False
+
+            if line.endswith("\r"):
+                line = line[:-1]
+            if len(line) <= limit:
+                lines.append(line)
+            elif self._truncate:
+                lines.append(line[:limit])
+            else:
+                lines.extend(line[i : i + limit] for i in range(0, len(line), limit))
+
+        if tail and not self._discarding:
+            self._pending.append(tail)
+            self._pending_size += len(tail)
+            if self._pending_size > limit:
+                line = "".join(self._pending)
+                if self._truncate:
+                    # Keep the start of the line and drop everything up to the next newline
+                    line = line[:limit]
+                    self._discarding = True
+                else:
+                    # Emit full pieces now; keep a non-empty remainder (plus any
+                    # "\r" that may precede the newline) so no empty line follows
+                    size = len(line) - 1 if line.endswith("\r") else len(line)
+                    cut = (size - 1) // limit * limit
+                    lines.extend(line[i : i + limit] for i in range(0, cut, limit))
+                    line = line[cut:]
+                self._pending = [line]
+                self._pending_size = len(line)
+        return lines
+
+
+class OutputPump:
+    """Drains stdout and stderr pipes concurrently.
+
+    Uses a selector so neither pipe can fill up and block the child while
+    the other is being read. Each decoded line is handed to ``on_line`` as
+    soon as it is complete, so callers can forward output live instead of
+    after the process exits. ``run`` can be called repeatedly with a
+    deadline, which lets callers interleave draining with timeout handling
+    without losing partially read lines.
+    """
+
+    def __init__(
+        self,
+        stdout: IO[bytes] | None,
+        stderr: IO[bytes] | None,
+        on_line: Callable[[OutputLine], None],
+        read_size: int = 65536,
+        decoder_factory: Callable[[], LineDecoder] = LineDecoder,
+    ) -> None:
+        """Initialize the pump.
+
+        Args:
+            stdout: Binary stdout pipe of the child process
+            stderr: Binary stderr pipe of the child process
+            on_line: Callback receiving every captured line
+            read_size: Maximum number of bytes read per system call
+            decoder_factory: Creates the line decoder for each pipe
+        """
+        self._on_line = on_line
+        self._read_size = read_size
+        self._decoders: dict[int, tuple[str, LineDecoder]] = {}
+        self._selector = selectors.DefaultSelector()
+        self._stop_requested = False
+
+        for stream_name, pipe in ((STDOUT, stdout), (STDERR, stderr)):
+            if pipe is None:
+                continue
+            fd = pipe.fileno()
+            self._decoders[fd] = (stream_name, decoder_factory())
+            self._selector.register(fd, selectors.EVENT_READ)
+
+    def run(self, deadline: float | None = None) -> bool:
+        """Drain the pipes until both reach EOF or the deadline passes.
+
+        Args:
+            deadline: Optional time.monotonic() value to stop at
+
+        Returns:
+            True if both pipes reached EOF, False if the deadline passed or
+            stop was called first
+        """
+        while self._decoders:
+            if self._stop_requested:
+                self._stop_requested = False
+                return False
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return False
+
+            for key, _ in self._selector.select(timeout):
+                fd = key.fd
+                stream_name, decoder = self._decoders[fd]
+                data = os.read(fd, self._read_size)
+
+                if data:
+                    lines = decoder.feed(data)
+                else:
+                    # EOF - emit any trailing partial line and stop watching
+                    lines = decoder.flush()
+                    self._selector.unregister(fd)
+                    del self._decoders[fd]
+
+                self._emit(stream_name, lines)
+
+        return True
+
+    def stop(self) -> None:
+        """Make run return early, after handling the data already read (e.g. from on_line)."""
+        self._stop_requested = True
+
+    def close(self) -> None:
+        """Emit partial lines still buffered for open pipes and stop watching them."""
+        for fd, (stream_name, decoder) in list(self._decoders.items()):
+            self._emit(stream_name, decoder.flush())
+            self._selector.unregister(fd)
+        self._decoders.clear()
+        self._selector.close()
+
+    def _emit(self, stream_name: str, lines: list[str]) -> None:
+        """Hand decoded lines to the callback."""
+        now = time.monotonic()
+        for line in lines:
+            self._on_line(OutputLine(stream_name, line, now))
+
+
+async def merge_output_async(
+    stdout: asyncio.StreamReader | None,
+    stderr: asyncio.StreamReader | None,
+    read_size: int = 65536,
+    max_pending: int = 64,
+    decoder_factory: Callable[[], LineDecoder] = LineDecoder,
+) -> AsyncIterator[OutputLine]:
+    """Drain stdout and stderr concurrently, yielding lines in arrival order.
+
+    Each pipe is read by its own task into a shared bounded queue, so a
+    child writing heavily to stderr can never block on a full pipe while
+    stdout is being consumed (and vice versa). When the consumer falls
+    behind, the bounded queue applies backpressure to the readers instead of
+    growing without bound.
+
+    Args:
+        stdout: Stream reader attached to the child's stdout
+        stderr: Stream reader attached to the child's stderr
+        read_size: Maximum number of bytes requested per read
+        max_pending: Maximum number of read chunks buffered ahead of the consumer
+        decoder_factory: Creates the line decoder for each pipe
+
+    Yields:
+        OutputLine items tagged with their stream and capture time
+    """
+    # Lines are queued per read chunk rather than one by one, which keeps the
+    # per-line cost of the merge close to plain sequential iteration.
+    queue: asyncio.Queue[list[OutputLine] | BaseException | None] = asyncio.Queue(max_pending)
+
+    async def drain(stream_name: str, reader: asyncio.StreamReader) -> None:
+        decoder = decoder_factory()
+        try:
+            while True:
+                data = await reader.read(read_size)
+                lines = decoder.feed(data) if data else decoder.flush()
+                if lines:
+                    now = time.monotonic()
+                    await queue.put([OutputLine(stream_name, line, now) for line in lines])
+                if not data:
+                    break
+        except Exception as e:
+            await queue.put(e)
+        await queue.put(None)
+
+    tasks = [
+        asyncio.create_task(drain(stream_name, reader))
+        for stream_name, reader in ((STDOUT, stdout), (STDERR, stderr))
+        if reader is not None
+    ]
+    remaining = len(tasks)
+
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                for line in item:
+                    yield line
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,311 @@
+"""Subinterpreter executor implementation (Python 3.12+)."""
+
+import contextvars
+import json
+import marshal
+import os
+import sys
+import threading
+from typing import Any
+
+from ...domain import ExecutionStatus, FileProvider, ScriptConfig, ScriptExecutionException
+from .bytecode import BytecodeCache
+from .code_cache import CodeObjectCache
+from .inprocess import real_environ
+from .lambda_exec import LambdaExecutor
+from .streaming import STDERR, STDOUT, OutputLine, OutputPump
+
+
+class _SubinterpreterAPI:
+    """CPython's private subinterpreter module, with the differences between versions hidden.
+
+    - The module is ``_xxsubinterpreters`` in 3.12 and ``_interpreters``
+      from 3.13.
+    - ``run_string`` raises RunFailedError in 3.12 but returns the error
+      from 3.13.
+    - Later 3.13 releases reject ``shared=None``.
+    """
+
+    def __init__(self, module: Any) -> None:
+        self._module = module
+        self._run_failed_error = getattr(module, "RunFailedError", None)
+
+    @classmethod
+    def load(cls) -> "_SubinterpreterAPI | None":
+        """Return the API, or None if this Python has no per-interpreter GIL."""
+        # Earlier versions have the module too, but their subinterpreters share the main GIL
+        if sys.version_info < (3, 12):
+            return None
+        try:
+            import _interpreters as module  # type: ignore[import-not-found]
+        except ImportError:
+            import _xxsubinterpreters as module  # type: ignore[import-not-found]
+        return cls(module)
+
+    def create(self) -> Any:
+        """Create an isolated subinterpreter (with its own GIL)."""
+        return self._module.create()
+
+    def destroy(self, interpreter: Any) -> None:
+        """Destroy a subinterpreter."""
+        self._module.destroy(interpreter)
+
+    def run_string(
+        self, interpreter: Any, source: str, shared: dict[str, Any] | None = None
+    ) -> None:
+        """Run code in a subinterpreter's __main__ module.
+
+        Args:
+            interpreter: Subinterpreter to run in
+            source: Python source code
+            shared: Values bound as globals before the code runs
+
+        Raises:
+            ScriptExecutionException: If the code raises
+        """
+        try:
+            failure = self._module.run_string(interpreter, source, shared or {})
+        except Exception as e:
+            if self._run_failed_error is None or not isinstance(e, self._run_failed_error):
+                raise
+            failure = e
+        if failure is not None:
+            raise ScriptExecutionException(
+                f"Subinterpreter failed: {getattr(failure, 'formatted', failure)}"
+            )
+
+
+# Runs once in every new subinterpreter
+_PRELUDE = """\
+import json, marshal, os, sys, traceback, types
+
+_baseline_modules = set(sys.modules)
+_baseline_path = list(sys.path)
+"""
+
+# Runs one script; the underscored names are passed in as "shared" values
+_RUN_SCRIPT = """\
+sys.stdout = open(_stdout_fd, "w", buffering=1, encoding="utf-8", errors="backslashreplace", closefd=False)
+sys.stderr = open(_stderr_fd, "w", buffering=1, encoding="utf-8", errors="backslashreplace", closefd=False)
+sys.argv = [_script_path]
+# A private environment: assigning to the real os.environ would putenv() process-wide
+os.environ = json.loads(_environ)
+_cwd = os.getcwd()
+_exit_code = 0
+try:
+    if _working_directory:
+        os.chdir(_working_directory)
+    _module = types.ModuleType("script")
+    _module.__file__ = _script_path
+    sys.modules["script"] = _module
+    exec(marshal.loads(_code), _module.__dict__)
+except SystemExit as e:
+    _exit_code = e.code if isinstance(e.code, int) else 0
+except BaseException:
+    traceback.print_exc()
+    _exit_code = 1
+finally:
+    os.chdir(_cwd)
+    sys.stdout.close()
+    sys.stderr.close()
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    # Keep the standard library warm for the next script, forget the rest
+    for _name in set(sys.modules) - _baseline_modules:
+        if _name.partition(".")[0] not in sys.stdlib_module_names:
+            del sys.modules[_name]
+    sys.path[:] = _baseline_path
+    os.write(_status_fd, str(_exit_code).encode())
+"""
+
+
+class SubinterpreterExecutor(LambdaExecutor):
+    """Executes Python scripts in subinterpreters with their own GIL (Python 3.12+).
+
+    Up to ``max_workers`` scripts run at the same time, each on its own
+    thread in its own isolated subinterpreter. Each subinterpreter has
+    its own GIL, modules and ``sys``, so CPU-bound scripts run in
+    parallel without the cost of starting processes. Subinterpreters are
+    kept and reused: every script runs in a fresh module namespace, and
+    afterwards the modules it imported (except the standard library) and
+    its ``sys.path`` edits are dropped. Staging, uploads, compiled-script
+    caching, streaming and batching work as in LambdaExecutor: the
+    script's output is piped back and passed on line by line while it
+    runs.
+
+    Isolated subinterpreters cannot fork, exec child processes or start
+    daemon threads, and can only import extension modules that support
+    multiple interpreters. The working directory is per thread (see
+    inprocess.py) and the environment is a private copy. Timeouts cannot
+    be enforced, because a running subinterpreter cannot be interrupted
+    from outside, so configs with ``timeout_seconds`` are rejected.
+    """
+
+    def __init__(
+        self,
+        file_provider: FileProvider | None = None,
+        temp_directory: str = "/tmp",
+        bytecode_cache: BytecodeCache | None = None,
+        code_cache: CodeObjectCache | None = None,
+        max_workers: int | None = None,
+        reuse_interpreters: bool = True,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            file_provider: Optional file provider for staging required files
+            temp_directory: Directory for staging files
+            bytecode_cache: Optional shared on-disk cache of compiled scripts,
+                consulted when a script is not in the code cache
+            code_cache: In-memory cache of compiled scripts (default: a
+                private CodeObjectCache)
+            max_workers: Number of scripts that may run at the same time
+                (default: the number of CPUs)
+            reuse_interpreters: Whether to keep subinterpreters for later
+                scripts instead of creating a new one per script (creating
+                one costs tens of milliseconds)
+
+        Raises:
+            RuntimeError: If this Python has no subinterpreter support
+            ValueError: If max_workers is less than 1
+        """
+        api = _SubinterpreterAPI.load()
+        if api is None:
+            raise RuntimeError(
+                "SubinterpreterExecutor needs Python 3.12 or newer "
+                f"(running {sys.version_info.major}.{sys.version_info.minor})"
+            )
+        super().__init__(
+            file_provider=file_provider,
+            temp_directory=temp_directory,
+            bytecode_cache=bytecode_cache,
+            code_cache=code_cache,
+            max_workers=max_workers if max_workers is not None else os.cpu_count() or 1,
+        )
+        self._api = api
+        self._reuse_interpreters = reuse_interpreters
+        self._idle_interpreters: list[Any] = []
+        self._interpreters_lock = threading.Lock()
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop the worker threads, waiting for running scripts, and destroy idle subinterpreters."""
+        super().close()
+        with self._interpreters_lock:
+            idle, self._idle_interpreters = self._idle_interpreters, []
+            self._closed = True
+        for interpreter in idle:
+            self._api.destroy(interpreter)
+
+    def _prepare_environment(self, config: ScriptConfig) -> dict[str, str] | None:
+        """Leave the main interpreter's environment alone (see _run_script)."""
+        return None
+
+    def _run_script(
+        self, config: ScriptConfig, notes: dict[str, Any]
+    ) -> tuple[int, ExecutionStatus]:
+        """Execute the script in a subinterpreter on the current thread.
+
+        The script writes its output to pipes, which a helper thread drains
+        into this thread's (routed) sys.stdout and sys.stderr as lines
+        arrive, so it streams live.
+
+        Args:
+            config: Script configuration
+            notes: Execution notes added to the result metadata
+
+        Returns:
+            Tuple of (exit code, status)
+
+        Raises:
+            ScriptExecutionException: If handler mode or a timeout is
+                requested, or the subinterpreter fails outside the script
+        """
+        if (config.metadata or {}).get("handler"):
+            raise ScriptExecutionException("SubinterpreterExecutor does not support handler mode")
+        if config.timeout_seconds:
+            raise ScriptExecutionException(
+                "SubinterpreterExecutor cannot enforce timeout_seconds "
+                "(a running subinterpreter cannot be interrupted)"
+            )
+        code = self._load_code(config)
+        environment = {**real_environ(), **(config.environment_variables or {})}
+        shared: dict[str, Any] = {
+            "_script_path": config.script_path,
+            "_working_directory": config.working_directory or "",
+            "_environ": json.dumps(environment),
+            "_code": marshal.dumps(code),
+        }
+        status_read, status_write = os.pipe()
+        try:
+            stdout_read, stdout_write = os.pipe()
+            stderr_read, stderr_write = os.pipe()
+            # The copied context routes the helper's writes to this invocation's captures
+            pump = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(_pump_output, stdout_read, stderr_read),
+                name="subinterpreter-output",
+                daemon=True,
+            )
+            pump.start()
+            try:
+                shared.update(
+                    _stdout_fd=stdout_write, _stderr_fd=stderr_write, _status_fd=status_write
+                )
+                interpreter = self._acquire_interpreter()
+                healthy = False
+                try:
+                    self._api.run_string(interpreter, _RUN_SCRIPT, shared)
+                    healthy = True
+                finally:
+                    self._release_interpreter(interpreter, healthy)
+            finally:
+                # EOF ends the pump once it has passed on the last line
+                os.close(stdout_write)
+                os.close(stderr_write)
+                pump.join()
+
+            os.close(status_write)
+            status_write = -1
+            exit_code = int(os.read(status_read, 64) or b"1")
+            return exit_code, ExecutionStatus.SUCCESS if exit_code == 0 else ExecutionStatus.FAILED
+        finally:
+            os.close(status_read)
+            if status_write >= 0:
+                os.close(status_write)
+
+    def _acquire_interpreter(self) -> Any:
+        """Return an idle subinterpreter, or create one."""
+        with self._interpreters_lock:
+            if self._idle_interpreters:
+                return self._idle_interpreters.pop()
+        interpreter = self._api.create()
+        try:
+            self._api.run_string(interpreter, _PRELUDE)
+        except BaseException:
+            self._api.destroy(interpreter)
+            raise
+        return interpreter
+
+    def _release_interpreter(self, interpreter: Any, healthy: bool) -> None:
+        """Keep a subinterpreter for the next script, or destroy it."""
+        if healthy and self._reuse_interpreters:
+            with self._interpreters_lock:
+                if not self._closed:
+                    self._idle_interpreters.append(interpreter)
+                    return
+        self._api.destroy(interpreter)
+
+
+def _pump_output(stdout_fd: int, stderr_fd: int) -> None:
+    """Write lines from a script's output pipes to sys.stdout and sys.stderr until EOF."""
+    streams = {STDOUT: sys.stdout, STDERR: sys.stderr}
+
+    def forward(line: OutputLine) -> None:
+        streams[line.stream].write(line.text + "\n")
+
+    with open(stdout_fd, "rb") as stdout, open(stderr_fd, "rb") as stderr:
+        pump = OutputPump(stdout, stderr, forward)
+        try:
+            pump.run()
+        finally:
+            pump.close()
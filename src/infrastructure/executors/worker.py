@@ -87,4 +87,4 @@ class WorkerExecutor(ScriptExecutor):
             "WorkerExecutor is a stub. Implement remote worker communication "
             "by extending this class or providing a concrete implementation."
         )
-
+        yield  # Unreachable; makes this an async generator like the base method expects
@@ -0,0 +1,180 @@
+"""Zygote (pre-forked server) spawner for LocalSubprocessExecutor."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import threading
+from types import SimpleNamespace
+from typing import Iterable
+
+from .process import resource_usage_from_rusage
+from .script_host import MessageBuffer, recv_message, send_message, start_host
+from .spawn import LaunchRequest, ProcessSpawner, SpawnedProcess, wake_future
+
+
+class ZygoteProcess(SpawnedProcess):
+    """Handle to a script process forked by the zygote server.
+
+    The script is not a child of the executor, so its exit status is
+    reported by the zygote-side supervisor over a per-job socket.
+    """
+
+    def __init__(self, pid: int, job: socket.socket, script_path: str) -> None:
+        """Initialize the handle.
+
+        Args:
+            pid: Process id of the forked script process
+            job: Job socket connected to the zygote-side supervisor
+            script_path: Script path (used in timeout errors)
+        """
+        super().__init__(pid)
+        self._job = job
+        self._script_path = script_path
+        self._buffer = MessageBuffer()
+
+    def poll(self) -> int | None:
+        """Check whether the process has exited without blocking."""
+        if self.returncode is None:
+            self._receive(blocking=False)
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the supervisor to report the exit status."""
+        if self.returncode is None:
+            self._job.settimeout(timeout)
+            try:
+                while self.returncode is None:
+                    self._receive(blocking=True)
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(self._script_path, timeout)  # type: ignore[arg-type]
+        return self.returncode
+
+    async def wait_async(self) -> int:
+        """Wait for the exit status by watching the job socket on the event loop."""
+        loop = asyncio.get_running_loop()
+        fd = self._job.fileno()
+
+        while self.returncode is None:
+            readable: asyncio.Future[None] = loop.create_future()
+            loop.add_reader(fd, wake_future, readable)
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+            self.poll()
+        return self.returncode
+
+    def close(self) -> None:
+        """Close the job socket."""
+        self._job.close()
+
+    def _receive(self, blocking: bool) -> None:
+        """Read from the job socket and record the exit status once reported."""
+        if not blocking:
+            self._job.setblocking(False)
+        try:
+            data = self._job.recv(4096)
+        except BlockingIOError:
+            return
+
+        if not data:
+            raise ChildProcessError(
+                f"Zygote supervisor for pid {self.pid} exited without reporting a status"
+            )
+        for message in self._buffer.feed(data):
+            if "status" in message:
+                self.resource_usage = resource_usage_from_rusage(
+                    SimpleNamespace(**message["rusage"])
+                )
+                self.returncode = os.waitstatus_to_exitcode(message["status"])
+
+
+class ZygoteSpawner(ProcessSpawner):
+    """Forks scripts from a long-lived, pre-warmed server process.
+
+    The server interpreter starts once, imports ``preload_modules`` and
+    then forks a fresh child per job, so scripts skip interpreter start-up
+    and the import cost of heavy shared dependencies. Each child runs in
+    its own session with stdout/stderr, working directory and environment
+    wired exactly as a Popen launch would, except that stdin is
+    ``/dev/null``. The server is started lazily on first use and restarted
+    if it dies.
+    """
+
+    def __init__(self, preload_modules: Iterable[str] = ()) -> None:
+        """Initialize the spawner.
+
+        Args:
+            preload_modules: Modules the server imports once before forking
+                (e.g. ``["numpy", "pandas"]``)
+        """
+        self._preload_modules = list(preload_modules)
+        self._lock = threading.Lock()
+        self._server: subprocess.Popen[bytes] | None = None
+        self._control: socket.socket | None = None
+
+    def spawn(self, request: LaunchRequest) -> SpawnedProcess:
+        """Fork a script process from the zygote server."""
+        environment = request.environment if request.environment is not None else dict(os.environ)
+        job, remote_job = socket.socketpair()
+
+        try:
+            with self._lock:
+                fds = [remote_job.fileno(), request.stdout_fd, request.stderr_fd]
+                try:
+                    socket.send_fds(self._ensure_server(request.python_executable), [b"J"], fds)
+                except OSError:
+                    # The server died since the last launch - start a new one and retry once
+                    self._stop_server()
+                    socket.send_fds(self._ensure_server(request.python_executable), [b"J"], fds)
+            remote_job.close()
+
+            send_message(
+                job,
+                {
+                    "script_path": request.script_path,
+                    "working_directory": request.working_directory,
+                    "code_cache_path": request.code_cache_path,
+                    "rlimits": request.rlimits,
+                    "cpu_affinity": request.cpu_affinity,
+                    "cgroup_procs": request.cgroup_procs,
+                    "environment": environment,
+                },
+            )
+            reply = recv_message(job)
+            if reply is None or "pid" not in reply:
+                raise ChildProcessError(f"Zygote failed to start script: {request.script_path}")
+        except BaseException:
+            remote_job.close()
+            job.close()
+            raise
+
+        return ZygoteProcess(reply["pid"], job, request.script_path)
+
+    def close(self) -> None:
+        """Shut down the zygote server."""
+        with self._lock:
+            self._stop_server()
+
+    def _ensure_server(self, python_executable: str) -> socket.socket:
+        """Return the control socket, starting the server if needed (lock held)."""
+        if self._control is not None and self._server and self._server.poll() is None:
+            return self._control
+
+        self._stop_server()
+        self._server, self._control = start_host(python_executable, "zygote", self._preload_modules)
+        return self._control
+
+    def _stop_server(self) -> None:
+        """Close the control socket and reap the server (lock held)."""
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+        if self._server is not None:
+            try:
+                self._server.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._server.kill()
+                self._server.wait()
+            self._server = None
@@ -3,6 +3,7 @@
 from .stdout import StdoutLogSink
 from .sse import SSELogSink
 from .composite import CompositeLogSink
+from .batching import BatchingLogSink
 
-__all__ = ["StdoutLogSink", "SSELogSink", "CompositeLogSink"]
+__all__ = ["StdoutLogSink", "SSELogSink", "CompositeLogSink", "BatchingLogSink"]
 
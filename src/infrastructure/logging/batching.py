@@ -0,0 +1,101 @@
+"""Batching log sink implementation (decorator pattern)."""
+
+import time
+from typing import Callable, Sequence
+
+from ...domain import LogSink, LogLevel, LogRecord
+
+
+class BatchingLogSink(LogSink):
+    """Log sink that groups messages and forwards them with emit_batch.
+
+    Messages are buffered until ``max_records`` are pending or the oldest
+    pending message is ``max_delay_seconds`` old, then handed to the
+    wrapped sink in one emit_batch call, so per-message costs (formatting,
+    callbacks, writes) are paid once per batch. Order is preserved.
+
+    The delay is only checked when a message arrives or ``flush_due`` is
+    called: whoever owns the sink must call ``flush_due`` by ``next_due``
+    while no messages arrive, and ``flush`` when done. ``on_pending`` may be
+    reassigned at any time, e.g. to wake up the loop that owns the sink.
+    Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        sink: LogSink,
+        max_records: int = 256,
+        max_delay_seconds: float = 0.05,
+        on_pending: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the batching log sink.
+
+        Args:
+            sink: Log sink receiving the batches
+            max_records: Number of pending messages that triggers a flush
+            max_delay_seconds: Maximum time a message is held back
+            on_pending: Called when a message is buffered while none were
+                pending (e.g. to schedule a flush_due call)
+        """
+        self._sink = sink
+        self._max_records = max_records
+        self._max_delay = max_delay_seconds
+        self.on_pending = on_pending
+        self._pending: list[LogRecord] = []
+        self._due: float | None = None
+
+    @property
+    def next_due(self) -> float | None:
+        """time.monotonic() value by which pending messages must be flushed, or None."""
+        return self._due
+
+    def emit(self, level: LogLevel, message: str, metadata: dict[str, str] | None = None) -> None:
+        """Buffer a log message, flushing if the batch is full or due.
+
+        Args:
+            level: Log severity level
+            message: Log message content
+            metadata: Optional metadata dictionary
+        """
+        self._pending.append(LogRecord(level, message, metadata))
+        self._check()
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Buffer several log messages, flushing if the batch is full or due.
+
+        Args:
+            records: Log records to emit
+        """
+        if records:
+            self._pending.extend(records)
+            self._check()
+
+    def flush_due(self, now: float | None = None) -> None:
+        """Flush pending messages if the oldest has waited long enough.
+
+        Args:
+            now: Current time.monotonic() value (default: read the clock)
+        """
+        if self._due is not None and (now if now is not None else time.monotonic()) >= self._due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Forward all pending messages to the wrapped sink."""
+        if not self._pending:
+            return
+        records, self._pending, self._due = self._pending, [], None
+        self._sink.emit_batch(records)
+
+    def close(self) -> None:
+        """Flush pending messages and close the wrapped sink."""
+        self.flush()
+        self._sink.close()
+
+    def _check(self) -> None:
+        """Start the delay of a new batch, or flush the batch if it is full or due."""
+        if self._due is None:
+            self._due = time.monotonic() + self._max_delay
+            if self.on_pending:
+                self.on_pending()
+        if len(self._pending) >= self._max_records or time.monotonic() >= self._due:
+            self.flush()
@@ -1,8 +1,8 @@
 """Composite log sink implementation (fan-out pattern)."""
 
-from typing import Any
+from typing import Any, Sequence
 
-from ...domain import LogSink, LogLevel
+from ...domain import LogSink, LogLevel, LogRecord
 
 
 class CompositeLogSink(LogSink):
@@ -40,6 +40,22 @@ class CompositeLogSink(LogSink):
                 # Continue to other sinks even if one fails
                 pass
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Emit several log messages to all sinks, one batch per sink.
+
+        Args:
+            records: Log records to emit
+        """
+        if self._closed:
+            return
+
+        for sink in self._sinks:
+            try:
+                sink.emit_batch(records)
+            except Exception:
+                # Continue to other sinks even if one fails
+                pass
+
     def close(self) -> None:
         """Close all underlying log sinks."""
         if self._closed:
@@ -1,9 +1,13 @@
 """Server-Sent Events (SSE) log sink implementation."""
 
 import json
-from typing import Any, Callable
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Sequence
 
-from ...domain import LogSink, LogLevel
+from ...domain import LogSink, LogLevel, LogRecord
+
+# Start of the JSON event for a plain message of each level
+_EVENT_PREFIXES = {level: f'data: {{"level": "{level.value}", "message": ' for level in LogLevel}
 
 
 class SSELogSink(LogSink):
@@ -34,20 +38,26 @@ class SSELogSink(LogSink):
         if self._closed:
             return
 
-        # Format as SSE event
-        event_data = {
-            "level": level.value,
-            "message": message,
-        }
+        try:
+            self._send_callback(self._format_event(level, message, metadata))
+        except Exception:
+            # Silently fail if callback raises (e.g., connection closed)
+            pass
 
-        if metadata:
-            event_data["metadata"] = metadata
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Emit several log messages as consecutive SSE events in one callback call.
 
-        # SSE format: data: <json>\n\n
-        sse_message = f"data: {json.dumps(event_data)}\n\n"
+        Args:
+            records: Log records to emit
+        """
+        if self._closed or not records:
+            return
 
+        events = "".join(
+            [self._format_event(r.level, r.message, r.metadata) for r in records]
+        )
         try:
-            self._send_callback(sse_message)
+            self._send_callback(events)
         except Exception:
             # Silently fail if callback raises (e.g., connection closed)
             pass
@@ -56,3 +66,22 @@ class SSELogSink(LogSink):
         """Close the log sink."""
         self._closed = True
 
+    @staticmethod
+    def _format_event(level: LogLevel, message: str, metadata: dict[str, str] | None) -> str:
+        """Format one log message as an SSE event.
+
+        Args:
+            level: Log severity level
+            message: Log message content
+            metadata: Optional metadata dictionary
+
+        Returns:
+            SSE event: ``data: <json>`` followed by a blank line
+        """
+        if metadata:
+            event_data = {"level": level.value, "message": message, "metadata": metadata}
+            return f"data: {json.dumps(event_data)}\n\n"
+        # Plain lines are the common case: skip building and encoding a dict,
+        # producing exactly what json.dumps would
+        return f"{_EVENT_PREFIXES[level]}{encode_basestring_ascii(message)}}}\n\n"
+
@@ -1,9 +1,9 @@
 """Stdout log sink implementation."""
 
 import sys
-from typing import Any
+from typing import Any, Sequence, TextIO
 
-from ...domain import LogSink, LogLevel
+from ...domain import LogSink, LogLevel, LogRecord
 
 
 class StdoutLogSink(LogSink):
@@ -26,16 +26,36 @@ class StdoutLogSink(LogSink):
             metadata: Optional metadata dictionary (not printed, but available for extension)
         """
         formatted_message = self._format_message(level, message, metadata)
+        print(formatted_message, file=self._stream_for(level))
 
-        if self._use_stderr_for_errors and level in (LogLevel.ERROR, LogLevel.CRITICAL):
-            print(formatted_message, file=sys.stderr)
-        else:
-            print(formatted_message, file=sys.stdout)
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Emit several log messages, writing each run of same-stream messages at once.
+
+        Args:
+            records: Log records to emit
+        """
+        stream: TextIO | None = None
+        pending: list[str] = []
+        for record in records:
+            target = self._stream_for(record.level)
+            if target is not stream:
+                if pending and stream is not None:
+                    stream.write("\n".join(pending) + "\n")
+                stream, pending = target, []
+            pending.append(self._format_message(record.level, record.message, record.metadata))
+        if pending and stream is not None:
+            stream.write("\n".join(pending) + "\n")
 
     def close(self) -> None:
         """Close the log sink (no-op for stdout)."""
         pass
 
+    def _stream_for(self, level: LogLevel) -> TextIO:
+        """Return the stream a message of the given level is written to."""
+        if self._use_stderr_for_errors and level in (LogLevel.ERROR, LogLevel.CRITICAL):
+            return sys.stderr
+        return sys.stdout
+
     def _format_message(self, level: LogLevel, message: str, metadata: dict[str, str] | None) -> str:
         """Format log message.
 
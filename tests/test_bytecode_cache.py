@@ -0,0 +1,39 @@
+"""Tests for BytecodeCache."""
+
+import os
+
+from src.infrastructure import BytecodeCache
+from src.infrastructure.executors.bytecode_main import load_code
+
+SCRIPT = "def main():\n    return 1\n"
+
+
+def test_hit_from_another_path_reports_its_own_filename(tmp_path):
+    cache = BytecodeCache(str(tmp_path / "cache"))
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text(SCRIPT)
+    second.write_text(SCRIPT)
+    cache.load(str(first))
+
+    code = cache.load(str(second))
+
+    assert cache.hits == 1
+    assert code.co_filename == str(second)
+    main = next(const for const in code.co_consts if hasattr(const, "co_filename"))
+    assert main.co_filename == str(second)
+
+
+def test_script_changed_after_lookup_is_not_cached(tmp_path):
+    cache = BytecodeCache(str(tmp_path / "cache"))
+    script = tmp_path / "job.py"
+    script.write_text(SCRIPT)
+    entry = cache.entry_for(str(script), "python3")
+    assert entry is not None
+
+    script.write_text("def main():\n    return 2\n")
+    namespace: dict = {}
+    exec(load_code(str(script), entry), namespace)
+
+    assert namespace["main"]() == 2
+    assert not os.path.exists(entry)
@@ -0,0 +1,47 @@
+"""Tests for the output capture buffers."""
+
+import os
+
+from src.infrastructure.executors.capture import SpillingOutputBuffer
+
+LINES = [f"line{i:02}" for i in range(20)]  # 7 characters each, with the newline
+
+
+def test_buffer_keeps_head_and_tail_and_spills_the_middle(tmp_path):
+    buffer = SpillingOutputBuffer(memory_budget_bytes=40, spill_directory=str(tmp_path))
+
+    for line in LINES:
+        buffer.append(line)
+
+    assert buffer.spilled
+    assert buffer.line_count == 20
+    assert list(buffer.iter_lines()) == LINES
+    assert buffer.tail(3) == LINES[-3:]
+    assert buffer.text() == "line00\nline01\n... [16 lines spilled to disk] ...\nline18\nline19"
+    spill = buffer.open_spill()
+    assert spill is not None
+    with spill:
+        assert spill.read().split() == LINES[2:18]
+
+
+def test_buffer_within_budget_never_touches_disk(tmp_path):
+    buffer = SpillingOutputBuffer(memory_budget_bytes=1000, spill_directory=str(tmp_path))
+
+    for line in LINES:
+        buffer.append(line)
+
+    assert not buffer.spilled
+    assert buffer.open_spill() is None
+    assert buffer.text() == "\n".join(LINES)
+    assert os.listdir(tmp_path) == []
+
+
+def test_close_deletes_the_spill_file(tmp_path):
+    buffer = SpillingOutputBuffer(memory_budget_bytes=40, spill_directory=str(tmp_path))
+    for line in LINES:
+        buffer.append(line)
+    assert len(os.listdir(tmp_path)) == 1
+
+    buffer.close()
+
+    assert os.listdir(tmp_path) == []
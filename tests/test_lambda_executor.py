@@ -0,0 +1,189 @@
+"""Tests for LambdaExecutor."""
+
+import asyncio
+import io
+import os
+import signal
+import sys
+import threading
+import time
+
+from src.domain import ExecutionStatus, ScriptConfig
+from src.infrastructure import CodeObjectCache, LambdaExecutor
+from src.infrastructure.executors.inprocess import (
+    RoutedEnviron,
+    RoutedStream,
+    invocation,
+    uninstall_routing,
+)
+
+HANDLER = """\
+import itertools
+
+calls = itertools.count()
+
+
+def handler(event, context):
+    return next(calls)
+"""
+
+
+def test_handler_module_stays_warm_without_code_cache(tmp_path):
+    script = tmp_path / "handler.py"
+    script.write_text(HANDLER)
+    config = ScriptConfig(script_path=str(script), metadata={"handler": "handler"})
+    executor = LambdaExecutor(code_cache=CodeObjectCache(0))
+
+    results = [executor.execute(config).metadata["handler_result"] for _ in range(3)]
+
+    assert results == [0, 1, 2]
+
+
+def test_handler_module_reloads_when_file_changes(tmp_path):
+    script = tmp_path / "handler.py"
+    script.write_text(HANDLER)
+    config = ScriptConfig(script_path=str(script), metadata={"handler": "handler"})
+    executor = LambdaExecutor()
+    executor.execute(config)
+
+    script.write_text(HANDLER + "# changed\n")
+    stat = script.stat()
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert executor.execute(config).metadata["handler_result"] == 0
+
+
+def test_forked_script_that_closes_its_output_still_times_out(tmp_path):
+    script = tmp_path / "closes.py"
+    script.write_text(
+        "import os\nprint('bye', flush=True)\nos.close(1)\nos.close(2)\nwhile True:\n    pass\n"
+    )
+    executor = LambdaExecutor(fork_per_invocation=True)
+
+    result = executor.execute(ScriptConfig(script_path=str(script), timeout_seconds=0.5))
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    assert result.stdout == "bye\n"
+
+
+def test_concurrent_scripts_see_their_own_environment_cwd_and_stdout(tmp_path):
+    script = tmp_path / "job.py"
+    script.write_text(
+        "import os, time\n"
+        "os.environ['SHARED'] = os.environ['JOB']\n"
+        "time.sleep(0.2)\n"
+        "print(os.environ['SHARED'], os.path.basename(os.getcwd()))\n"
+    )
+    names = [f"job{i}" for i in range(4)]
+    for name in names:
+        (tmp_path / name).mkdir()
+    executor = LambdaExecutor(max_workers=4)
+    results: dict[str, str] = {}
+
+    def run(name: str) -> None:
+        config = ScriptConfig(
+            script_path=str(script),
+            working_directory=str(tmp_path / name),
+            environment_variables={"JOB": name},
+        )
+        results[name] = executor.execute(config).stdout
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    executor.close()
+
+    assert results == {name: f"{name} {name}\n" for name in names}
+    assert "SHARED" not in os.environ
+
+
+def test_close_restores_real_streams_and_environment(tmp_path):
+    stdout, environ = sys.stdout, os.environ
+    script = tmp_path / "job.py"
+    script.write_text("print('hi')\n")
+    executor = LambdaExecutor(max_workers=2)
+    executor.execute(ScriptConfig(script_path=str(script), environment_variables={"A": "1"}))
+    assert isinstance(sys.stdout, RoutedStream)
+    assert isinstance(os.environ, RoutedEnviron)
+
+    executor.close()
+
+    assert sys.stdout is stdout
+    assert os.environ is environ
+
+
+def test_routing_stays_while_an_invocation_runs():
+    with invocation(io.StringIO(), io.StringIO()):
+        assert not uninstall_routing()
+        assert isinstance(sys.stdout, RoutedStream)
+
+    assert uninstall_routing()
+    assert not isinstance(sys.stdout, RoutedStream)
+
+
+async def test_async_output_streams_while_the_event_loop_stays_free(tmp_path):
+    script = tmp_path / "slow.py"
+    script.write_text("import time\nprint('first')\ntime.sleep(1)\nprint('second')\n")
+    executor = LambdaExecutor()
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    arrivals = {}
+    async for item in executor.execute_async(ScriptConfig(script_path=str(script))):
+        arrivals[item if isinstance(item, str) else "result"] = time.monotonic()
+    ticker.cancel()
+    executor.close()
+
+    assert arrivals["result"] - arrivals["first"] > 0.5
+    assert ticks >= 10
+
+
+LOOP = """\
+import os
+print('started', flush=True)
+os.environ['LEAKED'] = '1'
+while True:
+    try:
+        pass
+    except Exception:
+        pass
+"""
+
+
+def test_script_on_the_main_thread_times_out_and_state_is_restored(tmp_path):
+    script = tmp_path / "loop.py"
+    script.write_text(LOOP)
+    cwd = os.getcwd()
+    handler = signal.getsignal(signal.SIGALRM)
+    executor = LambdaExecutor(reset_state=True)
+
+    result = executor.execute(
+        ScriptConfig(script_path=str(script), working_directory=str(tmp_path), timeout_seconds=0.5)
+    )
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    assert result.stdout == "started\n"
+    assert os.getcwd() == cwd
+    assert "LEAKED" not in os.environ
+    assert signal.getsignal(signal.SIGALRM) is handler
+
+
+def test_script_on_a_worker_thread_times_out(tmp_path):
+    script = tmp_path / "loop.py"
+    script.write_text(LOOP)
+    executor = LambdaExecutor(max_workers=2)
+
+    result = executor.execute(ScriptConfig(script_path=str(script), timeout_seconds=0.5))
+    executor.close()
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    assert result.stdout == "started\n"
+    assert "LEAKED" not in os.environ
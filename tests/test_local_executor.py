@@ -0,0 +1,212 @@
+"""Tests for LocalSubprocessExecutor."""
+
+import os
+import sys
+import time
+
+import pytest
+
+from src.domain import BatchStats, ExecutionStatus, LogLevel, LogSink, ScriptConfig
+from src.infrastructure import LocalSubprocessExecutor
+from src.infrastructure.executors.streaming import SPLIT, TRUNCATE
+
+PRINT_ENV = "import os\nprint(os.environ.get('JOBFLOW_TEST_BASE', '-'))\n"
+
+
+class RecordingSink(LogSink):
+    """Sink that records when each message arrived."""
+
+    def __init__(self) -> None:
+        self.messages: list[tuple[float, LogLevel, str]] = []
+
+    def emit(self, level: LogLevel, message: str, metadata: dict[str, str] | None = None) -> None:
+        self.messages.append((time.monotonic(), level, message))
+
+    def close(self) -> None:
+        pass
+
+
+def process_running(pid: int) -> bool:
+    """Whether a process exists and has not exited (zombies count as exited)."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rpartition(")")[2].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def write_script(tmp_path, source: str) -> str:
+    script = tmp_path / "job.py"
+    script.write_text(source)
+    return str(script)
+
+
+def test_jobs_with_and_without_overrides_see_the_same_environment(tmp_path, monkeypatch):
+    script = tmp_path / "env.py"
+    script.write_text(PRINT_ENV)
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+    plain = ScriptConfig(script_path=str(script))
+    overriding = ScriptConfig(script_path=str(script), environment_variables={"OTHER": "1"})
+    executor.execute(overriding)  # Snapshot the environment
+
+    monkeypatch.setenv("JOBFLOW_TEST_BASE", "changed")
+
+    assert executor.execute(plain).stdout == "changed"
+    assert executor.execute(overriding).stdout == "changed"
+    monkeypatch.delenv("JOBFLOW_TEST_BASE")
+    assert executor.execute(overriding).stdout == "-"
+    assert "JOBFLOW_TEST_BASE" not in os.environ
+
+
+def test_output_reaches_the_log_sink_while_the_script_runs(tmp_path):
+    script = write_script(
+        tmp_path,
+        "import sys, time\n"
+        "print('first', flush=True)\n"
+        "print('warning', file=sys.stderr, flush=True)\n"
+        "time.sleep(1)\n"
+        "print('second')\n",
+    )
+    sink = RecordingSink()
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+
+    result = executor.execute(ScriptConfig(script_path=script), sink)
+    finished = time.monotonic()
+
+    arrived = {message: at for at, _, message in sink.messages}
+    assert finished - arrived["first"] > 0.5
+    assert finished - arrived["warning"] > 0.5
+    assert result.stdout == "first\nsecond"
+
+
+async def test_async_output_is_drained_concurrently_in_arrival_order(tmp_path):
+    script = write_script(
+        tmp_path,
+        "import sys, time\n"
+        "for i in range(20000):\n"
+        "    print('noise', file=sys.stderr)\n"
+        "sys.stderr.flush()\n"
+        "for i in range(3):\n"
+        "    print(f'out{i}', flush=True)\n"
+        "    time.sleep(0.05)\n"
+        "    print(f'err{i}', file=sys.stderr, flush=True)\n"
+        "    time.sleep(0.05)\n",
+    )
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+
+    items = [
+        item
+        async for item in executor.execute_async(
+            ScriptConfig(script_path=script, timeout_seconds=10)
+        )
+    ]
+
+    lines = [item for item in items if isinstance(item, str) and item != "noise"]
+    assert lines == ["out0", "err0", "out1", "err1", "out2", "err2"]
+    assert items[-1].status == ExecutionStatus.SUCCESS
+
+
+def test_timeout_kills_the_whole_process_group(tmp_path):
+    script = write_script(
+        tmp_path,
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        "print(child.pid, flush=True)\n"
+        "time.sleep(60)\n",
+    )
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+
+    result = executor.execute(ScriptConfig(script_path=script, timeout_seconds=1))
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    grandchild = int(result.stdout)
+    deadline = time.monotonic() + 5
+    while process_running(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not process_running(grandchild)
+
+
+def test_script_ignoring_sigterm_is_killed_after_the_grace_period(tmp_path):
+    script = write_script(
+        tmp_path,
+        "import signal, time\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "print('ready', flush=True)\n"
+        "while True:\n"
+        "    time.sleep(0.01)\n",
+    )
+    executor = LocalSubprocessExecutor(python_executable=sys.executable, kill_grace_seconds=0.5)
+
+    started = time.monotonic()
+    result = executor.execute(ScriptConfig(script_path=script, timeout_seconds=0.5))
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    assert result.stdout == "ready"
+    assert time.monotonic() - started < 5
+
+
+def test_large_output_is_spilled_and_still_readable(tmp_path):
+    script = write_script(tmp_path, "for i in range(1000):\n    print(f'line{i}')\n")
+    executor = LocalSubprocessExecutor(
+        python_executable=sys.executable,
+        output_memory_budget_bytes=1000,
+        spill_directory=str(tmp_path),
+    )
+
+    result = executor.execute(ScriptConfig(script_path=script))
+
+    assert "lines spilled to disk" in result.stdout
+    assert len(result.stdout) < 2000
+    assert list(result.iter_lines()) == [f"line{i}" for i in range(1000)]
+    assert result.tail(2) == ["line998", "line999"]
+
+
+@pytest.mark.parametrize(
+    "long_lines, expected",
+    [(SPLIT, ["x" * 100_000, "x" * 50_000, "end"]), (TRUNCATE, ["x" * 100_000, "end"])],
+)
+async def test_lines_longer_than_the_limit(tmp_path, long_lines, expected):
+    script = write_script(tmp_path, "print('x' * 150_000)\nprint('end')\n")
+    executor = LocalSubprocessExecutor(
+        python_executable=sys.executable, max_line_length=100_000, long_lines=long_lines
+    )
+    config = ScriptConfig(script_path=script)
+
+    streamed = [item async for item in executor.execute_async(config) if isinstance(item, str)]
+    result = executor.execute(config)
+
+    assert streamed == expected
+    assert list(result.iter_lines()) == expected
+
+
+async def test_execute_many_runs_jobs_in_parallel_and_reports_stats(tmp_path):
+    script = write_script(
+        tmp_path, "import os, sys, time\ntime.sleep(0.3)\nsys.exit(os.environ['JOB'] == '5')\n"
+    )
+    pulled = []
+
+    def configs():
+        for i in range(6):
+            pulled.append(i)
+            yield ScriptConfig(
+                script_path=script, environment_variables={"JOB": str(i)}, metadata={"job": i}
+            )
+
+    executor = LocalSubprocessExecutor(python_executable=sys.executable)
+    seen_when_first_done = None
+    results = []
+    stats = None
+
+    async for item in executor.execute_many(configs(), max_parallel=3):
+        if isinstance(item, BatchStats):
+            stats = item
+        else:
+            if seen_when_first_done is None:
+                seen_when_first_done = len(pulled)
+            results.append(item)
+
+    assert seen_when_first_done == 3
+    assert sorted(result.metadata["job"] for result in results) == list(range(6))
+    assert stats is not None
+    assert (stats.submitted, stats.succeeded, stats.failed, stats.max_parallel) == (6, 5, 1, 3)
+    assert stats.wall_seconds < stats.job_seconds
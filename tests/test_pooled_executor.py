@@ -0,0 +1,69 @@
+"""Tests for PooledInProcessExecutor."""
+
+import os
+
+import pytest
+
+from src.domain import BatchStats, ExecutionStatus, ScriptConfig
+from src.infrastructure import PooledInProcessExecutor
+
+PRINT_PID = "import os, time\ntime.sleep(0.1)\nprint(os.getpid())\n"
+
+
+@pytest.fixture
+def script(tmp_path):
+    script = tmp_path / "pid.py"
+    script.write_text(PRINT_PID)
+    return ScriptConfig(script_path=str(script))
+
+
+def test_scripts_run_in_worker_processes(script):
+    executor = PooledInProcessExecutor(size=1)
+
+    first = executor.execute(script)
+    second = executor.execute(script)
+    executor.close()
+
+    assert first.status == ExecutionStatus.SUCCESS
+    assert first.stdout == second.stdout
+    assert int(first.stdout) != os.getpid()
+
+
+def test_workers_are_recycled_after_max_jobs(script):
+    executor = PooledInProcessExecutor(size=1, max_jobs_per_worker=2)
+
+    pids = [executor.execute(script).stdout for _ in range(4)]
+    executor.close()
+
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+
+async def test_batch_never_uses_more_than_size_workers(script):
+    executor = PooledInProcessExecutor(size=2)
+    pids = set()
+    stats = None
+
+    async for item in executor.execute_many([script] * 8, max_parallel=8):
+        if isinstance(item, BatchStats):
+            stats = item
+        else:
+            pids.add(item.stdout)
+    executor.close()
+
+    assert len(pids) == 2
+    assert stats is not None
+    assert (stats.succeeded, stats.max_parallel) == (8, 2)
+
+
+def test_timed_out_job_does_not_break_the_pool(tmp_path, script):
+    loop = tmp_path / "loop.py"
+    loop.write_text("print('started', flush=True)\nwhile True:\n    pass\n")
+    executor = PooledInProcessExecutor(size=1)
+
+    timed_out = executor.execute(ScriptConfig(script_path=str(loop), timeout_seconds=0.5))
+    after = executor.execute(script)
+    executor.close()
+
+    assert timed_out.status == ExecutionStatus.TIMEOUT
+    assert timed_out.stdout.startswith("started")
+    assert after.status == ExecutionStatus.SUCCESS
@@ -0,0 +1,28 @@
+"""Tests for output decoding and merging."""
+
+from src.infrastructure.executors.streaming import SPLIT, TRUNCATE, LineDecoder
+
+
+def test_decoder_splits_long_lines():
+    decoder = LineDecoder(max_line_length=4, long_lines=SPLIT)
+
+    lines = decoder.feed(b"abcdefghij\nxy\n")
+
+    assert lines == ["abcd", "efgh", "ij", "xy"]
+
+
+def test_decoder_truncates_long_lines():
+    decoder = LineDecoder(max_line_length=4, long_lines=TRUNCATE)
+
+    lines = decoder.feed(b"abcdef") + decoder.feed(b"ghij\nxy\n")
+
+    assert lines == ["abcd", "xy"]
+
+
+def test_decoder_joins_characters_split_across_reads():
+    decoder = LineDecoder()
+    data = "héllo\n".encode()
+
+    lines = [line for byte in data for line in decoder.feed(bytes([byte]))]
+
+    assert lines == ["héllo"]
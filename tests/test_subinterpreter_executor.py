@@ -0,0 +1,154 @@
+"""Tests for SubinterpreterExecutor on the running Python."""
+
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain import ExecutionStatus, ScriptConfig, ScriptExecutionException
+from src.infrastructure import SubinterpreterExecutor
+from src.infrastructure.executors.subinterpreter import _SubinterpreterAPI
+
+needs_subinterpreters = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="subinterpreters with their own GIL need Python 3.12+"
+)
+
+
+@pytest.fixture
+def executor():
+    executor = SubinterpreterExecutor(max_workers=1)
+    yield executor
+    executor.close()
+
+
+@needs_subinterpreters
+def test_runs_script_and_captures_output(executor, tmp_path):
+    script = tmp_path / "job.py"
+    script.write_text("import sys\nprint('hello')\nprint('oops', file=sys.stderr)\n")
+
+    result = executor.execute(ScriptConfig(script_path=str(script)))
+
+    assert result.status == ExecutionStatus.SUCCESS
+    assert result.exit_code == 0
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+
+
+@needs_subinterpreters
+def test_reused_interpreter_starts_clean(executor, tmp_path):
+    first = tmp_path / "first.py"
+    first.write_text("leaked = 1\n")
+    second = tmp_path / "second.py"
+    second.write_text("print('leaked' in globals())\n")
+
+    executor.execute(ScriptConfig(script_path=str(first)))
+    result = executor.execute(ScriptConfig(script_path=str(second)))
+
+    assert result.stdout == "False\n"
+
+
+@needs_subinterpreters
+def test_exit_code_and_exception(executor, tmp_path):
+    exits = tmp_path / "exits.py"
+    exits.write_text("raise SystemExit(3)\n")
+    raises = tmp_path / "raises.py"
+    raises.write_text("raise ValueError('boom')\n")
+
+    exited = executor.execute(ScriptConfig(script_path=str(exits)))
+    failed = executor.execute(ScriptConfig(script_path=str(raises)))
+
+    assert (exited.status, exited.exit_code) == (ExecutionStatus.FAILED, 3)
+    assert (failed.status, failed.exit_code) == (ExecutionStatus.FAILED, 1)
+    assert "ValueError: boom" in failed.stderr
+
+
+@needs_subinterpreters
+def test_environment_variables(executor, tmp_path):
+    script = tmp_path / "env.py"
+    script.write_text("import os\nprint(os.environ['JOBFLOW_TEST'])\n")
+
+    result = executor.execute(
+        ScriptConfig(script_path=str(script), environment_variables={"JOBFLOW_TEST": "value"})
+    )
+
+    assert result.stdout == "value\n"
+
+
+@needs_subinterpreters
+def test_rejects_timeouts(executor, tmp_path):
+    script = tmp_path / "job.py"
+    script.write_text("print('never')\n")
+
+    with pytest.raises(ScriptExecutionException, match="timeout_seconds"):
+        executor.execute(ScriptConfig(script_path=str(script), timeout_seconds=1))
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason="only older Pythons lack support")
+def test_requires_python_312():
+    with pytest.raises(RuntimeError):
+        SubinterpreterExecutor()
+
+
+class _StrictModule:
+    """Stand-in for ``_interpreters`` as of 3.13.5, which rejects ``shared=None``."""
+
+    def __init__(self, failure=None):
+        self.failure = failure
+        self.calls = []
+
+    def run_string(self, interpreter, source, shared):
+        if not isinstance(shared, dict):
+            raise TypeError("expected 'shared' to be a dict")
+        self.calls.append(shared)
+        return self.failure
+
+
+def test_api_passes_a_dict_for_missing_shared_values():
+    module = _StrictModule()
+
+    _SubinterpreterAPI(module).run_string(object(), "x = 1")
+
+    assert module.calls == [{}]
+
+
+def test_api_raises_returned_failures():
+    module = _StrictModule(failure=SimpleNamespace(formatted="ValueError: boom"))
+
+    with pytest.raises(ScriptExecutionException, match="ValueError: boom"):
+        _SubinterpreterAPI(module).run_string(object(), "raise ValueError('boom')")
+
+
+def test_api_translates_run_failed_error():
+    class RunFailedError(RuntimeError):
+        pass
+
+    def run_string(interpreter, source, shared):
+        raise RunFailedError("ValueError: boom")
+
+    module = SimpleNamespace(RunFailedError=RunFailedError, run_string=run_string)
+
+    with pytest.raises(ScriptExecutionException, match="ValueError: boom"):
+        _SubinterpreterAPI(module).run_string(object(), "raise ValueError('boom')")
+
+
+@needs_subinterpreters
+async def test_output_streams_while_script_runs(executor, tmp_path):
+    script = tmp_path / "slow.py"
+    script.write_text(
+        "import sys, time\nprint('first')\nprint('second', file=sys.stderr)\ntime.sleep(1)\n"
+        "print('last', end='')\n"
+    )
+
+    start = time.monotonic()
+    arrivals = []
+    async for item in executor.execute_async(ScriptConfig(script_path=str(script))):
+        if isinstance(item, str):
+            arrivals.append((item, time.monotonic() - start))
+        else:
+            result = item
+
+    assert [line for line, _ in arrivals] == ["first", "second", "last"]
+    assert arrivals[0][1] < 0.5  # before the script finished
+    assert result.stdout == "first\nlast\n"
+    assert result.stderr == "second\n"